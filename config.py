@@ -1,19 +1,108 @@
 """
 Configuration settings for Chicago Event Monitor - Simplified.
 
-Simple config loading, no classes needed.
+Simple config loading, no classes needed (just one frozen settings record).
+
+How it works:
+1. The first call to get_settings() reads the .env file (once per process)
+2. Resolved values are stored in a frozen (read-only) Settings record
+3. Every later call returns the SAME cached record - no re-parsing .env
+
+Any module that needs an API key or email address should do:
+    from config import get_settings
+    settings = get_settings()
+    settings.SENDGRID_API_KEY
 """
 
 import os
-from dotenv import load_dotenv
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Read-only snapshot of the environment variables we care about.
+
+    frozen=True means nobody can accidentally change a value after it is
+    loaded (e.g. settings.RECIPIENT_EMAIL = 'x' raises an error).
+    """
+    # Email settings (SendGrid - legacy)
+    SENDGRID_API_KEY: str
+    SENDER_EMAIL: str
+    RECIPIENT_EMAIL: str
+    RECIPIENT_EMAILS: str  # Optional comma-separated list (overrides RECIPIENT_EMAIL)
+
+    # Email settings (Gmail SMTP - primary)
+    GMAIL_ADDRESS: str
+    GMAIL_APP_PASSWORD: str
+    GMAIL_RATE_PER_MIN: str  # Optional: max emails per minute (default 30)
+    GMAIL_BURST: str  # Optional: emails allowed back-to-back (default 10)
+
+    # Optional API keys (system works without these)
+    AVIATIONSTACK_API_KEY: str
+    TICKETMASTER_API_KEY: str
+
+    # Logging settings
+    LOG_LEVEL: str
+
+
+# The variables a normal run can't do without (Gmail sending). If all of
+# these are already in the environment, .env is not read at all - so an
+# environment that injects them should inject any optional ones it wants
+# (API keys, rate limits) as well.
+_REQUIRED_VARS = ('GMAIL_ADDRESS', 'GMAIL_APP_PASSWORD', 'RECIPIENT_EMAIL')
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Load settings from .env + environment, ONCE per process.
+
+    Detailed explanation:
+    1. If the required variables (_REQUIRED_VARS) are ALREADY in os.environ
+       (e.g. injected by the LaunchAgent/cron job or CI), we skip .env
+       entirely - no file search, no parsing, and python-dotenv doesn't
+       even need to be installed
+    2. Otherwise load_dotenv() copies values from the .env file into os.environ
+    3. We read each value we need into a Settings record
+    4. @lru_cache(maxsize=1) remembers the result, so the second, third, ...
+       call skips steps 1-3 entirely (no file open, no parsing)
+
+    Returns:
+        Settings: Frozen record of resolved configuration values.
+                  Missing values are empty strings ('').
+
+    Example:
+        settings = get_settings()
+        if not settings.SENDGRID_API_KEY:
+            print("SendGrid not configured")
+    """
+    # Only touch .env when the environment is missing a required variable
+    # (all() stops at the first missing name, so this check is cheap)
+    if not all(name in os.environ for name in _REQUIRED_VARS):
+        from dotenv import load_dotenv  # Imported here - only needed for .env files
+        load_dotenv()
+
+    return Settings(
+        SENDGRID_API_KEY=os.environ.get('SENDGRID_API_KEY', ''),
+        SENDER_EMAIL=os.environ.get('SENDER_EMAIL', ''),
+        RECIPIENT_EMAIL=os.environ.get('RECIPIENT_EMAIL', ''),
+        RECIPIENT_EMAILS=os.environ.get('RECIPIENT_EMAILS', ''),
+        GMAIL_ADDRESS=os.environ.get('GMAIL_ADDRESS', ''),
+        GMAIL_APP_PASSWORD=os.environ.get('GMAIL_APP_PASSWORD', ''),
+        GMAIL_RATE_PER_MIN=os.environ.get('GMAIL_RATE_PER_MIN', ''),
+        GMAIL_BURST=os.environ.get('GMAIL_BURST', ''),
+        AVIATIONSTACK_API_KEY=os.environ.get('AVIATIONSTACK_API_KEY', ''),
+        TICKETMASTER_API_KEY=os.environ.get('TICKETMASTER_API_KEY', ''),
+        LOG_LEVEL=os.environ.get('LOG_LEVEL', 'INFO'),
+    )
 
-# Load environment variables from .env file
-load_dotenv()
 
-# Email settings
-SENDGRID_API_KEY = os.getenv('SENDGRID_API_KEY', '')
-SENDER_EMAIL = os.getenv('SENDER_EMAIL', '')
-RECIPIENT_EMAIL = os.getenv('RECIPIENT_EMAIL', '')
+# Email settings (kept as module constants for older import sites)
+SENDGRID_API_KEY = get_settings().SENDGRID_API_KEY
+SENDER_EMAIL = get_settings().SENDER_EMAIL
+RECIPIENT_EMAIL = get_settings().RECIPIENT_EMAIL
 
 # Storage settings
 DATA_FILE = "data/events.json"
@@ -24,4 +113,4 @@ REQUEST_TIMEOUT = 10  # seconds
 USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
 
 # Logging settings
-LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+LOG_LEVEL = get_settings().LOG_LEVEL
@@ -7,13 +7,10 @@ This script helps diagnose SendGrid issues by:
 3. Sending a test email with detailed error reporting
 """
 
-import os
 import sys
-from dotenv import load_dotenv
 from sendgrid import SendGridAPIClient
 from sendgrid.helpers.mail import Mail
-
-load_dotenv()
+from config import get_settings
 
 print("="*60)
 print("SendGrid Debug Script")
@@ -21,32 +18,31 @@ print("="*60)
 
 # Check environment variables
 print("\n1. Checking environment variables...")
-SENDGRID_API_KEY = os.getenv('SENDGRID_API_KEY')
-SENDER_EMAIL = os.getenv('SENDER_EMAIL')
-RECIPIENT_EMAIL = os.getenv('RECIPIENT_EMAIL')
+# Single source of truth: config.get_settings() (parses .env once, cached)
+settings = get_settings()
 
-if not SENDGRID_API_KEY:
+if not settings.SENDGRID_API_KEY:
     print("❌ SENDGRID_API_KEY not found in .env")
     sys.exit(1)
 else:
-    print(f"✅ SENDGRID_API_KEY found (starts with: {SENDGRID_API_KEY[:10]}...)")
+    print(f"✅ SENDGRID_API_KEY found (starts with: {settings.SENDGRID_API_KEY[:10]}...)")
 
-if not SENDER_EMAIL:
+if not settings.SENDER_EMAIL:
     print("❌ SENDER_EMAIL not found in .env")
     sys.exit(1)
 else:
-    print(f"✅ SENDER_EMAIL: {SENDER_EMAIL}")
+    print(f"✅ SENDER_EMAIL: {settings.SENDER_EMAIL}")
 
-if not RECIPIENT_EMAIL:
+if not settings.RECIPIENT_EMAIL:
     print("❌ RECIPIENT_EMAIL not found in .env")
     sys.exit(1)
 else:
-    print(f"✅ RECIPIENT_EMAIL: {RECIPIENT_EMAIL}")
+    print(f"✅ RECIPIENT_EMAIL: {settings.RECIPIENT_EMAIL}")
 
 # Test SendGrid API connection
 print("\n2. Testing SendGrid API connection...")
 try:
-    sg = SendGridAPIClient(SENDGRID_API_KEY)
+    sg = SendGridAPIClient(settings.SENDGRID_API_KEY)
     print("✅ SendGrid client initialized")
 except Exception as e:
     print(f"❌ Failed to initialize SendGrid: {e}")
@@ -56,8 +52,8 @@ except Exception as e:
 print("\n3. Sending test email...")
 try:
     message = Mail(
-        from_email=SENDER_EMAIL,
-        to_emails=RECIPIENT_EMAIL,
+        from_email=settings.SENDER_EMAIL,
+        to_emails=settings.RECIPIENT_EMAIL,
         subject='🚕 TEST: SendGrid Debug Email',
         html_content='''
         <html>
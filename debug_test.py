@@ -11,24 +11,45 @@ Run manually or via cron for debugging email issues.
 """
 
 import logging
+import queue
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
+from config import LOG_LEVEL
 from storage import load_events, save_events, find_new_events
 from scrapers.mccormick import scrape_mccormick_place
 from scrapers.ohare import scrape_ohare_flights
-from email_notifier_gmail import send_combined_email
+from scrapers._http import get_session
+
+# Set up logging (level comes from LOG_LEVEL in .env - use DEBUG for everything)
+#
+# How it works:
+# 1. Our code only drops each log record into an in-memory queue (fast)
+# 2. A QueueListener thread pulls records off the queue and writes them to
+#    the log file AND the screen
+# So the main workflow never waits on disk writes.
+log_queue = queue.Queue(-1)  # -1 = no size limit
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+file_handler = logging.FileHandler('/Users/ryad/chicago-event-monitor/logs/debug_test.log')
+file_handler.setFormatter(log_formatter)
+stream_handler = logging.StreamHandler(sys.stdout)
+stream_handler.setFormatter(log_formatter)
+
+log_listener = QueueListener(log_queue, file_handler, stream_handler)
 
-# Set up VERY verbose logging
 logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('/Users/ryad/chicago-event-monitor/logs/debug_test.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    level=getattr(logging, LOG_LEVEL.upper(), logging.INFO),
+    handlers=[QueueHandler(log_queue)]
 )
 
 logger = logging.getLogger(__name__)
 
+# NOTE: log calls below use %s placeholders, e.g.
+#     logger.debug("First event: %s", scraped[0])
+# instead of f-strings. logging only builds the message if the level is
+# enabled, so a big event dict is never turned into text when DEBUG is off.
+
 def main():
     """
     Debug test workflow with forced email send.
@@ -44,22 +65,37 @@ def main():
     logger.info("\n📂 STEP 1: Loading stored events from JSON...")
     try:
         stored = load_events()
-        logger.info(f"✅ Loaded {len(stored.get('mccormick_place', []))} McCormick Place events from storage")
+        logger.info("✅ Loaded %s McCormick Place events from storage", len(stored.get('mccormick_place', [])))
     except Exception as e:
-        logger.error(f"❌ Failed to load events: {e}")
+        logger.error("❌ Failed to load events: %s", e)
         stored = {}
 
     # ============================================================
     # STEP 2: Scrape McCormick Place
     # ============================================================
     logger.info("\n🏢 STEP 2: Scraping McCormick Place events...")
+
+    # The same shared session the production scrapers use (browser
+    # User-Agent, connection pooling, automatic retries), so this debug
+    # run exercises the real HTTP path
+    session = get_session()
+
+    # Start BOTH network calls now, in two background threads
+    # McCormick and O'Hare don't depend on each other, and each one spends
+    # most of its time waiting on the network - so waiting for both at
+    # the same time roughly halves the total wait.
+    # (They hit different hosts, so they use separate connection pools.)
+    executor = ThreadPoolExecutor(max_workers=2)
+    mccormick_future = executor.submit(scrape_mccormick_place, session=session)
+    ohare_future = executor.submit(scrape_ohare_flights, session=session)
+
     try:
-        scraped = scrape_mccormick_place()
-        logger.info(f"✅ Scraped {len(scraped)} total events from McCormick Place API")
+        scraped = mccormick_future.result()  # Wait for McCormick to finish
+        logger.info("✅ Scraped %s total events from McCormick Place API", len(scraped))
         if scraped:
-            logger.debug(f"First event: {scraped[0]}")
+            logger.debug("First event: %s", scraped[0])
     except Exception as e:
-        logger.error(f"❌ Failed to scrape: {e}")
+        logger.error("❌ Failed to scrape: %s", e)
         scraped = []
 
     # ============================================================
@@ -67,17 +103,25 @@ def main():
     # ============================================================
     logger.info("\n🆕 STEP 3: Comparing scraped vs stored events...")
     try:
+        # Drop duplicate events from the API before comparing
+        # A dict keyed on (event_name, start_date) keeps the first copy and
+        # preserves the original order - one O(N) pass
+        before_dedup = len(scraped)
+        scraped = list({(e['event_name'], e['start_date']): e for e in scraped}.values())
+        if len(scraped) < before_dedup:
+            logger.info("   Removed %s duplicate events", before_dedup - len(scraped))
+
         new_events = find_new_events(scraped, stored.get('mccormick_place', []))
-        logger.info(f"✅ Found {len(new_events)} NEW events")
+        logger.info("✅ Found %s NEW events", len(new_events))
         if new_events:
             for i, event in enumerate(new_events[:5], 1):
-                logger.info(f"   {i}. {event['event_name']} ({event['start_date']})")
+                logger.info("   %s. %s (%s)", i, event['event_name'], event['start_date'])
             if len(new_events) > 5:
-                logger.info(f"   ... and {len(new_events) - 5} more")
+                logger.info("   ... and %s more", len(new_events) - 5)
         else:
             logger.info("   No new events found")
     except Exception as e:
-        logger.error(f"❌ Failed to find new events: {e}")
+        logger.error("❌ Failed to find new events: %s", e)
         new_events = []
 
     # ============================================================
@@ -85,18 +129,22 @@ def main():
     # ============================================================
     logger.info("\n✈️  STEP 4: Checking O'Hare flight status...")
     try:
-        ohare_data = scrape_ohare_flights()
+        ohare_data = ohare_future.result()  # Started back in STEP 2
         if ohare_data:
-            logger.info(f"✅ O'Hare data retrieved:")
-            logger.info(f"   Taxi Demand: {ohare_data.get('taxi_demand', 'UNKNOWN')}")
-            logger.info(f"   Delayed: {ohare_data.get('delayed_flights', 0)} flights")
-            logger.info(f"   Cancelled: {ohare_data.get('cancelled_flights', 0)} flights")
-            logger.info(f"   Summary: {ohare_data.get('summary', 'N/A')}")
+            logger.info("✅ O'Hare data retrieved:")
+            logger.info("   Taxi Demand: %s", ohare_data.get('taxi_demand', 'UNKNOWN'))
+            logger.info("   Delayed: %s flights", ohare_data.get('delayed_flights', 0))
+            logger.info("   Cancelled: %s flights", ohare_data.get('cancelled_flights', 0))
+            logger.info("   Summary: %s", ohare_data.get('summary', 'N/A'))
         else:
             logger.info("   O'Hare monitoring not configured (no API key)")
     except Exception as e:
-        logger.error(f"❌ Failed to check O'Hare: {e}")
+        logger.error("❌ Failed to check O'Hare: %s", e)
         ohare_data = None
+    finally:
+        # Done with HTTP calls - stop the threads
+        # (the shared session stays open, as in production)
+        executor.shutdown()
 
     # ============================================================
     # STEP 5: FORCE SEND EMAIL (even if no new events)
@@ -108,8 +156,8 @@ def main():
     has_events = len(new_events) > 0
     has_ohare = ohare_data is not None and len(ohare_data) > 0
 
-    logger.info(f"   Has new events: {has_events} ({len(new_events)} events)")
-    logger.info(f"   Has O'Hare data: {has_ohare}")
+    logger.info("   Has new events: %s (%s events)", has_events, len(new_events))
+    logger.info("   Has O'Hare data: %s", has_ohare)
 
     # For debugging, create a test event if we have nothing to send
     if not has_events and not has_ohare:
@@ -127,6 +175,10 @@ def main():
     if has_events or has_ohare:
         logger.info("   Calling send_combined_email()...")
         try:
+            # Imported here so debug runs that fail in earlier steps
+            # don't pay the email module's import cost
+            from email_notifier_gmail import send_combined_email
+
             success = send_combined_email(new_events, ohare_data, "McCormick Place")
             if success:
                 logger.info("✅ EMAIL SENT SUCCESSFULLY!")
@@ -135,7 +187,7 @@ def main():
                 logger.error("❌ EMAIL FAILED TO SEND")
                 logger.error("   Check the logs above for SMTP errors")
         except Exception as e:
-            logger.error(f"❌ Exception while sending email: {e}", exc_info=True)
+            logger.error("❌ Exception while sending email: %s", e, exc_info=True)
     else:
         logger.info("   Skipping email (nothing to send)")
 
@@ -149,7 +201,7 @@ def main():
             save_events(stored)
             logger.info("✅ Storage updated successfully")
         except Exception as e:
-            logger.error(f"❌ Failed to update storage: {e}")
+            logger.error("❌ Failed to update storage: %s", e)
     else:
         logger.info("\n💾 STEP 6: Skipping storage update (no events scraped)")
 
@@ -158,15 +210,20 @@ def main():
     # ============================================================
     logger.info("\n" + "="*80)
     logger.info("📊 DEBUG TEST SUMMARY:")
-    logger.info(f"   Total McCormick events scraped: {len(scraped)}")
-    logger.info(f"   New events found: {len(new_events)}")
+    logger.info("   Total McCormick events scraped: %s", len(scraped))
+    logger.info("   New events found: %s", len(new_events))
     if ohare_data:
-        logger.info(f"   O'Hare status: {ohare_data.get('taxi_demand', 'N/A')}")
+        logger.info("   O'Hare status: %s", ohare_data.get('taxi_demand', 'N/A'))
     else:
-        logger.info(f"   O'Hare status: Not configured")
+        logger.info("   O'Hare status: Not configured")
     logger.info("="*80)
     logger.info("🔍 DEBUG TEST COMPLETED - Check debug_test.log for full details")
     logger.info("="*80)
 
 if __name__ == "__main__":
-    main()
+    log_listener.start()
+    try:
+        main()
+    finally:
+        # Flush every queued record to the file/screen before exiting
+        log_listener.stop()
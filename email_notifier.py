@@ -1,33 +1,168 @@
 """
-Email notification system using SendGrid.
+Email notification system using SendGrid (v3 REST API).
 
 Sends formatted emails about new Chicago events.
 """
 
-import os
 import logging
-from datetime import datetime
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail
-from dotenv import load_dotenv
-
-load_dotenv()
+import requests
+from datetime import date, datetime
+from functools import lru_cache
+from html import escape
+from string import Template
+from config import get_settings, REQUEST_TIMEOUT
+from utils.json_io import dumps  # orjson when installed, else json
 
 logger = logging.getLogger(__name__)
 
-# Load config from environment
-SENDGRID_API_KEY = os.getenv('SENDGRID_API_KEY')
-SENDER_EMAIL = os.getenv('SENDER_EMAIL')
-RECIPIENT_EMAIL = os.getenv('RECIPIENT_EMAIL')
+# SendGrid v3 REST endpoint (same API the sendgrid SDK calls under the hood)
+SENDGRID_API_URL = "https://api.sendgrid.com/v3/mail/send"
+
+# Most events listed in one email - the rest become "... and N more"
+# Keeps the email (and the upload to SendGrid) a sane size even if the
+# scraper suddenly returns hundreds of "new" events
+MAX_EVENTS_PER_EMAIL = 50
+
+# Month abbreviations for fast date formatting (index 0 = January)
+# Same output as strftime('%b') in an English locale, without the locale lookup
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+           'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# Full month names, same as strftime('%B') (for the "Last checked" footer)
+_MONTH_NAMES = ('January', 'February', 'March', 'April', 'May', 'June',
+                'July', 'August', 'September', 'October', 'November', 'December')
+
+
+# Static HTML templates for the email (compiled ONCE when the module loads)
+# string.Template uses $placeholders; at send time we only swap in the
+# dynamic values instead of rebuilding these big literals on every call.
+_EMAIL_HEADER = Template("""
+    <html>
+    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+        <h2 style="color: #2c3e50;">Hi Ryad,</h2>
+        <p>Found <strong>$event_count</strong> new event$plural at <strong>$venue_name</strong>:</p>
+        <hr style="border: 1px solid #eee;">
+    """)
+
+# Inline CSS for each event card (static - defined once, never rebuilt)
+_STYLE_EVENT = "margin-bottom: 25px; padding: 15px; background-color: #f8f9fa; border-left: 4px solid #3498db;"
 
+_EVENT_CARD = Template("""
+        <div style="$style">
+            <h3 style="margin-top: 0; color: #2c3e50;">$i. $event_name</h3>
+            <p style="margin: 5px 0;">
+                <strong>📅 Dates:</strong> $date_range<br>
+                <strong>📍 Location:</strong> $location<br>
+                <strong>🔗 Details:</strong> <a href="$url" style="color: #3498db;">View Event</a>
+            </p>
+        </div>
+        """)
+
+_MORE_EVENTS = Template("""
+        <p style="color: #7f8c8d;"><em>... and $extra_count more new event$plural not shown.</em></p>
+        """)
+
+_EMAIL_FOOTER = Template("""
+        <hr style="border: 1px solid #eee; margin-top: 30px;">
+        <p style="color: #7f8c8d; font-size: 0.9em;">
+            <strong>Your Chicago Event Monitor</strong><br>
+            Last checked: $timestamp
+        </p>
+    </body>
+    </html>
+    """)
 
-def send_new_events_email(new_events: list, venue_name: str = "McCormick Place") -> bool:
+
+@lru_cache(maxsize=512)
+def _fmt_date(date_str: str) -> str:
+    """
+    Turn an ISO date string into a friendly display date.
+
+    Why not datetime.strptime()? strptime is slow (it builds a regex for
+    the format every call). Our dates almost always look like YYYY-MM-DD,
+    which date.fromisoformat() reads in C - and it still rejects
+    impossible dates like 2025-02-30. Anything else (rare, e.g. 2026-2-7)
+    goes through strptime as before. Results are cached with lru_cache
+    because the same dates show up again and again (multi-day events,
+    re-runs).
+
+    Args:
+        date_str (str): Date in YYYY-MM-DD format
+
+    Returns:
+        str: Formatted date, e.g. "Feb 07, 2026"
+
+    Raises:
+        ValueError: If date_str is not a valid YYYY-MM-DD date (e.g. 'TBD')
+
+    Example:
+        _fmt_date('2026-02-07')
+        # Returns: 'Feb 07, 2026'
+    """
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        parsed = date.fromisoformat(date_str)
+    else:
+        parsed = datetime.strptime(date_str, '%Y-%m-%d').date()
+
+    return f"{_MONTHS[parsed.month - 1]} {parsed.day:02d}, {parsed.year}"
+
+
+def _fmt_timestamp(now: datetime) -> str:
+    """
+    Format the "Last checked" timestamp without strftime.
+
+    strftime goes through the C library's locale machinery; building the
+    string ourselves from the datetime's fields is much cheaper and gives
+    exactly the same text as strftime("%B %d, %Y at %I:%M %p").
+
+    Args:
+        now (datetime): The moment to format
+
+    Returns:
+        str: e.g. "December 06, 2025 at 04:00 AM"
+    """
+    hour12 = now.hour % 12 or 12  # 0 -> 12 AM, 13 -> 1 PM
+    am_pm = 'AM' if now.hour < 12 else 'PM'
+    return (f"{_MONTH_NAMES[now.month - 1]} {now.day:02d}, {now.year} "
+            f"at {hour12:02d}:{now.minute:02d} {am_pm}")
+
+
+@lru_cache(maxsize=1)
+def _session() -> requests.Session:
+    """
+    Build ONE HTTP session for talking to SendGrid and reuse it.
+
+    A requests.Session keeps the connection open (keep-alive), so a second
+    email in the same run skips the TCP + TLS handshake. The API key goes
+    in the session headers once instead of on every request.
+
+    Returns:
+        requests.Session: Shared, pre-authenticated session for this process
+    """
+    session = requests.Session()
+    session.headers.update({
+        'Authorization': f"Bearer {get_settings().SENDGRID_API_KEY}",
+        'Content-Type': 'application/json',
+    })
+    return session
+
+
+def send_new_events_email(new_events: list, venue_name: str = "McCormick Place", recipients: list = None) -> bool:
     """
     Send email notification about new events.
 
+    We POST straight to SendGrid's v3 REST API instead of going through the
+    sendgrid SDK. The SDK is a big import and wraps its own blocking HTTP
+    client; the API itself only needs one small JSON document.
+
+    All recipients are delivered with ONE API call: each address gets its
+    own "personalization" (its own copy of the email, so nobody sees the
+    other addresses), but we only make one HTTPS request.
+
     Args:
         new_events: List of event dictionaries
         venue_name: Name of venue for email subject/body
+        recipients: List of email addresses (default: [RECIPIENT_EMAIL] from .env)
 
     Returns:
         True if email sent successfully, False otherwise
@@ -36,28 +171,49 @@ def send_new_events_email(new_events: list, venue_name: str = "McCormick Place")
         logger.info("No new events to email")
         return False
 
-    # Check if API key is configured
-    if not SENDGRID_API_KEY or not SENDER_EMAIL or not RECIPIENT_EMAIL:
+    # Check if API key is configured (settings are parsed once and cached)
+    settings = get_settings()
+    recipients = recipients or [settings.RECIPIENT_EMAIL]
+    if not settings.SENDGRID_API_KEY or not settings.SENDER_EMAIL or not all(recipients):
         logger.error("SendGrid not configured. Check .env file for SENDGRID_API_KEY, SENDER_EMAIL, RECIPIENT_EMAIL")
         return False
 
+    # Cheap sanity check BEFORE building the (multi-KB) HTML body
+    # If an address is obviously broken, SendGrid will reject the call anyway
+    bad_addresses = [addr for addr in [settings.SENDER_EMAIL] + recipients if '@' not in addr]
+    if bad_addresses:
+        logger.error(f"Invalid email address(es): {bad_addresses} - check SENDER_EMAIL/RECIPIENT_EMAIL in .env")
+        return False
+
     try:
         # Build email content
-        subject = f"🚕 {len(new_events)} New Event{'s' if len(new_events) > 1 else ''} at {venue_name}"
-        html_content = _build_email_html(new_events, venue_name)
-
-        # Create and send email
-        message = Mail(
-            from_email=SENDER_EMAIL,
-            to_emails=RECIPIENT_EMAIL,
-            subject=subject,
-            html_content=html_content
-        )
+        # Count once, pick the plural suffix once ("1 New Event" / "3 New Events")
+        event_count = len(new_events)
+        plural = 's' if event_count != 1 else ''
+        subject = f"🚕 {event_count} New Event{plural} at {venue_name}"
+
+        # Only put the first MAX_EVENTS_PER_EMAIL events in the body
+        shown_events = new_events[:MAX_EVENTS_PER_EMAIL]
+        extra_count = event_count - len(shown_events)
+        html_content = _build_email_html(shown_events, venue_name, extra_count=extra_count)
+
+        # SendGrid v3 mail/send payload
+        # One personalization per recipient - SendGrid fans out for us
+        payload = {
+            'personalizations': [{'to': [{'email': recipient}]} for recipient in recipients],
+            'from': {'email': settings.SENDER_EMAIL},
+            'subject': subject,
+            'content': [{'type': 'text/html', 'value': html_content}],
+        }
+
+        # Serialize to UTF-8 JSON bytes ourselves, ready to go on the wire
+        body = dumps(payload)
 
-        sg = SendGridAPIClient(SENDGRID_API_KEY)
-        response = sg.send(message)
+        # Single API call for every recipient
+        response = _session().post(SENDGRID_API_URL, data=body, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()  # SendGrid answers 202 Accepted on success
 
-        logger.info(f"Email sent successfully! Status code: {response.status_code}")
+        logger.info(f"Email sent successfully to {len(recipients)} recipient(s)! Status code: {response.status_code}")
         return True
 
     except Exception as e:
@@ -65,68 +221,107 @@ def send_new_events_email(new_events: list, venue_name: str = "McCormick Place")
         return False
 
 
-def _build_email_html(events: list, venue_name: str) -> str:
+def _build_email_html(events: list, venue_name: str, extra_count: int = 0) -> str:
     """
     Build HTML email content.
 
+    This is a thin wrapper around _render_email_html(), which is cached.
+    Event dicts can't be used as cache keys (dicts are mutable), so we
+    first turn the fields we display into a tuple of tuples. If the same
+    events are emailed again within the same minute (e.g. a retry), the
+    finished HTML comes straight from the cache.
+
     Args:
-        events: List of event dictionaries
+        events: List of event dictionaries to show
         venue_name: Name of venue
+        extra_count: Number of additional new events NOT shown (adds an
+                     "... and N more" line when > 0)
 
     Returns:
         HTML string for email body
     """
-    timestamp = datetime.now().strftime("%B %d, %Y at %I:%M %p")
-    event_count = len(events)
+    # Only the fields that appear in the email go into the key
+    events_key = tuple(
+        (
+            event.get('event_name', 'Unknown Event'),
+            event.get('start_date', 'TBD'),
+            event.get('end_date', 'TBD'),
+            event.get('location', 'Location TBD'),
+            event.get('url', '#'),
+        )
+        for event in events
+    )
 
-    # Start email HTML
-    html = f"""
-    <html>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-        <h2 style="color: #2c3e50;">Hi Ryad,</h2>
-        <p>Found <strong>{event_count}</strong> new event{'s' if event_count > 1 else ''} at <strong>{venue_name}</strong>:</p>
-        <hr style="border: 1px solid #eee;">
+    # The footer timestamp only shows minutes, so it doubles as a
+    # one-minute cache "bucket" - a new minute means fresh HTML
+    timestamp = _fmt_timestamp(datetime.now())
+
+    return _render_email_html(events_key, venue_name, extra_count, timestamp)
+
+
+@lru_cache(maxsize=32)
+def _render_email_html(events_key: tuple, venue_name: str, extra_count: int, timestamp: str) -> str:
     """
+    Render the HTML email body (memoized - see _build_email_html).
+
+    The pieces are collected in a list and glued together ONCE with
+    ''.join() at the end. Repeated `html += ...` copies the whole string
+    every time, which gets slow as the email grows.
+
+    Args:
+        events_key (tuple): One (event_name, start_date, end_date, location, url)
+                            tuple per event to show
+        venue_name (str): Name of venue
+        extra_count (int): Number of additional new events NOT shown
+        timestamp (str): "Last checked" text for the footer
+
+    Returns:
+        str: HTML string for email body
+    """
+    event_count = len(events_key) + extra_count  # Total found, not just shown
+    plural = 's' if event_count != 1 else ''  # Computed once, reused below
+
+    # Start email HTML (pre-compiled template, only placeholders are filled in)
+    parts = [_EMAIL_HEADER.substitute(
+        event_count=event_count,
+        plural=plural,
+        venue_name=escape(venue_name),
+    )]
 
     # Add each event
-    for i, event in enumerate(events, 1):
-        event_name = event.get('event_name', 'Unknown Event')
-        start_date = event.get('start_date', 'TBD')
-        end_date = event.get('end_date', 'TBD')
-        location = event.get('location', 'Location TBD')
-        url = event.get('url', '#')
-
-        # Format dates nicely
+    for i, (event_name, start_date, end_date, location, url) in enumerate(events_key, 1):
+        # Format dates nicely (cached, no strptime per event)
         try:
-            start_formatted = datetime.strptime(start_date, '%Y-%m-%d').strftime('%b %d, %Y')
-            end_formatted = datetime.strptime(end_date, '%Y-%m-%d').strftime('%b %d, %Y')
-            date_range = f"{start_formatted} to {end_formatted}"
-        except:
-            date_range = f"{start_date} to {end_date}"
-
-        html += f"""
-        <div style="margin-bottom: 25px; padding: 15px; background-color: #f8f9fa; border-left: 4px solid #3498db;">
-            <h3 style="margin-top: 0; color: #2c3e50;">{i}. {event_name}</h3>
-            <p style="margin: 5px 0;">
-                <strong>📅 Dates:</strong> {date_range}<br>
-                <strong>📍 Location:</strong> {location}<br>
-                <strong>🔗 Details:</strong> <a href="{url}" style="color: #3498db;">View Event</a>
-            </p>
-        </div>
-        """
+            date_range = f"{_fmt_date(start_date)} to {_fmt_date(end_date)}"
+        except (ValueError, TypeError):
+            # ValueError: not a YYYY-MM-DD date (e.g. 'TBD')
+            # TypeError: date is missing/None
+            # (Never a bare except: - that would also swallow Ctrl+C)
+            date_range = escape(f"{start_date} to {end_date}")  # Raw API text - escape it
+
+        # Escape text that came from the API before putting it in HTML
+        # (e.g. "Food & Wine" -> "Food &amp; Wine", quotes in URLs -> &quot;)
+        # (date_range is already safe - built by us or escaped above)
+        parts.append(_EVENT_CARD.substitute(
+            style=_STYLE_EVENT,
+            i=i,
+            event_name=escape(event_name),
+            date_range=date_range,
+            location=escape(location),
+            url=escape(url, quote=True),
+        ))
+
+    # Mention events that were cut off by MAX_EVENTS_PER_EMAIL
+    if extra_count > 0:
+        parts.append(_MORE_EVENTS.substitute(
+            extra_count=extra_count,
+            plural='s' if extra_count != 1 else '',
+        ))
 
     # Close email HTML
-    html += f"""
-        <hr style="border: 1px solid #eee; margin-top: 30px;">
-        <p style="color: #7f8c8d; font-size: 0.9em;">
-            <strong>Your Chicago Event Monitor</strong><br>
-            Last checked: {timestamp}
-        </p>
-    </body>
-    </html>
-    """
+    parts.append(_EMAIL_FOOTER.substitute(timestamp=timestamp))
 
-    return html
+    return ''.join(parts)
 
 
 def main():
@@ -153,7 +348,7 @@ def main():
 
     if success:
         print("✅ Test email sent successfully!")
-        print(f"Check your inbox at: {RECIPIENT_EMAIL}")
+        print(f"Check your inbox at: {get_settings().RECIPIENT_EMAIL}")
     else:
         print("❌ Failed to send test email.")
         print("Make sure you have:")
@@ -5,7 +5,7 @@ Sends formatted emails about new Chicago events directly through Gmail's servers
 This replaces the SendGrid implementation to avoid authentication issues.
 
 How it works:
-1. Uses Gmail's SMTP server (smtp.gmail.com:587)
+1. Uses Gmail's SMTP server (smtp.gmail.com:465, implicit TLS)
 2. Authenticates with your Gmail App Password
 3. Sends emails that appear to come directly from your Gmail account
 4. No third-party service (SendGrid) needed
@@ -14,16 +14,25 @@ Author: Ryad (with Claude Code)
 Created: December 6, 2025
 """
 
-import os
+import io
+import time
+import queue
+import atexit
+import random
+import re
+import socket
 import smtplib
 import logging
-from datetime import datetime
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime
+from functools import lru_cache
+from html import escape
+from email import policy
+from email.message import EmailMessage
+from email.generator import BytesGenerator
+from config import get_settings
+from upcoming_events import format_event_timing, estimate_peak_pickup_time
 
 # Set up logger for this module
 logger = logging.getLogger(__name__)
@@ -31,15 +40,555 @@ logger = logging.getLogger(__name__)
 # Gmail SMTP Configuration
 # These are Gmail's official SMTP server settings
 GMAIL_SMTP_SERVER = "smtp.gmail.com"  # Gmail's outgoing mail server
-GMAIL_SMTP_PORT = 587  # Port for TLS/STARTTLS (secure connection)
+GMAIL_SMTP_PORT = 465  # Port for implicit TLS (encrypted from the first byte)
+SMTP_TIMEOUT_SECONDS = 30  # Give up on a stuck connect/command instead of hanging
+
+# Load credentials via config.get_settings()
+# (it only reads .env when the environment doesn't already have the values,
+# and only once per process - see config.py)
+_settings = get_settings()
+GMAIL_ADDRESS = _settings.GMAIL_ADDRESS  # Your Gmail address
+GMAIL_APP_PASSWORD = _settings.GMAIL_APP_PASSWORD  # App password (not regular password)
+RECIPIENT_EMAIL = _settings.RECIPIENT_EMAIL  # Where to send notifications
+
+# Validate the Gmail credentials ONCE, at import time.
+# Every send used to re-check these; now they just read one bool, and a
+# missing .env entry shows up in the log as soon as the program starts
+# instead of on the first (possibly hours later) email.
+_CREDS_OK = bool(GMAIL_ADDRESS and GMAIL_APP_PASSWORD)
+if not _CREDS_OK:
+    logger.warning("Gmail SMTP not configured - set GMAIL_ADDRESS and GMAIL_APP_PASSWORD in .env")
+
+# Optional: several recipients, comma-separated in .env
+#   RECIPIENT_EMAILS=me@gmail.com,partner@yahoo.com
+# Falls back to the single RECIPIENT_EMAIL when not set.
+RECIPIENT_EMAILS = [
+    address.strip()
+    for address in (_settings.RECIPIENT_EMAILS or RECIPIENT_EMAIL or '').split(',')
+    if address.strip()
+]
+
+# Gmail accepts at most 100 recipients per message, so bigger lists are
+# sent in batches of this size (all over the same open connection)
+SMTP_MAX_RECIPIENTS = 100
+
+# Retrying temporary failures
+# Gmail sometimes says "try again later" (421/45x) or drops the connection,
+# especially when it is throttling us. We retry with growing pauses.
+SMTP_SEND_ATTEMPTS = 3  # Total tries per batch (1 + 2 retries)
+SMTP_RETRY_BASE_SECONDS = 1  # First pause; doubles each retry (1s, 2s, ...)
+SMTP_TRANSIENT_CODES = (421, 450, 451, 452)  # "Temporary, try again" replies
+
+# Circuit breaker (see _check_breaker)
+# When Gmail is down or refusing us, every send would still connect, log
+# in and retry with backoff - slow, and more load on a struggling server.
+# After SMTP_BREAKER_THRESHOLD failed attempts in a row we stop trying for
+# SMTP_BREAKER_COOLDOWN_SECONDS: sends fail at once, without opening a
+# connection. The first send after the pause is a trial - if it works the
+# breaker resets, if it fails the pause starts again.
+SMTP_BREAKER_THRESHOLD = 5  # Consecutive failed attempts before pausing
+SMTP_BREAKER_COOLDOWN_SECONDS = 30  # How long to stop trying
+
+# Only the background sender thread touches this, so no lock is needed
+_breaker = {'failures': 0, 'open_until': 0.0}
+
+
+class SMTPCircuitOpen(smtplib.SMTPException):
+    """Raised instead of sending while the circuit breaker is open."""
+
+# Sending rate limit (token bucket, see _wait_for_send_slot)
+# Gmail throttles accounts that send in bursts. Allow a small burst, then
+# at most GMAIL_RATE_PER_MIN messages per minute. Both can be tuned in .env
+# (e.g. higher for a Google Workspace account).
+GMAIL_RATE_PER_MIN = float(_settings.GMAIL_RATE_PER_MIN or 30)
+GMAIL_BURST = int(_settings.GMAIL_BURST or 10)
+
+_send_tokens = float(GMAIL_BURST)  # Start with a full bucket
+_send_tokens_updated = time.monotonic()
+_rate_lock = threading.Lock()
+
+# SMTP connection reuse
+# Opening a Gmail connection costs a TCP handshake + TLS handshake + login
+# (several seconds). We keep ONE connection open and reuse it for every
+# email sent by this process, instead of connecting/logging in each time.
+# (This gives most of what the Gmail API's batch endpoint would, without
+# its OAuth setup - an App Password only works over SMTP.)
+SMTP_MAX_IDLE_SECONDS = 60  # Gmail drops idle connections after ~60-100s
+
+_smtp_server = None  # The shared connection (None = not connected yet)
+_smtp_last_used = 0.0  # time.monotonic() of the last successful use
+_smtp_lock = threading.Lock()  # Only one thread may use the connection at a time
+
+
+def _open_connection() -> smtplib.SMTP:
+    """
+    Open a brand-new, logged-in connection to Gmail's SMTP server.
+
+    Steps: connect with TLS (port 465) -> EHLO -> login
+
+    Why port 465 instead of 587 + STARTTLS?
+    - On 587 the client connects in plain text, says EHLO, asks to
+      STARTTLS, then says EHLO again - extra round trips before login
+    - On 465 TLS is negotiated as part of connecting, so we skip straight
+      to EHLO + login (one less round trip on every new connection)
+
+    Returns:
+        smtplib.SMTP: Connected and authenticated SMTP server object
+    """
+    logger.info(f"Connecting to Gmail SMTP server ({GMAIL_SMTP_SERVER}:{GMAIL_SMTP_PORT})...")
+    server = smtplib.SMTP_SSL(GMAIL_SMTP_SERVER, GMAIL_SMTP_PORT, timeout=SMTP_TIMEOUT_SECONDS)
+
+    # SMTP is lots of small command/reply pairs - send each one right away
+    # instead of letting the OS hold it back to batch with later data (Nagle)
+    server.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    server.ehlo()
+    server.login(GMAIL_ADDRESS, GMAIL_APP_PASSWORD)
+    return server
+
+
+def _close_connection() -> None:
+    """
+    Close the shared SMTP connection (if any). Safe to call any time.
+
+    Registered with atexit so the connection is closed politely (QUIT)
+    when the script finishes.
+    """
+    global _smtp_server
 
-# Load credentials from .env file
-GMAIL_ADDRESS = os.getenv('GMAIL_ADDRESS')  # Your Gmail address
-GMAIL_APP_PASSWORD = os.getenv('GMAIL_APP_PASSWORD')  # App password (not regular password)
-RECIPIENT_EMAIL = os.getenv('RECIPIENT_EMAIL')  # Where to send notifications
+    if _smtp_server is None:
+        return
 
+    try:
+        _smtp_server.quit()
+    except (smtplib.SMTPException, OSError):
+        # Connection already dead - nothing to say goodbye to
+        pass
+    finally:
+        _smtp_server = None
+
+
+atexit.register(_close_connection)
+
+
+def _get_connection() -> smtplib.SMTP:
+    """
+    Return a live SMTP connection, reusing the shared one when possible.
+
+    How it works:
+    1. No connection yet? -> open one
+    2. Idle too long? -> Gmail has probably hung up, open a fresh one
+    3. Otherwise send a cheap NOOP to check the connection is still alive
+    4. If the NOOP fails, reconnect
 
-def send_combined_email(new_events: list = None, ohare_data: dict = None, venue_name: str = "McCormick Place", upcoming_events: list = None) -> bool:
+    Must be called while holding _smtp_lock.
+
+    Returns:
+        smtplib.SMTP: Connected and authenticated SMTP server object
+    """
+    global _smtp_server
+
+    if _smtp_server is not None:
+        idle_seconds = time.monotonic() - _smtp_last_used
+
+        if idle_seconds < SMTP_MAX_IDLE_SECONDS:
+            try:
+                status, _ = _smtp_server.noop()
+                if status == 250:
+                    return _smtp_server  # Still alive - reuse it
+            except (smtplib.SMTPException, OSError):
+                pass  # Dead connection - fall through and reconnect
+
+        _close_connection()
+
+    _smtp_server = _open_connection()
+    return _smtp_server
+
+
+@contextmanager
+def _borrow_connection():
+    """
+    Borrow the shared SMTP connection for a `with` block.
+
+    Example:
+        with _borrow_connection() as server:
+            server.send_message(message)
+    """
+    global _smtp_last_used
+
+    with _smtp_lock:
+        server = _get_connection()
+        yield server
+        _smtp_last_used = time.monotonic()
+
+
+def _check_breaker() -> None:
+    """
+    Fail fast if the circuit breaker is open (Gmail failed too often lately).
+
+    Raises:
+        SMTPCircuitOpen: Still inside the cooldown - don't even connect
+    """
+    remaining = _breaker['open_until'] - time.monotonic()
+    if remaining > 0:
+        raise SMTPCircuitOpen(f"Gmail SMTP paused after {_breaker['failures']} failed attempts "
+                              f"- not sending for another {remaining:.0f}s")
+
+
+def _record_send_result(success: bool) -> None:
+    """
+    Update the circuit breaker after one send attempt.
+
+    Success resets the failure count. A failure adds one, and once there
+    are SMTP_BREAKER_THRESHOLD in a row the breaker opens (again) for
+    SMTP_BREAKER_COOLDOWN_SECONDS.
+    """
+    if success:
+        _breaker['failures'] = 0
+        return
+
+    _breaker['failures'] += 1
+    if _breaker['failures'] >= SMTP_BREAKER_THRESHOLD:
+        _breaker['open_until'] = time.monotonic() + SMTP_BREAKER_COOLDOWN_SECONDS
+        logger.warning(f"Gmail SMTP failed {_breaker['failures']} times in a row - "
+                       f"pausing sends for {SMTP_BREAKER_COOLDOWN_SECONDS}s")
+
+
+def _send_message(message, recipients: list) -> None:
+    """
+    Send one email message to every recipient over the shared connection.
+
+    All recipients go in ONE SMTP transaction (one MAIL FROM / DATA) per
+    batch of up to SMTP_MAX_RECIPIENTS addresses, instead of one
+    transaction per person. Addresses are passed as the SMTP "envelope"
+    (to_addrs), so they act like BCC - nobody sees the full list.
+
+    Temporary failures are retried up to SMTP_SEND_ATTEMPTS times with
+    exponential backoff + jitter (see _is_transient_smtp_error). The shared
+    connection is thrown away before each retry, so a 421 "timeout" or a
+    dropped connection is fixed by reconnecting. Any other error (bad
+    password, rejected address, ...) is raised to the caller right away.
+
+    The message is turned into bytes ONCE, up front. send_message() would
+    re-serialize it for every batch and every retry; sendmail() just sends
+    the bytes we already have.
+
+    Every attempt first checks the circuit breaker: while it is open,
+    SMTPCircuitOpen is raised instead of connecting (see _check_breaker).
+
+    Args:
+        message: The email message to send
+        recipients (list): Email addresses to deliver to
+    """
+    message_bytes = _serialize_message(message)
+
+    for start in range(0, len(recipients), SMTP_MAX_RECIPIENTS):
+        batch = recipients[start:start + SMTP_MAX_RECIPIENTS]
+
+        for attempt in range(SMTP_SEND_ATTEMPTS):
+            _check_breaker()  # Gmail failing a lot lately? -> give up at once
+
+            try:
+                _wait_for_send_slot()  # Stay under Gmail's sending rate
+                with _borrow_connection() as server:
+                    server.sendmail(GMAIL_ADDRESS, batch, message_bytes)
+                _record_send_result(True)
+                break  # This batch is delivered
+
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPResponseException, socket.timeout) as e:
+                _record_send_result(False)
+
+                # Permanent problem, or out of attempts -> give up
+                if not _is_transient_smtp_error(e) or attempt == SMTP_SEND_ATTEMPTS - 1:
+                    raise
+                _check_breaker()  # That failure opened the breaker? -> don't wait to retry
+
+                # Wait 1s, 2s, 4s, ... plus up to 1s of random "jitter" so
+                # retries don't hammer Gmail in lockstep while it's throttling
+                delay = SMTP_RETRY_BASE_SECONDS * (2 ** attempt) + random.random()
+                logger.warning(f"Temporary SMTP problem ({e}) - reconnecting and retrying in {delay:.1f}s "
+                               f"(attempt {attempt + 2} of {SMTP_SEND_ATTEMPTS})")
+                with _smtp_lock:
+                    _close_connection()
+                time.sleep(delay)
+
+            except (smtplib.SMTPException, OSError):
+                # Any other failure (connection refused, login failed, ...)
+                # also counts toward the breaker, then goes to the caller
+                _record_send_result(False)
+                raise
+
+
+def _wait_for_send_slot() -> None:
+    """
+    Block until we're allowed to send another message (token bucket).
+
+    How it works:
+    1. The bucket holds up to GMAIL_BURST tokens and starts full
+    2. Tokens drip back in at GMAIL_RATE_PER_MIN per minute
+    3. Every send takes one token; if the bucket is empty we sleep just
+       long enough for the next token to drip in
+
+    So a handful of emails go out immediately, but a long run of sends is
+    spread out instead of hitting Gmail in a burst (which gets us 421
+    "try again later" replies and dropped connections).
+    """
+    global _send_tokens, _send_tokens_updated
+
+    with _rate_lock:
+        now = time.monotonic()
+        refill = (now - _send_tokens_updated) * GMAIL_RATE_PER_MIN / 60
+        _send_tokens = min(GMAIL_BURST, _send_tokens + refill)
+        _send_tokens_updated = now
+
+        if _send_tokens < 1:
+            wait_seconds = (1 - _send_tokens) * 60 / GMAIL_RATE_PER_MIN
+            logger.info(f"Gmail rate limit reached - waiting {wait_seconds:.1f}s before sending")
+            time.sleep(wait_seconds)
+            _send_tokens_updated = time.monotonic()
+            _send_tokens = 1  # Exactly the token we waited for
+
+        _send_tokens -= 1
+
+
+def _serialize_message(message) -> bytes:
+    """
+    Render an email message to the exact bytes sent over SMTP.
+
+    Uses the SMTP policy (CRLF line endings, long headers folded) - the
+    same thing send_message() does internally, done once instead of on
+    every send attempt.
+
+    Args:
+        message: The email message to serialize
+
+    Returns:
+        bytes: Wire-format message, ready for sendmail()
+    """
+    buffer = io.BytesIO()
+    BytesGenerator(buffer, policy=policy.SMTP).flatten(message)
+    return buffer.getvalue()
+
+
+def _is_transient_smtp_error(error: Exception) -> bool:
+    """
+    Is this an SMTP error that is worth retrying?
+
+    Retry when:
+    - The connection was dropped or timed out
+    - Gmail answered 421 (service unavailable / timeout) or a 45x code
+      (mailbox busy, local error, too many messages right now)
+
+    Args:
+        error (Exception): The error raised while sending
+
+    Returns:
+        bool: True if sending again later might succeed
+    """
+    if isinstance(error, (smtplib.SMTPServerDisconnected, socket.timeout)):
+        return True
+    return getattr(error, 'smtp_code', None) in SMTP_TRANSIENT_CODES
+
+
+def _to_header(recipients: list) -> str:
+    """
+    Pick what to show in the email's "To:" line.
+
+    One recipient: show their address (normal looking email).
+    Several recipients: show our own Gmail address and deliver to everyone
+    via the SMTP envelope, so recipients don't see each other (BCC-style).
+
+    Args:
+        recipients (list): Email addresses the message will be delivered to
+
+    Returns:
+        str: Value for the "To" header
+    """
+    return recipients[0] if len(recipients) == 1 else GMAIL_ADDRESS
+
+
+def _make_message(subject: str, recipients: list, text_content: str, html_content: str) -> EmailMessage:
+    """
+    Build a multipart/alternative email (plain text + HTML versions).
+
+    Uses the modern EmailMessage API with the SMTP policy (CRLF line
+    endings, as SMTP expects), which serializes faster than the legacy
+    MIMEMultipart/MIMEText classes.
+
+    Args:
+        subject (str): Subject line
+        recipients (list): Email addresses the message will be delivered to
+        text_content (str): Plain text body
+        html_content (str): HTML body
+
+    Returns:
+        EmailMessage: Ready-to-send message
+    """
+    message = EmailMessage(policy=policy.SMTP)
+    message['Subject'] = subject
+    message['From'] = GMAIL_ADDRESS
+    message['To'] = _to_header(recipients)
+
+    message.set_content(text_content)  # Plain text version
+    message.add_alternative(html_content, subtype='html')  # HTML version
+    return message
+
+
+# Background sending
+# Building an email is fast; talking to Gmail is slow (seconds). A single
+# background "worker" thread does the slow part. Callers drop a job on a
+# queue and can either wait for the result (default) or carry on at once.
+SEND_QUEUE_SIZE = 1000  # Max emails waiting to be sent
+
+_send_queue = queue.Queue(maxsize=SEND_QUEUE_SIZE)
+_worker_thread = None  # Started the first time an email is queued
+_failed_sends = 0  # Emails that failed since the last wait_for_emails()
+_worker_lock = threading.Lock()
+
+
+def _deliver(job: dict) -> bool:
+    """
+    Actually send one queued email (runs on the worker thread).
+
+    Never raises - every problem is logged and turned into False, so one
+    bad email can't kill the worker thread.
+
+    Args:
+        job (dict): Queued job with 'message', 'recipients', 'description'
+
+    Returns:
+        bool: True if Gmail accepted the email
+    """
+    recipients = job['recipients']
+
+    try:
+        # Connects + logs in on first use, then reuses the same connection
+        # for later emails (closed automatically when the script exits)
+        _send_message(job['message'], recipients)
+        logger.info(f"✅ {job['description']} sent successfully to {', '.join(recipients)} via Gmail SMTP")
+        return True
+
+    except SMTPCircuitOpen as e:
+        # Gmail has been failing - skipped without trying (see _check_breaker)
+        logger.warning(f"{job['description']} not sent: {e}")
+        return False
+
+    except smtplib.SMTPAuthenticationError as e:
+        # Authentication failed - wrong email or app password
+        logger.error(f"Gmail authentication failed: {e}")
+        logger.error("Check that GMAIL_ADDRESS and GMAIL_APP_PASSWORD are correct in .env")
+        return False
+
+    except smtplib.SMTPException as e:
+        # Other SMTP errors (network issues, server problems, etc.)
+        logger.error(f"SMTP error while sending {job['description'].lower()}: {e}")
+        return False
+
+    except Exception as e:
+        # Any other unexpected errors
+        logger.error(f"Unexpected error sending {job['description'].lower()}: {e}")
+        return False
+
+
+def _send_worker() -> None:
+    """
+    Worker thread loop: take the next job off the queue and send it. Forever.
+
+    Each job carries a threading.Event ('done') that we set when finished,
+    so a caller that chose to wait knows the result is ready.
+    """
+    global _failed_sends
+
+    while True:
+        job = _send_queue.get()  # Sleeps here until a job arrives
+        try:
+            job['success'] = _deliver(job)
+            if not job['success']:
+                _failed_sends += 1
+        finally:
+            job['done'].set()
+            _send_queue.task_done()
+
+
+def _start_worker() -> None:
+    """Start the background worker thread (only once per process)."""
+    global _worker_thread
+
+    with _worker_lock:
+        if _worker_thread is None:
+            # daemon=True: this thread never stops Python from exiting
+            # (_flush_send_queue below makes sure queued emails go out first)
+            _worker_thread = threading.Thread(target=_send_worker, name="gmail-sender", daemon=True)
+            _worker_thread.start()
+
+
+def _flush_send_queue() -> None:
+    """Block until every queued email has been sent (runs at exit)."""
+    _send_queue.join()
+
+
+def wait_for_emails() -> bool:
+    """
+    Block until every queued email has been sent (or has failed).
+
+    For callers that queue with wait=False and want the outcome later,
+    e.g. main.py saves the events file while the email goes out.
+
+    Returns:
+        bool: True if every email finished since the last call was sent
+    """
+    global _failed_sends
+
+    _flush_send_queue()
+    all_sent = _failed_sends == 0
+    _failed_sends = 0
+    return all_sent
+
+
+# atexit runs handlers in reverse order: flush the queue FIRST,
+# then _close_connection (registered above) closes the SMTP connection
+atexit.register(_flush_send_queue)
+
+
+def _queue_email(message, recipients: list, description: str, wait: bool = True) -> bool:
+    """
+    Hand a finished email to the background worker.
+
+    Args:
+        message: The email message to send
+        recipients (list): Email addresses to deliver to
+        description (str): Used in log messages, e.g. "Combined email"
+        wait (bool): True = block until sent and return the real result.
+                     False = return right away (True means "queued").
+
+    Returns:
+        bool: Sent (wait=True) / queued (wait=False) successfully
+    """
+    job = {
+        'message': message,
+        'recipients': recipients,
+        'description': description,
+        'done': threading.Event(),
+        'success': False,
+    }
+
+    _start_worker()
+
+    try:
+        _send_queue.put_nowait(job)
+    except queue.Full:
+        logger.error(f"Email queue is full ({SEND_QUEUE_SIZE} waiting) - dropping: {message['Subject']}")
+        return False
+
+    if not wait:
+        logger.info(f"{description} queued for background sending")
+        return True
+
+    job['done'].wait()
+    return job['success']
+
+
+def send_combined_email(new_events: list = None, ohare_data: dict = None, venue_name: str = "McCormick Place", upcoming_events: list = None, recipients: list = None, wait: bool = True) -> bool:
     """
     Send combined email with events AND O'Hare flight information.
 
@@ -48,21 +597,27 @@ def send_combined_email(new_events: list = None, ohare_data: dict = None, venue_
         ohare_data (dict): O'Hare flight data from scraper
         venue_name (str): Venue name
         upcoming_events (list): List of events starting in next 0-2 days (can be empty)
+        recipients (list): Email addresses to send to
+            (default: RECIPIENT_EMAILS / RECIPIENT_EMAIL from .env)
+        wait (bool): Wait for Gmail before returning (default: True).
+            False = hand off to the background sender and return at once.
 
     Returns:
-        bool: True if sent successfully
+        bool: True if sent successfully (or queued, when wait=False)
     """
     new_events = new_events or []
+    recipients = recipients or RECIPIENT_EMAILS
 
     # Check if there's anything to send
-    has_events = len(new_events) > 0
+    event_count = len(new_events)
+    has_events = event_count > 0
     has_ohare = ohare_data and len(ohare_data) > 0
 
     # ALWAYS send daily summary (removed the check that prevented sending)
     # Even if no new events, we send O'Hare status to confirm system is working
 
     # Check credentials
-    if not GMAIL_ADDRESS or not GMAIL_APP_PASSWORD or not RECIPIENT_EMAIL:
+    if not _CREDS_OK or not recipients:
         logger.error("Gmail SMTP not configured")
         return False
 
@@ -70,7 +625,7 @@ def send_combined_email(new_events: list = None, ohare_data: dict = None, venue_
         # Build subject
         subject_parts = []
         if has_events:
-            subject_parts.append(f"{len(new_events)} New Event{'s' if len(new_events) > 1 else ''}")
+            subject_parts.append(f"{event_count} New Event{'s' if event_count > 1 else ''}")
         if has_ohare:
             demand = ohare_data.get('taxi_demand', 'MEDIUM')
             subject_parts.append(f"O'Hare: {demand} Demand")
@@ -81,38 +636,31 @@ def send_combined_email(new_events: list = None, ohare_data: dict = None, venue_
         else:
             subject = f"🚕 {' + '.join(subject_parts)}"
 
-        # Build email content
-        html_content = _build_combined_html(new_events, ohare_data, venue_name, upcoming_events or [])
-        text_content = _build_combined_text(new_events, ohare_data, venue_name, upcoming_events or [])
+        # "Last checked" time is read once and shared by both bodies
+        timestamp = _now_timestamp()
+
+        if not has_events and not has_ohare and not upcoming_events:
+            # Quiet day: nothing but the "system is working" heartbeat.
+            # The body is pre-built - just drop in the timestamp.
+            html_content = _HEARTBEAT_HTML_TMPL.format_map({'timestamp': timestamp})
+            text_content = _HEARTBEAT_TEXT_TMPL.format_map({'timestamp': timestamp})
+        else:
+            # Build email content (HTML + plain text in one pass)
+            html_content, text_content = _build_combined_bodies(new_events, ohare_data, venue_name, upcoming_events or [],
+                                                                timestamp=timestamp)
 
         # Create message
-        message = MIMEMultipart('alternative')
-        message['Subject'] = subject
-        message['From'] = GMAIL_ADDRESS
-        message['To'] = RECIPIENT_EMAIL
-
-        part1 = MIMEText(text_content, 'plain')
-        part2 = MIMEText(html_content, 'html')
-        message.attach(part1)
-        message.attach(part2)
-
-        # Send via Gmail SMTP
-        logger.info(f"Connecting to Gmail SMTP server...")
-        server = smtplib.SMTP(GMAIL_SMTP_SERVER, GMAIL_SMTP_PORT)
-        server.starttls()
-        server.login(GMAIL_ADDRESS, GMAIL_APP_PASSWORD)
-        server.send_message(message)
-        server.quit()
-
-        logger.info(f"✅ Combined email sent successfully to {RECIPIENT_EMAIL}")
-        return True
+        message = _make_message(subject, recipients, text_content, html_content)
+
+        # Send via Gmail SMTP on the background sender thread
+        return _queue_email(message, recipients, "Combined email", wait=wait)
 
     except Exception as e:
         logger.error(f"Failed to send combined email: {e}")
         return False
 
 
-def send_new_events_email(new_events: list, venue_name: str = "McCormick Place") -> bool:
+def send_new_events_email(new_events: list, venue_name: str = "McCormick Place", recipients: list = None, wait: bool = True) -> bool:
     """
     Send email notification about new events using Gmail SMTP.
 
@@ -120,8 +668,8 @@ def send_new_events_email(new_events: list, venue_name: str = "McCormick Place")
     1. Checks if there are new events to send
     2. Validates that Gmail credentials are configured
     3. Builds HTML and plain text email content
-    4. Connects to Gmail's SMTP server
-    5. Sends the email through Gmail
+    4. Hands the email to the background sender thread
+    5. Sends the email through Gmail (reusing the open connection)
     6. Returns success/failure status
 
     Args:
@@ -132,9 +680,13 @@ def send_new_events_email(new_events: list, venue_name: str = "McCormick Place")
             - location: Venue location
             - url: Link to event details
         venue_name (str): Name of venue for email subject/body (default: "McCormick Place")
+        recipients (list): Email addresses to send to
+            (default: RECIPIENT_EMAILS / RECIPIENT_EMAIL from .env)
+        wait (bool): Wait for Gmail before returning (default: True).
+            False = hand off to the background sender and return at once.
 
     Returns:
-        bool: True if email sent successfully, False otherwise
+        bool: True if email sent successfully (or queued, when wait=False), False otherwise
 
     Example:
         events = [{'event_name': 'Auto Show', 'start_date': '2026-02-07', ...}]
@@ -152,7 +704,8 @@ def send_new_events_email(new_events: list, venue_name: str = "McCormick Place")
         return False
 
     # Check if Gmail credentials are configured in .env
-    if not GMAIL_ADDRESS or not GMAIL_APP_PASSWORD or not RECIPIENT_EMAIL:
+    recipients = recipients or RECIPIENT_EMAILS
+    if not _CREDS_OK or not recipients:
         logger.error("Gmail SMTP not configured. Check .env file for GMAIL_ADDRESS, GMAIL_APP_PASSWORD, RECIPIENT_EMAIL")
         return False
 
@@ -163,76 +716,69 @@ def send_new_events_email(new_events: list, venue_name: str = "McCormick Place")
     try:
         # Create email subject line
         # Example: "🚕 3 New Events at McCormick Place"
-        subject = f"🚕 {len(new_events)} New Event{'s' if len(new_events) > 1 else ''} at {venue_name}"
+        event_count = len(new_events)
+        subject = f"🚕 {event_count} New Event{'s' if event_count > 1 else ''} at {venue_name}"
 
-        # Build HTML version of email (for nice formatting)
-        html_content = _build_email_html(new_events, venue_name)
-
-        # Build plain text version (for email clients that don't support HTML)
-        text_content = _build_email_text(new_events, venue_name)
+        # Build HTML version of email (for nice formatting) and the plain
+        # text version (for email clients that don't support HTML) together
+        html_content, text_content = _build_bodies(new_events, venue_name, timestamp=_now_timestamp())
 
         # ============================================================
         # STEP 3: Create email message
         # ============================================================
 
-        # Create a multipart message (supports both HTML and plain text)
-        message = MIMEMultipart('alternative')
-        message['Subject'] = subject
-        message['From'] = GMAIL_ADDRESS
-        message['To'] = RECIPIENT_EMAIL
-
-        # Attach both plain text and HTML versions
+        # Create a message with both plain text and HTML versions
         # Email clients will choose which to display (HTML if supported, plain text otherwise)
-        part1 = MIMEText(text_content, 'plain')  # Plain text version
-        part2 = MIMEText(html_content, 'html')    # HTML version
-        message.attach(part1)
-        message.attach(part2)
+        message = _make_message(subject, recipients, text_content, html_content)
 
         # ============================================================
-        # STEP 4: Connect to Gmail SMTP server and send
+        # STEP 4: Send through Gmail's SMTP server
         # ============================================================
 
-        # Connect to Gmail's SMTP server
-        logger.info(f"Connecting to Gmail SMTP server ({GMAIL_SMTP_SERVER}:{GMAIL_SMTP_PORT})...")
-        server = smtplib.SMTP(GMAIL_SMTP_SERVER, GMAIL_SMTP_PORT)
-
-        # Start TLS encryption (secure the connection)
-        server.starttls()
+        # The background sender thread does the slow SMTP part
+        # (SMTP errors are logged there and come back as False)
+        return _queue_email(message, recipients, "Email", wait=wait)
 
-        # Login with your Gmail address and app password
-        server.login(GMAIL_ADDRESS, GMAIL_APP_PASSWORD)
-
-        # Send the email
-        server.send_message(message)
-
-        # Close the connection
-        server.quit()
+    except Exception as e:
+        # Any other unexpected errors (e.g. while building the email)
+        logger.error(f"Unexpected error sending email: {e}")
+        return False
 
-        # Log success
-        logger.info(f"✅ Email sent successfully to {RECIPIENT_EMAIL} via Gmail SMTP")
-        return True
 
-    except smtplib.SMTPAuthenticationError as e:
-        # Authentication failed - wrong email or app password
-        logger.error(f"Gmail authentication failed: {e}")
-        logger.error("Check that GMAIL_ADDRESS and GMAIL_APP_PASSWORD are correct in .env")
-        return False
+# Sort order for crowd levels (biggest crowds first in emails)
+# Built once here instead of on every sort (see _sort_by_crowd)
+_CROWD_PRIORITY = {"MASSIVE": 0, "LARGE": 1, "MEDIUM": 2, "SMALL": 3}
+_CROWD_LEVELS_BIGGEST_FIRST = tuple(sorted(_CROWD_PRIORITY, key=_CROWD_PRIORITY.get))
 
-    except smtplib.SMTPException as e:
-        # Other SMTP errors (network issues, server problems, etc.)
-        logger.error(f"SMTP error while sending email: {e}")
-        return False
+# Location keywords -> crowd level, compiled into ONE regex.
+# Each named group is a crowd level, so a match tells us the level directly.
+_CROWD_LOCATION_RE = re.compile(
+    r"(?P<MASSIVE>/|ALL HALLS)"        # Multi-building events = massive crowds (20K-100K+ attendees)
+    r"|(?P<LARGE>SOUTH|NORTH)"         # Single large buildings
+    r"|(?P<MEDIUM>WEST)"               # Medium buildings
+    r"|(?P<SMALL>LAKESIDE|ARIE CROWN)",  # Smaller venues
+    re.IGNORECASE,
+)
 
-    except Exception as e:
-        # Any other unexpected errors
-        logger.error(f"Unexpected error sending email: {e}")
-        return False
+# What _estimate_crowd_size() returns for each level
+_CROWD_ESTIMATES = {
+    "MASSIVE": ("MASSIVE", "🔥🔥🔥", "50K-100K+ attendees expected"),
+    "LARGE": ("LARGE", "🔥🔥", "20K-50K attendees expected"),
+    "MEDIUM": ("MEDIUM", "🔥", "10K-20K attendees expected"),
+    "SMALL": ("SMALL", "📍", "5K-10K attendees expected"),
+}
 
 
+@lru_cache(maxsize=256)
 def _estimate_crowd_size(location: str) -> tuple:
     """
     Estimate crowd size and taxi demand based on building usage.
 
+    Cached with lru_cache: the same few building names ("SOUTH BUILDING",
+    "United Center", ...) come up over and over, and this function is
+    called several times per event (sorting + HTML + text). After the
+    first time, each location's answer is just a dictionary lookup.
+
     Args:
         location (str): Building location (e.g., "SOUTH/NORTH BUILDINGS")
 
@@ -242,109 +788,151 @@ def _estimate_crowd_size(location: str) -> tuple:
             - emoji: Visual indicator
             - description: Estimated attendee range
     """
-    location_upper = location.upper()
+    # One regex pass finds every keyword in the location; the biggest crowd
+    # level found wins (so "WEST/SOUTH" is still MASSIVE, not MEDIUM)
+    found = {match.lastgroup for match in _CROWD_LOCATION_RE.finditer(location)}
 
-    # Multi-building events = massive crowds (20K-100K+ attendees)
-    if "/" in location or "ALL HALLS" in location_upper:
-        return ("MASSIVE", "🔥🔥🔥", "50K-100K+ attendees expected")
+    for crowd_level in _CROWD_LEVELS_BIGGEST_FIRST:
+        if crowd_level in found:
+            return _CROWD_ESTIMATES[crowd_level]
 
-    # Single large buildings
-    elif "SOUTH" in location_upper or "NORTH" in location_upper:
-        return ("LARGE", "🔥🔥", "20K-50K attendees expected")
+    return ("MEDIUM", "📍", "Moderate attendance expected")
 
-    # Medium buildings
-    elif "WEST" in location_upper:
-        return ("MEDIUM", "🔥", "10K-20K attendees expected")
 
-    # Smaller venues
-    elif "LAKESIDE" in location_upper or "ARIE CROWN" in location_upper:
-        return ("SMALL", "📍", "5K-10K attendees expected")
+def _sort_by_crowd(events: list) -> list:
+    """
+    Return events sorted by crowd size (MASSIVE first, then LARGE, ...).
 
-    else:
-        return ("MEDIUM", "📍", "Moderate attendance expected")
+    Detailed explanation (decorate-sort-undecorate):
+    1. Work out each event's crowd priority ONCE and pair it with the event:
+       (priority, position, event)
+    2. Sort those tuples - Python compares the integer priority first
+    3. Position breaks ties, so equal-sized events keep their original
+       order and Python never has to compare two event dicts
+    4. Strip the tuples back down to just the events
 
+    Args:
+        events (list): Event dictionaries with a 'location' key
 
-def _build_email_html(events: list, venue_name: str) -> str:
+    Returns:
+        list: New list of the same events, largest crowds first
     """
-    Build HTML email content with nice formatting.
+    decorated = [
+        (_CROWD_PRIORITY.get(_estimate_crowd_size(event.get('location', ''))[0], 4), position, event)
+        for position, event in enumerate(events)
+    ]
+    decorated.sort()
+    return [event for _, _, event in decorated]
 
-    Args:
-        events (list): List of event dictionaries
-        venue_name (str): Name of venue
 
-    Returns:
-        str: HTML string for email body
+def _fmt_ymd(s: str) -> str:
     """
-    timestamp = datetime.now().strftime("%B %d, %Y at %I:%M %p")
-    event_count = len(events)
+    Format a 'YYYY-MM-DD' date string as 'Feb 07, 2026'.
 
-    # Sort events by crowd size (largest first) for taxi planning
-    def sort_key(event):
-        crowd_level, _, _ = _estimate_crowd_size(event.get('location', ''))
-        priority = {"MASSIVE": 0, "LARGE": 1, "MEDIUM": 2, "SMALL": 3}
-        return priority.get(crowd_level, 4)
+    date.fromisoformat() is implemented in C, so it is several times
+    faster than datetime.strptime() (which uses regular expressions).
+    It only takes the exact 'YYYY-MM-DD' form, though, so anything else
+    (e.g. '2026-2-7', which strptime accepts) still goes to strptime.
+
+    Raises:
+        ValueError, TypeError: If s isn't a valid date (e.g. 'TBD', None)
+    """
+    if isinstance(s, str) and len(s) == 10 and s[4] == '-' and s[7] == '-':
+        return date.fromisoformat(s).strftime('%b %d, %Y')
+    return datetime.strptime(s, '%Y-%m-%d').strftime('%b %d, %Y')
 
-    sorted_events = sorted(events, key=sort_key)
 
-    # Start email HTML with header
-    html = f"""
+@lru_cache(maxsize=512)
+def _fmt_date_range(start_date: str, end_date: str) -> str:
+    """
+    Format an event's dates as 'Feb 07, 2026 to Feb 16, 2026' (memoized).
+
+    Detailed explanation:
+    1. Both dates are formatted with _fmt_ymd()
+    2. If EITHER one isn't a valid date (e.g. 'TBD'), both are shown
+       as-is ('2026-02-07 to TBD') - never half formatted
+    3. @lru_cache remembers each answer - the same event dates show up in
+       the HTML AND text bodies, so the second lookup is free
+
+    Args:
+        start_date (str): Date string like '2026-02-07'
+        end_date (str): Date string like '2026-02-16'
+
+    Returns:
+        str: Date range for the email
+    """
+    try:
+        return f"{_fmt_ymd(start_date)} to {_fmt_ymd(end_date)}"
+    except (ValueError, TypeError):
+        # If date parsing fails, just show as-is
+        return f"{start_date} to {end_date}"
+
+
+def _now_timestamp() -> str:
+    """Current time for the "Last checked" footer, e.g. 'December 12, 2025 at 04:05 AM'."""
+    return datetime.now().strftime("%B %d, %Y at %I:%M %p")
+
+
+# ============================================================
+# EMAIL TEMPLATES
+# ============================================================
+# The static parts of every email live here, built ONCE when the module
+# loads. The builders below only fill in the {placeholders} with
+# str.format_map() and collect the pieces in a list, which is joined a
+# single time at the end ("".join). That avoids `html += ...` in a loop,
+# which copies the whole growing string on every event.
+#
+# Placeholders ending in _html get html.escape()d text (event names,
+# locations, links come from scraped pages and must not be able to
+# inject markup); the plain text templates use the raw values.
+
+# --- New events email (HTML) ---
+_HTML_HEADER_TMPL = """
     <html>
     <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
         <h2 style="color: #2c3e50;">Hi Ryad,</h2>
-        <p>Found <strong>{event_count}</strong> new event{'s' if event_count > 1 else ''} at <strong>{venue_name}</strong>:</p>
+        <p>Found <strong>{event_count}</strong> new event{plural} at <strong>{venue_name_html}</strong>:</p>
         <p style="color: #7f8c8d; font-size: 0.9em;">Events sorted by crowd size (largest first for taxi planning)</p>
         <hr style="border: 1px solid #eee;">
     """
 
-    # Add each event with formatting
-    for i, event in enumerate(sorted_events, 1):
-        event_name = event.get('event_name', 'Unknown Event')
-        start_date = event.get('start_date', 'TBD')
-        end_date = event.get('end_date', 'TBD')
-        location = event.get('location', 'Location TBD')
-        url = event.get('url', '#')
-
-        # Get crowd size estimate
-        crowd_level, crowd_emoji, crowd_description = _estimate_crowd_size(location)
-
-        # Choose border color based on crowd size
-        if crowd_level == "MASSIVE":
-            border_color = "#e74c3c"  # Red for massive events
-            bg_color = "#ffe6e6"
-        elif crowd_level == "LARGE":
-            border_color = "#f39c12"  # Orange for large events
-            bg_color = "#fff4e6"
-        elif crowd_level == "MEDIUM":
-            border_color = "#3498db"  # Blue for medium events
-            bg_color = "#e6f2ff"
-        else:
-            border_color = "#95a5a6"  # Gray for small events
-            bg_color = "#f8f9fa"
-
-        # Format dates nicely (e.g., "Feb 07, 2026 to Feb 16, 2026")
-        try:
-            start_formatted = datetime.strptime(start_date, '%Y-%m-%d').strftime('%b %d, %Y')
-            end_formatted = datetime.strptime(end_date, '%Y-%m-%d').strftime('%b %d, %Y')
-            date_range = f"{start_formatted} to {end_formatted}"
-        except:
-            # If date parsing fails, just show as-is
-            date_range = f"{start_date} to {end_date}"
-
-        # Add event card with crowd info
-        html += f"""
-        <div style="margin-bottom: 25px; padding: 15px; background-color: {bg_color}; border-left: 5px solid {border_color};">
-            <h3 style="margin-top: 0; color: #2c3e50;">{i}. {event_name}</h3>
-            <p style="margin: 5px 0;">
-                <strong>📅 Dates:</strong> {date_range}<br>
-                <strong>📍 Buildings:</strong> {location}<br>
-                <strong>{crowd_emoji} Crowd Size:</strong> <span style="color: {border_color}; font-weight: bold;">{crowd_level}</span> - {crowd_description}<br>
-                <strong>🔗 Details:</strong> <a href="{url}" style="color: #3498db;">View Event</a>
-            </p>
-        </div>
-        """
-
-    # Close email HTML with footer
-    html += f"""
+# One event card, shared by the new-events email AND the combined email.
+# The two emails differ only in a few layout details (heading size,
+# spacing, label), which come from the _CARD_LAYOUT_* dicts below.
+_EVENT_CARD_TMPL = """
+{indent}<div style="margin-bottom: {margin}; padding: 15px; background-color: {bg_color}; border-left: 5px solid {border_color};">
+{indent}    <{heading} style="margin-top: 0; color: #2c3e50;">{i}. {event_name_html}</{heading}>
+{indent}    <p style="margin: 5px 0;{p_style}">
+{indent}        <strong>📅 Dates:</strong> {date_range_html}<br>
+{indent}        <strong>📍 Buildings:</strong> {location_html}<br>
+{indent}        <strong>{crowd_emoji} {crowd_label}:</strong> <span style="color: {border_color}; font-weight: bold;">{crowd_level}</span> - {crowd_description}<br>
+{indent}        <strong>🔗 Details:</strong> <a href="{url_html}" style="color: #3498db;">View Event</a>
+{indent}    </p>
+{indent}</div>
+{indent}"""
+
+_CARD_LAYOUT_NEW = {'indent': ' ' * 8, 'margin': '25px', 'heading': 'h3', 'p_style': '', 'crowd_label': 'Crowd Size'}
+_CARD_LAYOUT_COMBINED = {'indent': ' ' * 12, 'margin': '20px', 'heading': 'h4', 'p_style': ' font-size: 14px;', 'crowd_label': 'Crowd'}
+
+# Crowd level -> (border_color, bg_color) for event cards.
+# A dict lookup replaces the if/elif chain in every builder loop.
+_CROWD_STYLE = {
+    "MASSIVE": ("#e74c3c", "#ffe6e6"),  # Red for massive events
+    "LARGE": ("#f39c12", "#fff4e6"),    # Orange for large events
+    "MEDIUM": ("#3498db", "#e6f2ff"),   # Blue for medium events
+}
+_DEFAULT_CROWD_STYLE = ("#95a5a6", "#f8f9fa")  # Gray for small events
+
+# Crowd level -> border colour for the "Events Starting Soon" cards.
+# Not the same as _CROWD_STYLE: these cards have no background colour,
+# and everything below LARGE (MEDIUM and SMALL) gets the blue border.
+_UPCOMING_BORDER_COLOR = {
+    "MASSIVE": "#e74c3c",  # Red
+    "LARGE": "#f39c12",    # Orange
+}
+_DEFAULT_UPCOMING_BORDER_COLOR = "#3498db"  # Blue for everything else
+
+_HTML_FOOTER_TMPL = """
         <hr style="border: 1px solid #eee; margin-top: 30px;">
         <p style="color: #7f8c8d; font-size: 0.9em;">
             <strong>Crowd Size Guide:</strong><br>
@@ -363,138 +951,132 @@ def _build_email_html(events: list, venue_name: str) -> str:
     </html>
     """
 
-    return html
-
-
-def _build_email_text(events: list, venue_name: str) -> str:
+# --- New events email (plain text) ---
+_TEXT_HEADER_TMPL = (
+    "Hi Ryad,\n\n"
+    "Found {event_count} new event{plural} at {venue_name}:\n"
+    "(Sorted by crowd size - largest first)\n\n"
+    + "=" * 60 + "\n\n"
+)
+
+_TEXT_EVENT_TMPL = (
+    "{i}. {event_name}\n"
+    "   Dates: {date_range}\n"
+    "   Buildings: {location}\n"
+    "   {crowd_emoji} Crowd: {crowd_level} - {crowd_description}\n"
+    "   Details: {url}\n\n"
+)
+
+_TEXT_FOOTER_TMPL = (
+    "=" * 60 + "\n"
+    "CROWD SIZE GUIDE:\n"
+    "  MASSIVE (🔥🔥🔥) = 50K-100K+ people - PRIME for taxi\n"
+    "  LARGE (🔥🔥) = 20K-50K people - High demand\n"
+    "  MEDIUM (🔥) = 10K-20K people - Good demand\n"
+    "  SMALL (📍) = 5K-10K people - Moderate demand\n"
+    + "=" * 60 + "\n\n"
+    "Your Chicago Event Monitor\n"
+    "Last checked: {timestamp}\n"
+    "Sent via Gmail SMTP\n"
+)
+
+
+def _build_bodies(events: list, venue_name: str, timestamp: str = None) -> tuple:
     """
-    Build plain text email content (for clients that don't support HTML).
+    Build the HTML AND plain text bodies of the new-events email in one pass.
+
+    Detailed explanation:
+    1. Sort the events by crowd size ONCE
+    2. For each event, work out the crowd size, colours and date range ONCE
+    3. Fill the HTML card and the text block from the same values
+    (Building the two bodies separately meant sorting, estimating crowds
+    and formatting dates twice for every event.)
 
     Args:
         events (list): List of event dictionaries
         venue_name (str): Name of venue
+        timestamp (str): "Last checked" time for the footer
+            (default: now - callers pass it in so it's read only once)
 
     Returns:
-        str: Plain text string for email body
+        tuple: (html, text) strings for the email body
     """
-    timestamp = datetime.now().strftime("%B %d, %Y at %I:%M %p")
+    timestamp = timestamp or _now_timestamp()
     event_count = len(events)
 
-    # Sort events by crowd size (largest first)
-    def sort_key(event):
-        crowd_level, _, _ = _estimate_crowd_size(event.get('location', ''))
-        priority = {"MASSIVE": 0, "LARGE": 1, "MEDIUM": 2, "SMALL": 3}
-        return priority.get(crowd_level, 4)
-
-    sorted_events = sorted(events, key=sort_key)
-
-    # Start with header
-    text = f"Hi Ryad,\n\n"
-    text += f"Found {event_count} new event{'s' if event_count > 1 else ''} at {venue_name}:\n"
-    text += f"(Sorted by crowd size - largest first)\n\n"
-    text += "=" * 60 + "\n\n"
-
-    # Add each event
+    # Sort events by crowd size (largest first) for taxi planning
+    sorted_events = _sort_by_crowd(events)
+
+    # Start both bodies with their header
+    header = {
+        'event_count': event_count,
+        'plural': 's' if event_count > 1 else '',
+        'venue_name': venue_name,
+        'venue_name_html': escape(venue_name),
+    }
+    html_parts = [_HTML_HEADER_TMPL.format_map(header)]
+    text_parts = [_TEXT_HEADER_TMPL.format_map(header)]
+
+    # Local names for everything the loop uses on every event.
+    # Python finds local variables faster than module-level names, which
+    # adds up when the loop runs once per event.
+    estimate_crowd_size = _estimate_crowd_size
+    fmt_date_range = _fmt_date_range
+    esc = escape
+    crowd_style = _CROWD_STYLE.get
+    card_layout = _CARD_LAYOUT_NEW
+    render_card = _EVENT_CARD_TMPL.format_map
+    render_text = _TEXT_EVENT_TMPL.format_map
+    html_append = html_parts.append
+    text_append = text_parts.append
+
+    # Add each event to both bodies
     for i, event in enumerate(sorted_events, 1):
         event_name = event.get('event_name', 'Unknown Event')
-        start_date = event.get('start_date', 'TBD')
-        end_date = event.get('end_date', 'TBD')
         location = event.get('location', 'Location TBD')
         url = event.get('url', '#')
+        # Format dates nicely (e.g., "Feb 07, 2026 to Feb 16, 2026")
+        date_range = fmt_date_range(event.get('start_date', 'TBD'), event.get('end_date', 'TBD'))
 
         # Get crowd size estimate
-        crowd_level, crowd_emoji, crowd_description = _estimate_crowd_size(location)
-
-        # Format dates
-        try:
-            start_formatted = datetime.strptime(start_date, '%Y-%m-%d').strftime('%b %d, %Y')
-            end_formatted = datetime.strptime(end_date, '%Y-%m-%d').strftime('%b %d, %Y')
-            date_range = f"{start_formatted} to {end_formatted}"
-        except:
-            date_range = f"{start_date} to {end_date}"
-
-        # Add event details with crowd info
-        text += f"{i}. {event_name}\n"
-        text += f"   Dates: {date_range}\n"
-        text += f"   Buildings: {location}\n"
-        text += f"   {crowd_emoji} Crowd: {crowd_level} - {crowd_description}\n"
-        text += f"   Details: {url}\n\n"
-
-    # Add crowd size guide
-    text += "=" * 60 + "\n"
-    text += "CROWD SIZE GUIDE:\n"
-    text += "  MASSIVE (🔥🔥🔥) = 50K-100K+ people - PRIME for taxi\n"
-    text += "  LARGE (🔥🔥) = 20K-50K people - High demand\n"
-    text += "  MEDIUM (🔥) = 10K-20K people - Good demand\n"
-    text += "  SMALL (📍) = 5K-10K people - Moderate demand\n"
-    text += "=" * 60 + "\n\n"
-
-    # Add footer
-    text += f"Your Chicago Event Monitor\n"
-    text += f"Last checked: {timestamp}\n"
-    text += f"Sent via Gmail SMTP\n"
-
-    return text
-
-
-def main():
-    """
-    Test the Gmail SMTP email notifier with dummy data.
+        crowd_level, crowd_emoji, crowd_description = estimate_crowd_size(location)
 
-    Run this to test email functionality:
-        python email_notifier_gmail.py
-    """
-    logging.basicConfig(level=logging.INFO)
-
-    print(f"\n{'='*60}")
-    print(f"Gmail SMTP Email Notifier - Test Run")
-    print(f"{'='*60}\n")
-
-    # Create dummy event for testing
-    test_events = [
-        {
-            'event_name': 'Test Event - Chicago Auto Show',
-            'start_date': '2026-02-07',
-            'end_date': '2026-02-16',
-            'location': 'South/North Buildings',
-            'url': 'https://www.mccormickplace.com/events/'
-        },
-        {
-            'event_name': 'Test Event - Tech Conference',
-            'start_date': '2026-03-15',
-            'end_date': '2026-03-18',
-            'location': 'West Building',
-            'url': 'https://www.mccormickplace.com/events/'
+        # Choose border color based on crowd size
+        border_color, bg_color = crowd_style(crowd_level, _DEFAULT_CROWD_STYLE)
+
+        # Everything both templates need (each one ignores the keys it doesn't use)
+        # Each field is escaped exactly once, here, for the HTML version
+        fields = {
+            **card_layout,
+            'i': i,
+            'event_name': event_name,
+            'event_name_html': esc(event_name),
+            'date_range': date_range,
+            'date_range_html': esc(date_range),
+            'location': location,
+            'location_html': esc(location),
+            'crowd_emoji': crowd_emoji,
+            'crowd_level': crowd_level,
+            'crowd_description': crowd_description,
+            'border_color': border_color,
+            'bg_color': bg_color,
+            'url': url,
+            'url_html': esc(url, quote=True),
         }
-    ]
-
-    print("Attempting to send test email via Gmail SMTP...\n")
-    success = send_new_events_email(test_events, "McCormick Place (TEST)")
-
-    if success:
-        print("✅ Test email sent successfully via Gmail!")
-        print(f"Check your inbox at: {RECIPIENT_EMAIL}")
-        print("\nThis email should arrive in your PRIMARY inbox")
-        print("(not spam, since it's coming directly from Gmail)")
-    else:
-        print("❌ Failed to send test email.")
-        print("Make sure you have:")
-        print("1. Created a .env file")
-        print("2. Added GMAIL_ADDRESS=your-email@gmail.com")
-        print("3. Added GMAIL_APP_PASSWORD=your-app-password")
-        print("4. Enabled 2FA and generated an App Password in Google Account")
-
-    print(f"\n{'='*60}\n")
+        html_append(render_card(fields))
+        text_append(render_text(fields))
 
+    # Close both bodies with the crowd size guide + footer
+    html_parts.append(_HTML_FOOTER_TMPL.format_map({'timestamp': timestamp}))
+    text_parts.append(_TEXT_FOOTER_TMPL.format_map({'timestamp': timestamp}))
 
-def _build_combined_html(events: list, ohare_data: dict, venue_name: str, upcoming_events: list = None) -> str:
-    """Build HTML email with both events and O'Hare data."""
-    from upcoming_events import format_event_timing, estimate_peak_pickup_time
+    return "".join(html_parts), "".join(text_parts)
 
-    timestamp = datetime.now().strftime("%B %d, %Y at %I:%M %p")
-    upcoming_events = upcoming_events or []
 
-    html = f"""
+# --- Combined email (HTML) ---
+# Same idea as the templates above: static markup lives here, the
+# builder only fills in the {placeholders}.
+_COMBINED_HTML_HEADER = """
     <html>
     <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
         <h2 style="color: #2c3e50;">Hi Ryad,</h2>
@@ -502,77 +1084,31 @@ def _build_combined_html(events: list, ohare_data: dict, venue_name: str, upcomi
         <hr style="border: 1px solid #eee;">
     """
 
-    # ============================================================
-    # UPCOMING EVENTS SECTION (Events starting in next 2 days)
-    # ============================================================
-    if upcoming_events:
-        html += f"""
+_COMBINED_HTML_UPCOMING_HEADER_TMPL = """
         <div style="margin-bottom: 30px; padding: 20px; background-color: #fff3cd; border-left: 5px solid #ffc107;">
             <h3 style="margin-top: 0; color: #2c3e50;">🚕 EVENTS STARTING SOON (Next 2 Days)</h3>
             <p style="margin: 5px 0; font-size: 14px; color: #856404;">
-                <strong>{len(upcoming_events)} event{'s' if len(upcoming_events) != 1 else ''} starting soon - plan your schedule!</strong>
+                <strong>{upcoming_count} event{plural} starting soon - plan your schedule!</strong>
             </p>
         """
 
-        for event in upcoming_events:
-            event_name = event.get('event_name', 'Unknown Event')
-            venue = event.get('venue', 'Unknown Venue')
-            location = event.get('location', venue)
-            timing = format_event_timing(event)
-            pickup_time = estimate_peak_pickup_time(event)
-
-            # Get crowd estimate
-            crowd_level, crowd_emoji, crowd_description = _estimate_crowd_size(location)
-
-            # Color based on crowd size
-            if crowd_level == "MASSIVE":
-                border_color = "#e74c3c"
-            elif crowd_level == "LARGE":
-                border_color = "#f39c12"
-            else:
-                border_color = "#3498db"
-
-            html += f"""
+_COMBINED_HTML_UPCOMING_EVENT_TMPL = """
             <div style="margin: 15px 0; padding: 12px; background-color: #fff; border-left: 3px solid {border_color};">
-                <h4 style="margin: 0 0 8px 0; color: #2c3e50;">{event_name}</h4>
+                <h4 style="margin: 0 0 8px 0; color: #2c3e50;">{event_name_html}</h4>
                 <p style="margin: 3px 0; font-size: 14px;">
                     <strong>📅 When:</strong> {timing}<br>
-                    <strong>📍 Where:</strong> {venue} - {location}<br>
+                    <strong>📍 Where:</strong> {venue_html} - {location_html}<br>
                     <strong>{crowd_emoji} Crowd:</strong> <span style="color: {border_color}; font-weight: bold;">{crowd_level}</span> - {crowd_description}<br>
                     <strong>🚕 Peak Pickup:</strong> {pickup_time}
                 </p>
             </div>
             """
 
-        html += """
+_COMBINED_HTML_UPCOMING_FOOTER = """
         </div>
         """
 
-    # Continue with existing sections (O'Hare, new events...)
-    html += """
-    """
-
-    # Add O'Hare section if available
-    if ohare_data:
-        demand_emoji = ohare_data.get('demand_emoji', '✈️')
-        taxi_demand = ohare_data.get('taxi_demand', 'UNKNOWN')
-        summary = ohare_data.get('summary', 'No data')
-        delayed = ohare_data.get('delayed_flights', 0)
-        cancelled = ohare_data.get('cancelled_flights', 0)
-        peak_hours = ohare_data.get('peak_hours', [])
-
-        # Color based on demand
-        if taxi_demand == "HIGH":
-            border_color = "#e74c3c"
-            bg_color = "#ffe6e6"
-        elif taxi_demand == "MEDIUM":
-            border_color = "#f39c12"
-            bg_color = "#fff4e6"
-        else:
-            border_color = "#27ae60"
-            bg_color = "#e6f9ee"
-
-        html += f"""
+_COMBINED_HTML_OHARE_TMPL = """
         <div style="margin-bottom: 30px; padding: 20px; background-color: {bg_color}; border-left: 5px solid {border_color};">
             <h3 style="margin-top: 0; color: #2c3e50;">✈️ O'Hare Airport Status</h3>
             <p style="margin: 5px 0; font-size: 16px;">
@@ -581,71 +1117,18 @@ def _build_combined_html(events: list, ohare_data: dict, venue_name: str, upcomi
             <p style="margin: 5px 0;">
                 <strong>🚨 Delays:</strong> {delayed} flights<br>
                 <strong>❌ Cancellations:</strong> {cancelled} flights<br>
-                <strong>⏰ Peak Hours:</strong> {', '.join(peak_hours) if peak_hours else 'Normal schedule'}<br>
+                <strong>⏰ Peak Hours:</strong> {peak_hours}<br>
                 <strong>📊 Status:</strong> {summary}
             </p>
         </div>
         """
 
-    # Add events section if available
-    if events:
-        # Sort events by crowd size
-        def sort_key(event):
-            crowd_level, _, _ = _estimate_crowd_size(event.get('location', ''))
-            priority = {"MASSIVE": 0, "LARGE": 1, "MEDIUM": 2, "SMALL": 3}
-            return priority.get(crowd_level, 4)
-
-        sorted_events = sorted(events, key=sort_key)
-
-        html += f"""
-        <h3 style="color: #2c3e50; margin-top: 30px;">🎪 {len(events)} New Event{'s' if len(events) > 1 else ''} at {venue_name}</h3>
+_COMBINED_HTML_EVENTS_HEADER_TMPL = """
+        <h3 style="color: #2c3e50; margin-top: 30px;">🎪 {event_count} New Event{plural} at {venue_name_html}</h3>
         <p style="color: #7f8c8d; font-size: 0.9em;">Sorted by crowd size (largest first)</p>
         """
 
-        # Add each event
-        for i, event in enumerate(sorted_events, 1):
-            event_name = event.get('event_name', 'Unknown Event')
-            start_date = event.get('start_date', 'TBD')
-            end_date = event.get('end_date', 'TBD')
-            location = event.get('location', 'Location TBD')
-            url = event.get('url', '#')
-
-            crowd_level, crowd_emoji, crowd_description = _estimate_crowd_size(location)
-
-            if crowd_level == "MASSIVE":
-                border_color = "#e74c3c"
-                bg_color = "#ffe6e6"
-            elif crowd_level == "LARGE":
-                border_color = "#f39c12"
-                bg_color = "#fff4e6"
-            elif crowd_level == "MEDIUM":
-                border_color = "#3498db"
-                bg_color = "#e6f2ff"
-            else:
-                border_color = "#95a5a6"
-                bg_color = "#f8f9fa"
-
-            try:
-                start_formatted = datetime.strptime(start_date, '%Y-%m-%d').strftime('%b %d, %Y')
-                end_formatted = datetime.strptime(end_date, '%Y-%m-%d').strftime('%b %d, %Y')
-                date_range = f"{start_formatted} to {end_formatted}"
-            except:
-                date_range = f"{start_date} to {end_date}"
-
-            html += f"""
-            <div style="margin-bottom: 20px; padding: 15px; background-color: {bg_color}; border-left: 5px solid {border_color};">
-                <h4 style="margin-top: 0; color: #2c3e50;">{i}. {event_name}</h4>
-                <p style="margin: 5px 0; font-size: 14px;">
-                    <strong>📅 Dates:</strong> {date_range}<br>
-                    <strong>📍 Buildings:</strong> {location}<br>
-                    <strong>{crowd_emoji} Crowd:</strong> <span style="color: {border_color}; font-weight: bold;">{crowd_level}</span> - {crowd_description}<br>
-                    <strong>🔗 Details:</strong> <a href="{url}" style="color: #3498db;">View Event</a>
-                </p>
-            </div>
-            """
-
-    # Footer
-    html += f"""
+_COMBINED_HTML_FOOTER_TMPL = """
         <hr style="border: 1px solid #eee; margin-top: 30px;">
         <p style="color: #7f8c8d; font-size: 0.85em;">
             <strong>Chicago Event Monitor</strong><br>
@@ -656,98 +1139,282 @@ def _build_combined_html(events: list, ohare_data: dict, venue_name: str, upcomi
     </html>
     """
 
-    return html
-
+# --- Combined email (plain text) ---
+_COMBINED_TEXT_HEADER = (
+    "Hi Ryad,\n\n"
+    "Your daily Chicago taxi demand update:\n\n"
+    + "=" * 60 + "\n\n"
+)
+
+_COMBINED_TEXT_UPCOMING_HEADER_TMPL = (
+    "🚕 EVENTS STARTING SOON (Next 2 Days)\n"
+    "{upcoming_count} event{plural} starting soon - plan your schedule!\n\n"
+)
+
+_COMBINED_TEXT_UPCOMING_EVENT_TMPL = (
+    "• {event_name}\n"
+    "  When: {timing}\n"
+    "  Where: {venue} - {location}\n"
+    "  {crowd_emoji} Crowd: {crowd_level} - {crowd_description}\n"
+    "  🚕 Peak Pickup: {pickup_time}\n\n"
+)
+
+_COMBINED_TEXT_OHARE_TMPL = (
+    "✈️ O'HARE AIRPORT STATUS\n"
+    "{demand_emoji} Taxi Demand: {taxi_demand}\n"
+    "Delays: {delayed} flights\n"
+    "Cancellations: {cancelled} flights\n"
+    "Peak Hours: {peak_hours}\n"
+    "Status: {summary}\n\n"
+    + "=" * 60 + "\n\n"
+)
+
+_COMBINED_TEXT_EVENTS_HEADER_TMPL = (
+    "🎪 {event_count} NEW EVENT{plural} AT {venue_name}\n"
+    "(Sorted by crowd size)\n\n"
+)
+
+_COMBINED_TEXT_FOOTER_TMPL = (
+    "=" * 60 + "\n"
+    "Chicago Event Monitor\n"
+    "Last checked: {timestamp}\n"
+)
+
+# --- Combined email with nothing to report (heartbeat) ---
+# Exactly what _build_combined_bodies() would produce with no events, no
+# O'Hare data and no upcoming events - assembled once here so quiet days
+# skip the builder entirely.
+_HEARTBEAT_HTML_TMPL = _COMBINED_HTML_HEADER + """
+    """ + _COMBINED_HTML_FOOTER_TMPL
+_HEARTBEAT_TEXT_TMPL = _COMBINED_TEXT_HEADER + _COMBINED_TEXT_FOOTER_TMPL
+
+
+def _build_combined_bodies(events: list, ohare_data: dict, venue_name: str, upcoming_events: list = None, timestamp: str = None) -> tuple:
+    """
+    Build the HTML AND plain text bodies of the combined email in one pass.
 
-def _build_combined_text(events: list, ohare_data: dict, venue_name: str, upcoming_events: list = None) -> str:
-    """Build plain text email with both events and O'Hare data."""
-    from upcoming_events import format_event_timing, estimate_peak_pickup_time
+    Same idea as _build_bodies(): every section (upcoming events, O'Hare,
+    new events) is worked out once and written into both bodies, so each
+    event is sorted, crowd-estimated and date-formatted a single time.
 
-    timestamp = datetime.now().strftime("%B %d, %Y at %I:%M %p")
+    Returns:
+        tuple: (html, text) strings for the email body
+    """
+    timestamp = timestamp or _now_timestamp()
     upcoming_events = upcoming_events or []
+    upcoming_count = len(upcoming_events)
+    event_count = len(events) if events else 0
 
-    text = "Hi Ryad,\n\n"
-    text += "Your daily Chicago taxi demand update:\n\n"
-    text += "=" * 60 + "\n\n"
+    # Collect pieces in lists, join once at the end
+    html_parts = [_COMBINED_HTML_HEADER]
+    text_parts = [_COMBINED_TEXT_HEADER]
 
-    # Add upcoming events section
+    # ============================================================
+    # UPCOMING EVENTS SECTION (Events starting in next 2 days)
+    # ============================================================
     if upcoming_events:
-        text += "🚕 EVENTS STARTING SOON (Next 2 Days)\n"
-        text += f"{len(upcoming_events)} event{'s' if len(upcoming_events) != 1 else ''} starting soon - plan your schedule!\n\n"
+        header = {
+            'upcoming_count': upcoming_count,
+            'plural': 's' if upcoming_count != 1 else '',
+        }
+        html_parts.append(_COMBINED_HTML_UPCOMING_HEADER_TMPL.format_map(header))
+        text_parts.append(_COMBINED_TEXT_UPCOMING_HEADER_TMPL.format_map(header))
+
+        today = datetime.now().date()  # Same "today" for every event's timing
+
+        # Local names for everything the loop uses (faster lookups, see _build_bodies)
+        estimate_crowd_size = _estimate_crowd_size
+        esc = escape
+        upcoming_border = _UPCOMING_BORDER_COLOR.get
+        event_timing = format_event_timing
+        pickup_time = estimate_peak_pickup_time
+        render_html = _COMBINED_HTML_UPCOMING_EVENT_TMPL.format_map
+        render_text = _COMBINED_TEXT_UPCOMING_EVENT_TMPL.format_map
+        html_append = html_parts.append
+        text_append = text_parts.append
 
         for event in upcoming_events:
-            event_name = event.get('event_name', 'Unknown Event')
             venue = event.get('venue', 'Unknown Venue')
             location = event.get('location', venue)
-            timing = format_event_timing(event)
-            pickup_time = estimate_peak_pickup_time(event)
 
-            crowd_level, crowd_emoji, crowd_description = _estimate_crowd_size(location)
+            # Get crowd estimate
+            crowd_level, crowd_emoji, crowd_description = estimate_crowd_size(location)
+
+            # Color based on crowd size
+            border_color = upcoming_border(crowd_level, _DEFAULT_UPCOMING_BORDER_COLOR)
 
-            text += f"• {event_name}\n"
-            text += f"  When: {timing}\n"
-            text += f"  Where: {venue} - {location}\n"
-            text += f"  {crowd_emoji} Crowd: {crowd_level} - {crowd_description}\n"
-            text += f"  🚕 Peak Pickup: {pickup_time}\n\n"
+            event_name = event.get('event_name', 'Unknown Event')
+            fields = {
+                'event_name': event_name,
+                'event_name_html': esc(event_name),
+                'timing': event_timing(event, today),
+                'venue': venue,
+                'venue_html': esc(venue),
+                'location': location,
+                'location_html': esc(location),
+                'crowd_emoji': crowd_emoji,
+                'crowd_level': crowd_level,
+                'crowd_description': crowd_description,
+                'border_color': border_color,
+                'pickup_time': pickup_time(event),
+            }
+            html_append(render_html(fields))
+            text_append(render_text(fields))
+
+        html_parts.append(_COMBINED_HTML_UPCOMING_FOOTER)
+        text_parts.append("=" * 60 + "\n\n")
 
-        text += "=" * 60 + "\n\n"
+    # Continue with existing sections (O'Hare, new events...)
+    html_parts.append("""
+    """)
 
-    # Add O'Hare section
+    # ============================================================
+    # O'HARE SECTION (if available)
+    # ============================================================
     if ohare_data:
-        demand_emoji = ohare_data.get('demand_emoji', '✈️')
         taxi_demand = ohare_data.get('taxi_demand', 'UNKNOWN')
-        summary = ohare_data.get('summary', 'No data')
-        delayed = ohare_data.get('delayed_flights', 0)
-        cancelled = ohare_data.get('cancelled_flights', 0)
         peak_hours = ohare_data.get('peak_hours', [])
 
-        text += "✈️ O'HARE AIRPORT STATUS\n"
-        text += f"{demand_emoji} Taxi Demand: {taxi_demand}\n"
-        text += f"Delays: {delayed} flights\n"
-        text += f"Cancellations: {cancelled} flights\n"
-        text += f"Peak Hours: {', '.join(peak_hours) if peak_hours else 'Normal schedule'}\n"
-        text += f"Status: {summary}\n\n"
-        text += "=" * 60 + "\n\n"
-
-    # Add events section
-    if events:
-        def sort_key(event):
-            crowd_level, _, _ = _estimate_crowd_size(event.get('location', ''))
-            priority = {"MASSIVE": 0, "LARGE": 1, "MEDIUM": 2, "SMALL": 3}
-            return priority.get(crowd_level, 4)
+        # Color based on demand
+        if taxi_demand == "HIGH":
+            border_color = "#e74c3c"
+            bg_color = "#ffe6e6"
+        elif taxi_demand == "MEDIUM":
+            border_color = "#f39c12"
+            bg_color = "#fff4e6"
+        else:
+            border_color = "#27ae60"
+            bg_color = "#e6f9ee"
 
-        sorted_events = sorted(events, key=sort_key)
+        fields = {
+            'demand_emoji': ohare_data.get('demand_emoji', '✈️'),
+            'taxi_demand': taxi_demand,
+            'summary': ohare_data.get('summary', 'No data'),
+            'delayed': ohare_data.get('delayed_flights', 0),
+            'cancelled': ohare_data.get('cancelled_flights', 0),
+            'peak_hours': ', '.join(peak_hours) if peak_hours else 'Normal schedule',
+            'border_color': border_color,
+            'bg_color': bg_color,
+        }
+        html_parts.append(_COMBINED_HTML_OHARE_TMPL.format_map(fields))
+        text_parts.append(_COMBINED_TEXT_OHARE_TMPL.format_map(fields))
 
-        text += f"🎪 {len(events)} NEW EVENT{'S' if len(events) > 1 else ''} AT {venue_name.upper()}\n"
-        text += "(Sorted by crowd size)\n\n"
+    # ============================================================
+    # NEW EVENTS SECTION (if available)
+    # ============================================================
+    if events:
+        # Sort events by crowd size (largest first) for taxi planning
+        sorted_events = _sort_by_crowd(events)
+
+        html_parts.append(_COMBINED_HTML_EVENTS_HEADER_TMPL.format_map({
+            'event_count': event_count,
+            'plural': 's' if event_count > 1 else '',
+            'venue_name_html': escape(venue_name),
+        }))
+        text_parts.append(_COMBINED_TEXT_EVENTS_HEADER_TMPL.format_map({
+            'event_count': event_count,
+            'plural': 'S' if event_count > 1 else '',
+            'venue_name': venue_name.upper(),
+        }))
+
+        # Local names for everything the loop uses (faster lookups, see _build_bodies)
+        estimate_crowd_size = _estimate_crowd_size
+        fmt_date_range = _fmt_date_range
+        esc = escape
+        crowd_style = _CROWD_STYLE.get
+        card_layout = _CARD_LAYOUT_COMBINED
+        render_card = _EVENT_CARD_TMPL.format_map
+        render_text = _TEXT_EVENT_TMPL.format_map
+        html_append = html_parts.append
+        text_append = text_parts.append
 
+        # Add each event
         for i, event in enumerate(sorted_events, 1):
             event_name = event.get('event_name', 'Unknown Event')
-            start_date = event.get('start_date', 'TBD')
-            end_date = event.get('end_date', 'TBD')
             location = event.get('location', 'Location TBD')
             url = event.get('url', '#')
+            date_range = fmt_date_range(event.get('start_date', 'TBD'), event.get('end_date', 'TBD'))
+
+            crowd_level, crowd_emoji, crowd_description = estimate_crowd_size(location)
+
+            border_color, bg_color = crowd_style(crowd_level, _DEFAULT_CROWD_STYLE)
+
+            fields = {
+                **card_layout,
+                'i': i,
+                'event_name': event_name,
+                'event_name_html': esc(event_name),
+                'date_range': date_range,
+                'date_range_html': esc(date_range),
+                'location': location,
+                'location_html': esc(location),
+                'crowd_emoji': crowd_emoji,
+                'crowd_level': crowd_level,
+                'crowd_description': crowd_description,
+                'border_color': border_color,
+                'bg_color': bg_color,
+                'url': url,
+                'url_html': esc(url, quote=True),
+            }
+            html_append(render_card(fields))
+            # Same per-event layout as the new-events text email
+            text_append(render_text(fields))
 
-            crowd_level, crowd_emoji, crowd_description = _estimate_crowd_size(location)
+    # Footer
+    html_parts.append(_COMBINED_HTML_FOOTER_TMPL.format_map({'timestamp': timestamp}))
+    text_parts.append(_COMBINED_TEXT_FOOTER_TMPL.format_map({'timestamp': timestamp}))
 
-            try:
-                start_formatted = datetime.strptime(start_date, '%Y-%m-%d').strftime('%b %d, %Y')
-                end_formatted = datetime.strptime(end_date, '%Y-%m-%d').strftime('%b %d, %Y')
-                date_range = f"{start_formatted} to {end_formatted}"
-            except:
-                date_range = f"{start_date} to {end_date}"
-
-            text += f"{i}. {event_name}\n"
-            text += f"   Dates: {date_range}\n"
-            text += f"   Buildings: {location}\n"
-            text += f"   {crowd_emoji} Crowd: {crowd_level} - {crowd_description}\n"
-            text += f"   Details: {url}\n\n"
-
-    text += "=" * 60 + "\n"
-    text += f"Chicago Event Monitor\n"
-    text += f"Last checked: {timestamp}\n"
-
-    return text
+    return "".join(html_parts), "".join(text_parts)
+
+
+def main():
+    """
+    Test the Gmail SMTP email notifier with dummy data.
+
+    Run this to test email functionality:
+        python email_notifier_gmail.py
+    """
+    logging.basicConfig(level=logging.INFO)
+
+    print(f"\n{'='*60}")
+    print(f"Gmail SMTP Email Notifier - Test Run")
+    print(f"{'='*60}\n")
+
+    # Create dummy event for testing
+    test_events = [
+        {
+            'event_name': 'Test Event - Chicago Auto Show',
+            'start_date': '2026-02-07',
+            'end_date': '2026-02-16',
+            'location': 'South/North Buildings',
+            'url': 'https://www.mccormickplace.com/events/'
+        },
+        {
+            'event_name': 'Test Event - Tech Conference',
+            'start_date': '2026-03-15',
+            'end_date': '2026-03-18',
+            'location': 'West Building',
+            'url': 'https://www.mccormickplace.com/events/'
+        }
+    ]
+
+    print("Attempting to send test email via Gmail SMTP...\n")
+    success = send_new_events_email(test_events, "McCormick Place (TEST)")
+
+    if success:
+        print("✅ Test email sent successfully via Gmail!")
+        print(f"Check your inbox at: {', '.join(RECIPIENT_EMAILS)}")
+        print("\nThis email should arrive in your PRIMARY inbox")
+        print("(not spam, since it's coming directly from Gmail)")
+    else:
+        print("❌ Failed to send test email.")
+        print("Make sure you have:")
+        print("1. Created a .env file")
+        print("2. Added GMAIL_ADDRESS=your-email@gmail.com")
+        print("3. Added GMAIL_APP_PASSWORD=your-app-password")
+        print("4. Enabled 2FA and generated an App Password in Google Account")
+
+    print(f"\n{'='*60}\n")
 
 
 if __name__ == "__main__":
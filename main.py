@@ -11,12 +11,12 @@ Uses Gmail SMTP for email notifications (more reliable than SendGrid).
 """
 
 import logging
-from storage import load_events, save_events, find_new_events
+from concurrent.futures import ThreadPoolExecutor
+from storage import load_events, load_date_index, save_events, event_keys, find_new_events_keyed
 from scrapers.mccormick import scrape_mccormick_place
 from scrapers.united_center import scrape_united_center
 from scrapers.ohare import scrape_ohare_flights
-from email_notifier_gmail import send_combined_email
-from upcoming_events import get_upcoming_events
+from email_notifier_gmail import send_combined_email, wait_for_emails
 
 
 def main():
@@ -36,33 +36,62 @@ def main():
     # ============================================================
     stored = load_events()
 
+    # Stored events grouped by start date - built while the file was read,
+    # so STEP 7 only has to look up the next 3 days
+    stored_by_date = load_date_index()
+
+    # Index the stored events once: a set of (event_name, start_date)
+    # per venue, so finding new events is a fast set lookup per event
+    stored_mccormick_keys = event_keys(stored.get('mccormick_place', []))
+    stored_united_center_keys = event_keys(stored.get('united_center', []))
+
     # ============================================================
     # STEP 2: Scrape McCormick Place for events
     # ============================================================
-    scraped_mccormick = scrape_mccormick_place()
+    # Start ALL THREE network calls now (McCormick, United Center, O'Hare),
+    # each in its own background thread. They don't depend on each other
+    # and spend most of their time waiting on the network, so the total
+    # wait is the slowest one instead of all three added together.
+    # Results are collected in STEP 2, 4 and 6 below.
+    # (Threads rather than asyncio/aiohttp: requests lets other threads run
+    # while it waits on the network, so three threads overlap the three
+    # calls just as well - and all scrapers share one pooled session from
+    # scrapers/_http.py, so no extra dependency or async rewrite is needed.)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        mccormick_future = executor.submit(scrape_mccormick_place)
+        united_center_future = executor.submit(scrape_united_center)
+        ohare_future = executor.submit(scrape_ohare_flights)
+
+        scraped_mccormick = mccormick_future.result()
+        scraped_united_center = united_center_future.result()
+        ohare_data = ohare_future.result()
 
     # ============================================================
     # STEP 3: Find new McCormick Place events (not in storage)
     # ============================================================
-    new_mccormick_events = find_new_events(scraped_mccormick, stored.get('mccormick_place', []))
+    # When the McCormick calendar hasn't changed, the scraper already got a
+    # "304 Not Modified" and skipped the download + JSON parse (see its
+    # conditional GET); this check is then just a few hundred set lookups.
+    # The rest of the run still happens - the daily email goes out either way.
+    new_mccormick_events = find_new_events_keyed(scraped_mccormick, stored_mccormick_keys)
 
     if new_mccormick_events:
-        logging.info(f"Found {len(new_mccormick_events)} new McCormick Place events")
+        logging.info("Found %s new McCormick Place events", len(new_mccormick_events))
     else:
         logging.info("No new McCormick Place events")
 
     # ============================================================
     # STEP 4: Scrape United Center for events
     # ============================================================
-    scraped_united_center = scrape_united_center()
+    # (already fetched in parallel in STEP 2 -> scraped_united_center)
 
     # ============================================================
     # STEP 5: Find new United Center events (not in storage)
     # ============================================================
-    new_united_center_events = find_new_events(scraped_united_center, stored.get('united_center', []))
+    new_united_center_events = find_new_events_keyed(scraped_united_center, stored_united_center_keys)
 
     if new_united_center_events:
-        logging.info(f"Found {len(new_united_center_events)} new United Center events")
+        logging.info("Found %s new United Center events", len(new_united_center_events))
     else:
         logging.info("No new United Center events")
 
@@ -72,21 +101,24 @@ def main():
     # ============================================================
     # STEP 6: Check O'Hare flight status
     # ============================================================
-    ohare_data = scrape_ohare_flights()
+    # (already fetched in parallel in STEP 2 -> ohare_data)
 
     if ohare_data:
-        logging.info(f"O'Hare status: {ohare_data.get('summary', 'Unknown')}")
-        logging.info(f"Taxi demand level: {ohare_data.get('taxi_demand', 'Unknown')}")
+        logging.info("O'Hare status: %s", ohare_data.get('summary', 'Unknown'))
+        logging.info("Taxi demand level: %s", ohare_data.get('taxi_demand', 'Unknown'))
     else:
         logging.info("O'Hare monitoring not configured (requires Aviationstack API key)")
 
     # ============================================================
     # STEP 7: Find upcoming events (starting in next 2 days)
     # ============================================================
-    upcoming = get_upcoming_events(stored, days_ahead=2)
+    # Imported here, where it's used, like the alert email in ohare_check.py
+    from upcoming_events import get_upcoming_events
+
+    upcoming = get_upcoming_events(stored, days_ahead=2, by_date=stored_by_date)
 
     if upcoming:
-        logging.info(f"Found {len(upcoming)} events starting in next 2 days")
+        logging.info("Found %s events starting in next 2 days", len(upcoming))
     else:
         logging.info("No events starting in next 2 days")
 
@@ -103,44 +135,52 @@ def main():
     logging.info("Sending daily summary email...")
 
     if upcoming:
-        logging.info(f"  - Including {len(upcoming)} UPCOMING events (next 2 days)")
+        logging.info("  - Including %s UPCOMING events (next 2 days)", len(upcoming))
 
     if new_events:
-        logging.info(f"  - Including {len(new_events)} NEW events")
+        logging.info("  - Including %s NEW events", len(new_events))
     else:
         logging.info("  - No new events (will send summary anyway)")
 
     if ohare_data:
         demand = ohare_data.get('taxi_demand', 'UNKNOWN')
-        logging.info(f"  - O'Hare taxi demand: {demand}")
-
-    success = send_combined_email(new_events, ohare_data, "McCormick Place", upcoming_events=upcoming)
+        logging.info("  - O'Hare taxi demand: %s", demand)
 
-    if success:
-        logging.info("✅ Daily summary email sent successfully")
-    else:
-        logging.error("❌ Failed to send daily summary email")
+    # Hand the email to the notifier's background sender thread and carry
+    # on right away (wait=False): the events file is saved (STEP 9) while
+    # Gmail is busy, then we wait for the send to finish below.
+    queued = send_combined_email(new_events, ohare_data, "McCormick Place", upcoming_events=upcoming, wait=False)
 
     # ============================================================
     # STEP 9: Update storage with latest events
     # ============================================================
+    # (runs while the email is being sent)
     stored['mccormick_place'] = scraped_mccormick
     stored['united_center'] = scraped_united_center
     save_events(stored)
 
+    # Wait for the email so it's delivered (or has failed) before we
+    # report on it
+    success = wait_for_emails() and queued
+
+    if success:
+        logging.info("✅ Daily summary email sent successfully")
+    else:
+        logging.error("❌ Failed to send daily summary email")
+
     # ============================================================
     # STEP 10: Log summary
     # ============================================================
-    logging.info(f"="*60)
-    logging.info(f"Summary:")
-    logging.info(f"  - Upcoming events (next 2 days): {len(upcoming)}")
-    logging.info(f"  - McCormick Place: {len(new_mccormick_events)} new out of {len(scraped_mccormick)} total")
-    logging.info(f"  - United Center: {len(new_united_center_events)} new out of {len(scraped_united_center)} total")
-    logging.info(f"  - Total new events: {len(new_events)}")
+    logging.info("="*60)
+    logging.info("Summary:")
+    logging.info("  - Upcoming events (next 2 days): %s", len(upcoming))
+    logging.info("  - McCormick Place: %s new out of %s total", len(new_mccormick_events), len(scraped_mccormick))
+    logging.info("  - United Center: %s new out of %s total", len(new_united_center_events), len(scraped_united_center))
+    logging.info("  - Total new events: %s", len(new_events))
     if ohare_data:
-        logging.info(f"  - O'Hare: {ohare_data.get('delayed_flights', 0)} delays, "
-                    f"{ohare_data.get('cancelled_flights', 0)} cancellations")
-    logging.info(f"="*60)
+        logging.info("  - O'Hare: %s delays, %s cancellations",
+                    ohare_data.get('delayed_flights', 0), ohare_data.get('cancelled_flights', 0))
+    logging.info("="*60)
 
 
 if __name__ == "__main__":
@@ -13,7 +13,6 @@ Created: December 6, 2025
 
 import logging
 from scrapers.ohare import scrape_ohare_flights
-from email_notifier_gmail import send_combined_email
 
 
 def main():
@@ -34,10 +33,10 @@ def main():
     ohare_data = scrape_ohare_flights()
 
     if ohare_data:
-        logging.info(f"O'Hare status: {ohare_data.get('summary', 'Unknown')}")
-        logging.info(f"Taxi demand level: {ohare_data.get('taxi_demand', 'Unknown')}")
-        logging.info(f"Delayed flights: {ohare_data.get('delayed_flights', 0)}")
-        logging.info(f"Cancelled flights: {ohare_data.get('cancelled_flights', 0)}")
+        logging.info("O'Hare status: %s", ohare_data.get('summary', 'Unknown'))
+        logging.info("Taxi demand level: %s", ohare_data.get('taxi_demand', 'Unknown'))
+        logging.info("Delayed flights: %s", ohare_data.get('delayed_flights', 0))
+        logging.info("Cancelled flights: %s", ohare_data.get('cancelled_flights', 0))
     else:
         logging.info("O'Hare monitoring not configured (requires Aviationstack API key)")
         return
@@ -50,7 +49,13 @@ def main():
     if taxi_demand == 'HIGH':
         logging.info("HIGH taxi demand detected - sending alert email")
 
+        # Imported here, not at the top: most noon runs send nothing, so
+        # they skip loading the email code (smtplib, email package, ...)
+        from email_notifier_gmail import send_combined_email
+
         # Send email with ONLY O'Hare data (no events)
+        # (the email module's own sender thread does the SMTP work;
+        # this waits for its result)
         success = send_combined_email(
             new_events=None,  # No events in noon check
             ohare_data=ohare_data,
@@ -62,16 +67,16 @@ def main():
         else:
             logging.error("❌ Failed to send midday alert")
     else:
-        logging.info(f"Taxi demand is {taxi_demand} - no alert needed (only alerting on HIGH)")
+        logging.info("Taxi demand is %s - no alert needed (only alerting on HIGH)", taxi_demand)
 
     # ============================================================
     # Summary
     # ============================================================
     logging.info("="*60)
     logging.info("Midday check complete")
-    logging.info(f"O'Hare: {ohare_data.get('delayed_flights', 0)} delays, "
-                f"{ohare_data.get('cancelled_flights', 0)} cancellations")
-    logging.info(f"Taxi demand: {taxi_demand}")
+    logging.info("O'Hare: %s delays, %s cancellations",
+                ohare_data.get('delayed_flights', 0), ohare_data.get('cancelled_flights', 0))
+    logging.info("Taxi demand: %s", taxi_demand)
     logging.info("="*60)
 
 
@@ -0,0 +1,173 @@
+"""
+Shared HTTP session for all scrapers.
+
+Every scraper used to call requests.get(), which opens a brand-new
+connection (DNS lookup + TCP handshake + TLS handshake) each time.
+A requests.Session keeps connections open and reuses them ("keep-alive"),
+so repeat calls - retries, the next scraper run in the same process,
+debug scripts calling a scraper twice - skip that setup cost.
+
+How it works:
+1. get_session() builds ONE session the first time it is called
+2. The session retries temporary server errors (429/5xx) automatically,
+   with a growing pause between tries (or as long as the server's
+   Retry-After header asks)
+3. Every later call returns that same session
+
+get_json_cached() adds a small on-disk cache on top: a repeat request
+(same URL + parameters) within a few minutes is answered from a JSON file
+instead of the network - handy for re-runs while developing, and it
+saves API quota.
+
+Usage (inside a scraper):
+    from scrapers._http import get_session
+    response = get_session().get(url, timeout=REQUEST_TIMEOUT)
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+from functools import lru_cache
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import USER_AGENT
+from utils.json_io import loads  # orjson when installed, else json
+
+# Set up logger for this module
+logger = logging.getLogger(__name__)
+
+# Connection pool sizes
+POOL_CONNECTIONS = 4  # How many different hosts to keep pools for
+POOL_MAXSIZE = 8  # Open connections kept per host
+
+# Automatic retries for temporary server problems
+RETRY_TOTAL = 5  # Retries after the first try (6 tries max)
+RETRY_BACKOFF_FACTOR = 0.5  # Pause ~1s, 2s, 4s, ... between tries
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)  # "Busy / try again" replies
+
+# On-disk response cache (see get_json_cached)
+CACHE_DIR = "data/cache"
+
+
+@lru_cache(maxsize=1)
+def get_session() -> requests.Session:
+    """
+    Return the process-wide HTTP session (created on first use).
+
+    Safe to use from several scraper threads at once (main.py runs the
+    scrapers in parallel); they talk to different hosts, so each gets
+    its own connection pool inside the session.
+
+    Returns:
+        requests.Session: Shared session with browser User-Agent,
+                          connection pooling and automatic retries
+    """
+    session = requests.Session()
+    session.headers.update({'User-Agent': USER_AGENT})
+
+    retry = Retry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(['GET', 'HEAD']),  # Only safe-to-repeat requests
+        respect_retry_after_header=True,  # 429/503 "Retry-After: N" -> wait N seconds
+        raise_on_status=False,  # Out of retries -> hand back the last response, so
+                                # raise_for_status() gives the usual HTTPError (429, 503, ...)
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)  # Aviationstack's free tier is http only
+
+    return session
+
+
+def _cache_path(url: str, params: dict) -> str:
+    """
+    Pick the cache file for one request.
+
+    The URL + sorted parameters are hashed, so the same request always maps
+    to the same file (and API keys never show up in file names).
+
+    Args:
+        url (str): Request URL
+        params (dict): Query parameters
+
+    Returns:
+        str: Path like "data/cache/3f2a...c9.json"
+    """
+    request_text = f"{url}?{urlencode(sorted(params.items()))}"
+    key = hashlib.sha1(request_text.encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+def get_json_cached(url: str, params: dict, ttl_seconds: int, session: requests.Session = None, **kwargs):
+    """
+    GET a JSON API, reusing a saved response younger than ttl_seconds.
+
+    How it works:
+    1. Look for a cache file for this URL + parameters
+    2. If it was written less than ttl_seconds ago, return its contents
+       (no network call, no API quota used)
+    3. Otherwise fetch, check the status, save the JSON, and return it
+
+    Network/HTTP errors are raised exactly like session.get() +
+    raise_for_status(), so callers keep their existing error handling.
+    Cache problems (unreadable file, full disk) are only logged.
+
+    Args:
+        url (str): Request URL
+        params (dict): Query parameters (part of the cache key)
+        ttl_seconds (int): How long a saved response stays fresh
+        session (requests.Session): Session to fetch with (default: shared one)
+        **kwargs: Passed on to session.get() (headers, timeout, ...)
+
+    Returns:
+        Parsed JSON (usually a dict)
+
+    Example:
+        data = get_json_cached(API_ENDPOINT, params, 300, timeout=15)
+    """
+    cache_path = _cache_path(url, params)
+
+    # STEP 1-2: Fresh cached copy? (a missing file just means "fetch")
+    try:
+        age_seconds = time.time() - os.path.getmtime(cache_path)
+        if 0 <= age_seconds < ttl_seconds:
+            with open(cache_path, 'r') as f:
+                data = json.load(f)
+            logger.info(f"Using cached response for {url} from {int(age_seconds)}s ago")
+            return data
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable cache file {cache_path}: {e}")
+
+    # STEP 3: Fetch from the network
+    # (the `with` block returns the connection to the pool right away,
+    # even when raise_for_status() raises)
+    http = session or get_session()
+    with http.get(url, params=params, **kwargs) as response:
+        response.raise_for_status()
+        data = loads(response.content)
+
+    # Save it (temporary file + swap, so a crash never leaves half a file)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        temp_file = cache_path + '.tmp'
+        with open(temp_file, 'w') as f:
+            json.dump(data, f)
+        os.replace(temp_file, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not save cache file {cache_path}: {e}")
+
+    return data
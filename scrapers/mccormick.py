@@ -16,9 +16,22 @@ Author: Ryad (with Claude Code)
 Created: November 24, 2025
 """
 
+import os  # For creating the cache folder / swapping in the new cache file
+import json  # For reading/writing the API cache file
 import requests  # For making HTTP requests to the API
 import logging  # For logging info/errors (better than print statements)
-from datetime import datetime, timedelta  # For date comparison
+from datetime import datetime  # For today's date
+from scrapers._http import get_session  # Shared, pooled HTTP session
+from utils.json_io import loads  # orjson when installed, else json
+
+# ijson is an OPTIONAL package: it reads the JSON one event at a time
+# straight off the network, so the full response (raw bytes + the parsed
+# list) never has to sit in memory at once. Used instead of loads()
+# when installed.
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Set up logger for this module
 logger = logging.getLogger(__name__)
@@ -36,8 +49,74 @@ REQUEST_TIMEOUT = 10
 # Pretend to be a web browser (some sites block requests without this)
 USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
 
+# Where we remember the last API response (see _load_cache / _save_cache)
+# The calendar only changes a few times a week, so most runs can ask the
+# server "has it changed since last time?" and skip the download if not.
+CACHE_FILE = "data/mccormick_api_cache.json"
+
+# Request headers - built once here instead of on every call
+# - Accept: we want JSON (skips content negotiation on the server)
+# - Accept-Encoding: ask for a compressed response. The JSON for
+#   ~300 events shrinks several times with gzip, and requests
+#   unzips it for us. DEFAULT_ACCEPT_ENCODING only lists formats
+#   we can actually decode ("br" appears if brotli is installed).
+_HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept': 'application/json',
+    'Accept-Encoding': requests.utils.DEFAULT_ACCEPT_ENCODING,
+}
+
+# Event detail link, filled in with .format() for each event
+# Format: https://www.mccormickplace.com/events/?eventId=12345&orgCode=10
+_DETAIL_URL_TEMPLATE = DETAIL_URL_BASE + "?eventId={event_id}&orgCode={org_code}"
+
+
+def _load_cache() -> dict:
+    """
+    Load the cached API response from CACHE_FILE.
+
+    Returns:
+        dict: {'etag': ..., 'last_modified': ..., 'events': [...]}
+              or {} if there is no usable cache (first run, bad file, ...)
+    """
+    try:
+        with open(CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+        if isinstance(cache, dict) and isinstance(cache.get('events'), list):
+            return cache
+    except FileNotFoundError:
+        pass  # First run - nothing cached yet
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable McCormick cache %s: %s", CACHE_FILE, e)
+    return {}
+
+
+def _save_cache(etag: str, last_modified: str, events: list) -> None:
+    """
+    Remember this API response so the next run can send a conditional GET.
+
+    Written to a temporary file first, then swapped in, so a crash
+    mid-write never leaves a half-written cache behind.
+
+    Args:
+        etag (str): ETag header from the response (or None)
+        last_modified (str): Last-Modified header from the response (or None)
+        events (list): Standardized upcoming events built from the response
+    """
+    if not etag and not last_modified:
+        return  # Server gave us nothing to validate against - don't cache
 
-def scrape_mccormick_place() -> list:
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        temp_file = CACHE_FILE + '.tmp'
+        with open(temp_file, 'w') as f:
+            json.dump({'etag': etag, 'last_modified': last_modified, 'events': events}, f)
+        os.replace(temp_file, CACHE_FILE)
+    except OSError as e:
+        logger.warning("Could not save McCormick cache %s: %s", CACHE_FILE, e)
+
+
+def scrape_mccormick_place(session: requests.Session = None) -> list:
     """
     Scrape all upcoming events from McCormick Place.
 
@@ -47,6 +126,12 @@ def scrape_mccormick_place() -> list:
     3. Converts each event to our standard dictionary format
     4. Returns the list of upcoming events
 
+    Args:
+        session (requests.Session): Optional shared HTTP session.
+            Passing the same session to several scrapers lets them reuse
+            open connections (no new TCP/TLS handshake for each one).
+            If None, the shared scraper session (scrapers/_http.py) is used.
+
     Returns:
         list: List of event dictionaries, each with these keys:
             - event_name (str): Name of the event
@@ -78,86 +163,128 @@ def scrape_mccormick_place() -> list:
         # STEP 1: Make HTTP request to the API
         # ============================================================
 
-        # Set headers to look like a browser request
-        headers = {'User-Agent': USER_AGENT}
+        # Start from the module-level headers (browser User-Agent,
+        # compressed JSON). Copied so the cache headers below don't leak
+        # into the next call.
+        headers = dict(_HEADERS)
+
+        # Conditional GET: if we have a cached copy, tell the server which
+        # version we have. If nothing changed it answers "304 Not Modified"
+        # with an empty body, and we reuse the cached events.
+        cache = _load_cache()
+        if cache.get('etag'):
+            headers['If-None-Match'] = cache['etag']
+        if cache.get('last_modified'):
+            headers['If-Modified-Since'] = cache['last_modified']
+
+        # Use the session we were given, else the shared scraper session
+        # (keeps the connection open for the next call)
+        http = session or get_session()
 
         # Make the GET request to the API
         # - API_URL: where to get the data from
-        # - headers: pretend to be a browser
+        # - headers: pretend to be a browser, ask for compressed JSON
         # - timeout: give up after 10 seconds if no response
-        response = requests.get(
+        # - stream: with ijson, don't download the body up front - we read
+        #   it piece by piece while parsing (STEP 2)
+        # (The `with` block hands the connection back to the shared pool as
+        # soon as we're done with it - also on the 304 early return and
+        # when raise_for_status() or the parsing raises. A streamed
+        # response would otherwise keep its connection checked out.)
+        with http.get(
             API_URL,
             headers=headers,
-            timeout=REQUEST_TIMEOUT
-        )
-
-        # Check if request was successful (status code 200)
-        # If not (404, 500, etc.), this will raise an exception
-        response.raise_for_status()
-
-        # ============================================================
-        # STEP 2: Parse the JSON response
-        # ============================================================
-
-        # Convert JSON text to Python list of dictionaries
-        # all_events is a list like: [{'title': 'Event 1', 'start': '2025-11-01', ...}, ...]
-        all_events = response.json()
-        logger.info(f"Fetched {len(all_events)} total events from API")
-
-        # ============================================================
-        # STEP 3: Filter for upcoming events only
-        # ============================================================
-
-        # Get today's date (for comparison)
-        today = datetime.now().date()
-
-        # This will hold only events that haven't ended yet
-        upcoming_events = []
-
-        # Loop through every event from the API
-        for event in all_events:
-            try:
-                # Extract the start date from the event
-                # API format: "2025-11-01T00:00:00" (ISO 8601 with time)
-                # We split on 'T' to get just "2025-11-01"
-                start_date_str = event['start'].split('T')[0]
-
-                # Convert string to actual date object for comparison
-                start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
-
-                # Extract the end date (same process)
-                end_date_str = event['end'].split('T')[0]
-                end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
+            timeout=REQUEST_TIMEOUT,
+            stream=ijson is not None
+        ) as response:
+
+            # Get today's date as text, e.g. "2025-11-24" (for comparison)
+            # ISO dates (YYYY-MM-DD) sort the same way as text and as dates,
+            # so we can compare the strings directly - no need to parse every
+            # one of the ~300 events into a date object.
+            today_str = datetime.now().date().isoformat()
+
+            # Nothing changed since last time -> use the cached events
+            # (just drop any that have ended since they were cached)
+            if response.status_code == 304 and cache:
+                events = [event for event in cache['events'] if event['end_date'] >= today_str]
+                logger.info("McCormick Place calendar unchanged (304) - using %s cached upcoming events", len(events))
+                return events
+
+            # Check if request was successful (status code 200)
+            # If not (404, 500, etc.), this will raise an exception
+            response.raise_for_status()
+
+            # ============================================================
+            # STEP 2: Parse the JSON response
+            # ============================================================
+
+            # Convert JSON text to Python dictionaries
+            # The API returns a list like: [{'title': 'Event 1', 'start': '2025-11-01', ...}, ...]
+            # all_events is something we can loop over to get each event dict:
+            # - ijson: a generator that parses the next event as we loop
+            #   (decode_content=True makes it unzip gzip responses first)
+            # - loads() (orjson / json): the whole list, parsed in one go
+            if ijson is not None:
+                response.raw.decode_content = True
+                all_events = ijson.items(response.raw, 'item')
+            else:
+                all_events = loads(response.content)
+            total_events = 0  # Counted as we go (a generator has no len())
+
+            # ============================================================
+            # STEP 3: Keep upcoming events + convert to our standard format
+            # ============================================================
+            # Both happen in ONE loop: each event is checked and (if it
+            # hasn't ended) converted right away - no intermediate list.
+            # The date check is just a slice + text comparison, so a NumPy
+            # mask wouldn't save anything worth a big extra dependency - and
+            # with ijson the events arrive one at a time anyway.
+
+            # Keys of events already kept, so an event the API repeats
+            # exactly is only added once. The building is part of the key:
+            # multi-building events are listed once per building (same id,
+            # different venue), and each row is kept - the buildings show up
+            # in the email and drive the crowd estimate.
+            seen = set()
+
+            # Loop through every event from the API
+            for event in all_events:
+                total_events += 1
+                # Extract dates (already in ISO format in the API)
+                # API format: "2025-11-04T00:00:00" (ISO 8601 with time)
+                # Check them up front with plain ifs instead of try/except:
+                # a bad row costs one comparison, not a raised exception.
+                start = event.get('start')
+                end = event.get('end')
+                if not isinstance(start, str) or not isinstance(end, str) or len(start) < 10 or len(end) < 10:
+                    # If a date is missing (or not text), skip this event
+                    # Log a warning but don't crash
+                    logger.warning("Skipping event with invalid date: %s", event.get('title', 'Unknown'))
+                    continue
+
+                # The first 10 characters are just the date: "2025-11-04"
+                end_date = end[:10]
 
                 # Only keep events that haven't ended yet
                 # If end_date is today or in the future, include it
-                if end_date >= today:
-                    upcoming_events.append(event)
-
-            except (ValueError, KeyError) as e:
-                # If date parsing fails or required field is missing, skip this event
-                # Log a warning but don't crash
-                logger.warning(f"Skipping event with invalid date: {event.get('title', 'Unknown')} - {e}")
-                continue
-
-        logger.info(f"Found {len(upcoming_events)} upcoming events")
+                if end_date < today_str:
+                    continue
 
-        # ============================================================
-        # STEP 4: Convert to our standard format
-        # ============================================================
+                start_date = start[:10]  # "2025-11-01"
 
-        # Loop through upcoming events and convert each to our format
-        for event in upcoming_events:
-            try:
-                # Build the event detail URL
-                # Format: https://www.mccormickplace.com/events/?eventId=12345&orgCode=10
-                event_id = event.get('id', '')  # Get ID, or empty string if missing
-                org_code = event.get('orgCode', '10')  # Get org code, default to '10'
-                detail_url = f"{DETAIL_URL_BASE}?eventId={event_id}&orgCode={org_code}"
+                # Skip exact repeats: same event (id, or title + start when
+                # there is no id) in the same building
+                key = (event.get('id') or (event.get('title'), start_date), event.get('venue'))
+                if key in seen:
+                    continue
+                seen.add(key)
 
-                # Extract dates (already in ISO format in the API)
-                start_date = event['start'].split('T')[0]  # "2025-11-01"
-                end_date = event['end'].split('T')[0]      # "2025-11-04"
+                # Build the event detail URL from the module-level template
+                detail_url = _DETAIL_URL_TEMPLATE.format(
+                    event_id=event.get('id', ''),         # Get ID, or empty string if missing
+                    org_code=event.get('orgCode', '10'),  # Get org code, default to '10'
+                )
 
                 # Create our standardized event dictionary
                 # This is the format storage.py and email_notifier.py expect
@@ -169,25 +296,25 @@ def scrape_mccormick_place() -> list:
                     'url': detail_url                                    # Detail page link
                 })
 
-            except (KeyError, ValueError) as e:
-                # If required field is missing or formatting fails, skip this event
-                logger.warning(f"Skipping malformed event: {e}")
-                continue
+        logger.info("Fetched %s total events from API", total_events)
+
+        # Remember this response for next time's conditional GET
+        _save_cache(response.headers.get('ETag'), response.headers.get('Last-Modified'), events)
 
         # Log success
-        logger.info(f"Successfully scraped {len(events)} upcoming events from McCormick Place")
+        logger.info("Successfully scraped %s upcoming events from McCormick Place", len(events))
 
         # Return the list of events
         return events
 
     except requests.RequestException as e:
         # Handle network errors: API down, no internet, timeout, etc.
-        logger.error(f"Failed to fetch McCormick Place events: {e}")
+        logger.error("Failed to fetch McCormick Place events: %s", e)
         return []  # Return empty list instead of crashing the program
 
     except Exception as e:
         # Handle any other unexpected errors
-        logger.error(f"Unexpected error while scraping McCormick Place: {e}")
+        logger.error("Unexpected error while scraping McCormick Place: %s", e)
         return []
 
 
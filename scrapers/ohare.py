@@ -23,26 +23,95 @@ Created: December 6, 2025
 """
 
 import os
+import json
+import time
 import requests
 import logging
 from datetime import datetime, timedelta
-from collections import defaultdict
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+from collections import Counter
+from config import get_settings
+from scrapers._http import get_session
+from utils.json_io import loads  # orjson when installed, else json
+
+# ciso8601 is an OPTIONAL speed-up: a C parser for ISO 8601 timestamps,
+# many times faster than datetime.fromisoformat() and it understands the
+# trailing "Z" (UTC) on its own. Without it we use the standard library.
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    def _parse_datetime(value: str) -> datetime:
+        """Parse an ISO 8601 timestamp like "2025-12-06T14:30:00+00:00" (or "...Z")."""
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
 # Configuration
-AVIATIONSTACK_API_KEY = os.getenv('AVIATIONSTACK_API_KEY')
+AVIATIONSTACK_API_KEY = get_settings().AVIATIONSTACK_API_KEY  # From .env (parsed once, in config.py)
 AVIATIONSTACK_BASE_URL = "http://api.aviationstack.com/v1"
 OHARE_IATA_CODE = "ORD"  # O'Hare airport code
 REQUEST_TIMEOUT = 15  # seconds
 
+# Short-lived result cache (shared by main.py and ohare_check.py)
+# The free Aviationstack tier only allows 100 calls/month. If another job
+# fetched O'Hare data in the last few minutes, reuse that result instead
+# of spending another API call on nearly identical data.
+CACHE_FILE = "data/ohare_cache.json"
+CACHE_TTL_SECONDS = 900  # 15 minutes
+
+# Same result kept in memory too, so a second call in the same process
+# (debug scripts, retries) doesn't even need to read the file
+_memory_cache = {'ts': 0.0, 'data': None}  # ts = time.monotonic() when saved
 
-def scrape_ohare_flights() -> dict:
+
+def _load_cached_result() -> dict:
+    """
+    Return the cached O'Hare result if it is still fresh.
+
+    Checks the in-memory copy first, then the cache file.
+
+    Returns:
+        dict: Result saved less than CACHE_TTL_SECONDS ago, or {} if there
+              is none (missing file, too old, unreadable)
+    """
+    if _memory_cache['data'] is not None and time.monotonic() - _memory_cache['ts'] < CACHE_TTL_SECONDS:
+        return _memory_cache['data']
+
+    try:
+        with open(CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+        age_seconds = time.time() - cache['ts']
+        if 0 <= age_seconds < CACHE_TTL_SECONDS and cache.get('data'):
+            logger.info(f"Using cached O'Hare data from {int(age_seconds)}s ago")
+            return cache['data']
+    except FileNotFoundError:
+        pass  # Nothing cached yet
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable O'Hare cache {CACHE_FILE}: {e}")
+    return {}
+
+
+def _save_cached_result(result: dict) -> None:
+    """
+    Save a fresh O'Hare result (with the current time) for other jobs to reuse.
+
+    Args:
+        result (dict): Result from scrape_ohare_flights()
+    """
+    _memory_cache['ts'] = time.monotonic()
+    _memory_cache['data'] = result
+
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        temp_file = CACHE_FILE + '.tmp'
+        with open(temp_file, 'w') as f:
+            json.dump({'ts': time.time(), 'data': result}, f)
+        os.replace(temp_file, CACHE_FILE)  # Swap in all at once (no half-written file)
+    except OSError as e:
+        logger.warning(f"Could not save O'Hare cache {CACHE_FILE}: {e}")
+
+
+def scrape_ohare_flights(session: requests.Session = None) -> dict:
     """
     Scrape O'Hare flight information for delays and cancellations.
 
@@ -52,6 +121,14 @@ def scrape_ohare_flights() -> dict:
     3. Identifies peak departure times
     4. Returns taxi demand indicators
 
+    If another run fetched the data less than CACHE_TTL_SECONDS ago, that
+    cached result is returned instead (no API call).
+
+    Args:
+        session (requests.Session): Optional shared HTTP session so several
+            scrapers can reuse open connections. If None, uses the shared
+            scraper session (scrapers/_http.py).
+
     Returns:
         dict: Flight summary with keys:
             - total_flights: Number of flights checked
@@ -87,6 +164,11 @@ def scrape_ohare_flights() -> dict:
         logger.info("  3. Add to .env: AVIATIONSTACK_API_KEY=your_key_here")
         return {}
 
+    # Reuse a result fetched in the last few minutes (saves an API call)
+    cached = _load_cached_result()
+    if cached:
+        return cached
+
     logger.info("Starting O'Hare flight data fetch...")
 
     try:
@@ -101,14 +183,17 @@ def scrape_ohare_flights() -> dict:
             'limit': 100  # Check last 100 flights (free tier allows this)
         }
 
-        # Make API request
-        response = requests.get(
+        # Make API request (through the session passed in, else the shared one)
+        # The `with` block hands the connection back to the session's pool
+        # as soon as the body is read - even if raise_for_status() fails
+        http = session or get_session()
+        with http.get(
             f"{AVIATIONSTACK_BASE_URL}/flights",
             params=params,
             timeout=REQUEST_TIMEOUT
-        )
-        response.raise_for_status()
-        data = response.json()
+        ) as response:
+            response.raise_for_status()
+            data = loads(response.content)
 
         # Check for API errors
         if 'error' in data:
@@ -130,7 +215,7 @@ def scrape_ohare_flights() -> dict:
         delayed_flights = 0
         cancelled_flights = 0
         delay_minutes = []
-        departure_hours = defaultdict(int)
+        departure_hours = Counter()  # hour -> number of departures
 
         for flight in flights:
             # Get flight status
@@ -146,11 +231,19 @@ def scrape_ohare_flights() -> dict:
             scheduled_time = departure.get('scheduled')
             actual_time = departure.get('actual') or departure.get('estimated')
 
-            if scheduled_time and actual_time:
-                # Parse times
+            if not scheduled_time:
+                continue  # No schedule -> nothing to measure
+
+            # Parse the scheduled time ONCE - it's used both for the delay
+            # and for the departure hour below
+            try:
+                scheduled_dt = _parse_datetime(scheduled_time)
+            except (ValueError, TypeError):
+                continue  # Unreadable timestamp - skip this flight
+
+            if actual_time:
                 try:
-                    scheduled_dt = datetime.fromisoformat(scheduled_time.replace('Z', '+00:00'))
-                    actual_dt = datetime.fromisoformat(actual_time.replace('Z', '+00:00'))
+                    actual_dt = _parse_datetime(actual_time)
 
                     # Calculate delay
                     delay = (actual_dt - scheduled_dt).total_seconds() / 60  # minutes
@@ -159,50 +252,51 @@ def scrape_ohare_flights() -> dict:
                     if delay > 15:
                         delayed_flights += 1
                         delay_minutes.append(delay)
-                except:
-                    pass
+                except (ValueError, TypeError):
+                    pass  # Unreadable actual time (or mixed time zones) - no delay info
 
             # Track departure hours for peak time analysis
-            if scheduled_time:
-                try:
-                    dt = datetime.fromisoformat(scheduled_time.replace('Z', '+00:00'))
-                    hour = dt.hour
-                    departure_hours[hour] += 1
-                except:
-                    pass
+            departure_hours[scheduled_dt.hour] += 1
 
         # ============================================================
         # STEP 3: Calculate metrics
         # ============================================================
 
-        # Average delay
-        avg_delay = int(sum(delay_minutes) / len(delay_minutes)) if delay_minutes else 0
-
         # Find peak hours (top 3 busiest hours)
-        peak_hours = sorted(departure_hours.items(), key=lambda x: x[1], reverse=True)[:3]
-        peak_hour_ranges = [_format_hour_range(hour) for hour, _ in peak_hours]
-
-        # Determine taxi demand level
-        delay_rate = (delayed_flights / total_flights * 100) if total_flights > 0 else 0
-        cancellation_rate = (cancelled_flights / total_flights * 100) if total_flights > 0 else 0
-
-        if cancellation_rate > 5 or delay_rate > 30:
-            taxi_demand = "HIGH"
-            demand_emoji = "🔥🔥🔥"
-        elif cancellation_rate > 2 or delay_rate > 15:
-            taxi_demand = "MEDIUM"
-            demand_emoji = "🔥"
-        else:
+        # most_common(3) picks the top 3 without sorting every hour
+        peak_hours = departure_hours.most_common(3)
+        peak_hour_ranges = [_HOUR_RANGE_TABLE[hour] for hour, _ in peak_hours]
+
+        if delayed_flights == 0 and cancelled_flights == 0:
+            # Quiet day (the usual case): no rates to work out, demand is LOW
+            avg_delay = 0
+            delay_rate = cancellation_rate = 0.0
             taxi_demand = "LOW"
             demand_emoji = "✈️"
-
-        # Build summary
-        if delayed_flights > 0 or cancelled_flights > 0:
+            summary = "No significant delays or cancellations"
+        else:
+            # Average delay
+            avg_delay = int(sum(delay_minutes) / len(delay_minutes)) if delay_minutes else 0
+
+            # Determine taxi demand level
+            # (total_flights > 0 here - we returned early on an empty list)
+            delay_rate = delayed_flights / total_flights * 100
+            cancellation_rate = cancelled_flights / total_flights * 100
+
+            if cancellation_rate > 5 or delay_rate > 30:
+                taxi_demand = "HIGH"
+                demand_emoji = "🔥🔥🔥"
+            elif cancellation_rate > 2 or delay_rate > 15:
+                taxi_demand = "MEDIUM"
+                demand_emoji = "🔥"
+            else:
+                taxi_demand = "LOW"
+                demand_emoji = "✈️"
+
+            # Build summary
             summary = f"{delayed_flights} delayed, {cancelled_flights} cancelled"
             if avg_delay > 0:
                 summary += f" (avg delay: {avg_delay} min)"
-        else:
-            summary = "No significant delays or cancellations"
 
         # ============================================================
         # STEP 4: Return results
@@ -225,6 +319,9 @@ def scrape_ohare_flights() -> dict:
         logger.info(f"O'Hare analysis complete: {summary}")
         logger.info(f"Taxi demand: {taxi_demand}")
 
+        # Let the next job within CACHE_TTL_SECONDS reuse this result
+        _save_cached_result(result)
+
         return result
 
     except requests.RequestException as e:
@@ -235,9 +332,10 @@ def scrape_ohare_flights() -> dict:
         return {}
 
 
-def _format_hour_range(hour: int) -> str:
+def _build_hour_range(hour: int) -> str:
     """
-    Format hour as readable time range.
+    Work out the readable time range for one hour (used to fill
+    _HOUR_RANGE_TABLE below - call _format_hour_range() instead).
 
     Args:
         hour (int): Hour in 24-hour format (0-23)
@@ -248,11 +346,29 @@ def _format_hour_range(hour: int) -> str:
     start_hour = hour % 12 or 12
     end_hour = (hour + 1) % 12 or 12
     start_period = "am" if hour < 12 else "pm"
-    end_period = "am" if (hour + 1) < 12 or hour == 23 else "pm"
+    end_period = "am" if (hour + 1) % 24 < 12 else "pm"  # 11pm ends at 12am (hour 0)
 
     return f"{start_hour}{start_period}-{end_hour}{end_period}"
 
 
+# There are only 24 possible hours, so every label is worked out once,
+# here at import time. Formatting an hour is then just a list lookup.
+_HOUR_RANGE_TABLE = tuple(_build_hour_range(hour) for hour in range(24))
+
+
+def _format_hour_range(hour: int) -> str:
+    """
+    Format hour as readable time range.
+
+    Args:
+        hour (int): Hour in 24-hour format (0-23)
+
+    Returns:
+        str: Formatted time range (e.g., "6am-7am", "5pm-6pm")
+    """
+    return _HOUR_RANGE_TABLE[hour]
+
+
 def main():
     """
     Test function to run O'Hare scraper independently.
@@ -22,14 +22,11 @@ Author: Ryad (with Claude Code)
 Created: December 10, 2025
 """
 
-import os
 import requests
 import logging
 from datetime import datetime
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+from config import get_settings
+from scrapers._http import get_session, get_json_cached
 
 # Set up logger for this module
 logger = logging.getLogger(__name__)
@@ -42,9 +39,9 @@ API_ENDPOINT = f"{API_BASE_URL}/events.json"
 # United Center venue ID in Ticketmaster system
 UNITED_CENTER_VENUE_ID = "KovZpZAJna6A"
 
-# Load API key from environment variable
+# Load API key from .env / the environment (parsed once, in config.py)
 # Get your free API key at: https://developer.ticketmaster.com/
-TICKETMASTER_API_KEY = os.getenv('TICKETMASTER_API_KEY')
+TICKETMASTER_API_KEY = get_settings().TICKETMASTER_API_KEY
 
 # How long to wait for the API to respond before giving up (15 seconds)
 REQUEST_TIMEOUT = 15
@@ -52,8 +49,65 @@ REQUEST_TIMEOUT = 15
 # Pretend to be a web browser (some APIs require this)
 USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
 
+# Reuse a response fetched in the last few minutes (saves Ticketmaster
+# quota when the scraper is re-run, e.g. while debugging)
+CACHE_TTL_SECONDS = 300  # 5 minutes
+
+
+def _normalize_tm_event(event: dict) -> dict:
+    """
+    Convert one Ticketmaster event to our standard event dictionary.
+
+    Args:
+        event (dict): One event from the API's "_embedded" -> "events" list
+
+    Returns:
+        dict: Standardized event (same keys as scrape_united_center() returns),
+              or None if the event has no date or is malformed
+    """
+    try:
+        get = event.get  # Looked up once, used for every field below
+
+        # Extract event name
+        event_name = get('name', 'Untitled Event')
+
+        # Extract dates from the API response
+        # Ticketmaster format: {"start": {"localDate": "2025-12-15", "localTime": "19:00:00"}}
+        start_info = get('dates', {}).get('start', {})
+
+        # Get start date (YYYY-MM-DD format)
+        start_date = start_info.get('localDate', '')
+
+        # Skip events without valid dates
+        if not start_date:
+            logger.warning(f"Skipping event without date: {event_name}")
+            return None
+
+        # Extract event type/classification
+        # API structure: {"classifications": [{"segment": {"name": "Sports"}}]}
+        classifications = get('classifications', [{}])
+        event_type = "Event"  # Default
+        if classifications:
+            event_type = classifications[0].get('segment', {}).get('name', 'Event')
+
+        # Create our standardized event dictionary
+        return {
+            'event_name': event_name,
+            'start_date': start_date,
+            # End date is same as start date for most events (single day)
+            'end_date': start_date,
+            'location': 'United Center',  # All events at same venue
+            'url': get('url', ''),  # Link to Ticketmaster page
+            'event_type': event_type  # Sports, Music, Arts & Theatre, etc.
+        }
+
+    except (KeyError, ValueError, TypeError, AttributeError) as e:
+        # If required field is missing or formatting fails, skip this event
+        logger.warning(f"Skipping malformed event: {e}")
+        return None
 
-def scrape_united_center() -> list:
+
+def scrape_united_center(session: requests.Session = None) -> list:
     """
     Scrape all upcoming events from United Center via Ticketmaster API.
 
@@ -63,6 +117,11 @@ def scrape_united_center() -> list:
     3. Converts each event to our standard dictionary format
     4. Returns the list of upcoming events
 
+    Args:
+        session (requests.Session): Optional shared HTTP session. If None,
+            uses the shared scraper session (scrapers/_http.py), which keeps
+            connections open between calls.
+
     Returns:
         list: List of event dictionaries, each with these keys:
             - event_name (str): Name of the event
@@ -126,22 +185,26 @@ def scrape_united_center() -> list:
         logger.debug(f"Calling Ticketmaster API for venue {UNITED_CENTER_VENUE_ID}")
 
         # Make the GET request to the API
-        response = requests.get(
-            API_ENDPOINT,
-            params=params,
-            headers=headers,
-            timeout=REQUEST_TIMEOUT
-        )
-
-        # Check if request was successful (status code 200)
-        response.raise_for_status()
+        # (through the session passed in, else the shared one)
+        # get_json_cached() answers from data/cache/ if the same request
+        # was made less than CACHE_TTL_SECONDS ago, and raises HTTPError
+        # for a bad status code (404, 429, 500, ...) just like
+        # response.raise_for_status()
+        http = session or get_session()
 
         # ============================================================
         # STEP 3: Parse the JSON response
         # ============================================================
 
-        # Convert JSON text to Python dictionary
-        data = response.json()
+        # JSON text converted to a Python dictionary
+        data = get_json_cached(
+            API_ENDPOINT,
+            params,
+            CACHE_TTL_SECONDS,
+            session=http,
+            headers=headers,
+            timeout=REQUEST_TIMEOUT
+        )
 
         # Check if API returned an error
         if 'fault' in data or 'errors' in data:
@@ -164,54 +227,9 @@ def scrape_united_center() -> list:
         # STEP 4: Convert to our standard format
         # ============================================================
 
-        # Loop through events and convert each to our format
-        for event in all_events:
-            try:
-                # Extract event name
-                event_name = event.get('name', 'Untitled Event')
-
-                # Extract dates from the API response
-                # Ticketmaster format: {"start": {"localDate": "2025-12-15", "localTime": "19:00:00"}}
-                dates = event.get('dates', {})
-                start_info = dates.get('start', {})
-
-                # Get start date (YYYY-MM-DD format)
-                start_date = start_info.get('localDate', '')
-
-                # End date is same as start date for most events (single day)
-                # Unless it's a multi-day event
-                end_date = start_date  # Default to same day
-
-                # Skip events without valid dates
-                if not start_date:
-                    logger.warning(f"Skipping event without date: {event_name}")
-                    continue
-
-                # Extract event URL (link to Ticketmaster page)
-                url = event.get('url', '')
-
-                # Extract event type/classification
-                # API structure: {"classifications": [{"segment": {"name": "Sports"}}]}
-                classifications = event.get('classifications', [{}])
-                event_type = "Event"  # Default
-                if classifications:
-                    segment = classifications[0].get('segment', {})
-                    event_type = segment.get('name', 'Event')
-
-                # Create our standardized event dictionary
-                events.append({
-                    'event_name': event_name,
-                    'start_date': start_date,
-                    'end_date': end_date,
-                    'location': 'United Center',  # All events at same venue
-                    'url': url,
-                    'event_type': event_type  # Sports, Music, Arts & Theatre, etc.
-                })
-
-            except (KeyError, ValueError, TypeError) as e:
-                # If required field is missing or formatting fails, skip this event
-                logger.warning(f"Skipping malformed event: {e}")
-                continue
+        # Convert every event with _normalize_tm_event(); it returns None
+        # for events it has to skip, which we filter out here
+        events = [result for result in map(_normalize_tm_event, all_events) if result is not None]
 
         # Log success
         logger.info(f"Successfully scraped {len(events)} upcoming events from United Center")
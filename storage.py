@@ -8,16 +8,33 @@ import json
 import os
 import logging
 from datetime import datetime
+from utils.json_io import loads, dumps  # orjson when installed, else json
 
 logger = logging.getLogger(__name__)
 
 DATA_FILE = "data/events.json"
 
+# In-process cache of the last file loaded or saved.
+# 'mtime' is the file's modification time (nanoseconds) when 'data' was
+# read/written; if the file still has that mtime, it hasn't changed and
+# load_events() can skip reading + parsing it again.
+# 'by_date' is the day index of 'data' (see build_date_index()), built in
+# the same load/save - so it is always replaced together with 'data'.
+_cache = {'mtime': None, 'data': None, 'by_date': None}
+
 
 def load_events() -> dict:
     """
     Load events from JSON file.
 
+    If the file hasn't changed since the last load_events()/save_events()
+    in this process, the data from that call is returned again without
+    re-reading the file. Each call gets its own (shallow) copy of the
+    dict, so a caller that swaps in a new venue list, like main.py does,
+    doesn't change what the next load_events() returns - even if its
+    save_events() then fails. (The per-venue lists and event dicts are
+    shared: replace them, don't edit them in place.)
+
     Returns:
         dict: Events organized by venue, e.g.:
               {'mccormick_place': [...], 'united_center': [], 'ohare': []}
@@ -25,18 +42,32 @@ def load_events() -> dict:
     """
     if not os.path.exists(DATA_FILE):
         logger.info(f"{DATA_FILE} not found, returning empty dict (first run)")
+        _clear_cache()
         return {}
 
     try:
-        with open(DATA_FILE, 'r') as f:
-            events = json.load(f)
+        # Unchanged since we last read or wrote it? -> reuse the parsed data
+        mtime = os.stat(DATA_FILE).st_mtime_ns
+        if _cache['mtime'] == mtime:
+            logger.info(f"Loaded events from {DATA_FILE} (cached, unchanged)")
+            return dict(_cache['data'])
+
+        # Read the raw bytes and parse them directly (no decode to text first)
+        with open(DATA_FILE, 'rb') as f:
+            events = loads(f.read())
         logger.info(f"Loaded events from {DATA_FILE}")
-        return events
-    except json.JSONDecodeError as e:
+
+        _cache['mtime'] = mtime
+        _cache['data'] = events
+        _cache['by_date'] = build_date_index(events)
+        return dict(events)
+    except json.JSONDecodeError as e:  # (orjson's decode error is a subclass)
         logger.error(f"Failed to parse {DATA_FILE}: {e}")
+        _clear_cache()
         return {}
     except Exception as e:
         logger.error(f"Unexpected error loading events: {e}")
+        _clear_cache()
         return {}
 
 
@@ -44,20 +75,109 @@ def save_events(events: dict) -> None:
     """
     Save events dictionary to JSON file.
 
+    The JSON is built in memory first, written to a temporary file in one
+    go, then swapped in with os.replace(). If the program crashes (or the
+    disk fills up) mid-write, the old events.json is left untouched instead
+    of half-written - so the next load_events() doesn't fail to parse it.
+
     Args:
         events: Dictionary of events organized by venue
     """
     # Create data directory if it doesn't exist
     os.makedirs(os.path.dirname(DATA_FILE), exist_ok=True)
 
+    temp_file = DATA_FILE + '.tmp'
+
     try:
-        with open(DATA_FILE, 'w') as f:
-            json.dump(events, f, indent=2)  # Pretty-print for human readability
+        # Written compactly (no indentation): this file is the program's own
+        # state, and skipping pretty-printing keeps json on its fast C path.
+        # To read it yourself: python -m json.tool data/events.json
+        payload = dumps(events)  # Compact UTF-8 bytes
+
+        # One write, forced onto the disk, then swapped in all at once
+        with open(temp_file, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, DATA_FILE)
+
+        # What we just wrote IS the file's contents now - remember it
+        # (a copy, so later changes to the caller's dict don't leak in)
+        _cache['mtime'] = os.stat(DATA_FILE).st_mtime_ns
+        _cache['data'] = dict(events)
+        _cache['by_date'] = build_date_index(_cache['data'])
+
         logger.info(f"Saved events to {DATA_FILE}")
     except Exception as e:
         logger.error(f"Failed to save events: {e}")
 
 
+def load_date_index() -> dict:
+    """
+    Return the day index of the events from the last load_events() or
+    save_events() call (see build_date_index()).
+
+    The index is built once, when that call read or wrote the file, so
+    get_upcoming_events() can look up just the days it needs instead of
+    walking every stored event again. Call it right after load_events()
+    (before changing the venue lists) so it matches the dict you got.
+
+    Returns:
+        dict: "YYYY-MM-DD" -> list of (venue_key, event) tuples, or None if
+              no events file has been loaded or saved yet in this process
+    """
+    return _cache['by_date']
+
+
+def _clear_cache() -> None:
+    """Forget the cached file contents (e.g. the file is missing or broken)."""
+    _cache['mtime'] = None
+    _cache['data'] = None
+    _cache['by_date'] = None
+
+
+def event_keys(events: list) -> frozenset:
+    """
+    Build the set of unique identifiers for a list of events.
+
+    Events are identified by (event_name, start_date). Building the set
+    once lets callers check many scraped events against it with fast
+    O(1) set lookups instead of scanning the stored list each time.
+    It's a frozenset (read-only): it's an index of what was stored, so
+    nothing should add to it by accident - and it can be shared safely.
+
+    Args:
+        events: List of event dicts (e.g. stored.get('mccormick_place', []))
+
+    Returns:
+        Frozenset of (event_name, start_date) tuples
+    """
+    return frozenset((event['event_name'], event['start_date']) for event in events)
+
+
+def find_new_events_keyed(scraped_events: list, stored_keys: set) -> list:
+    """
+    Return the scraped events whose identifier is NOT in stored_keys.
+
+    Same as find_new_events(), but takes a pre-built key set (see
+    event_keys()) so the stored events don't have to be re-indexed.
+
+    Args:
+        scraped_events: List of event dicts from scraper
+        stored_keys: (Frozen)set of (event_name, start_date) tuples from event_keys()
+
+    Returns:
+        List of new event dicts
+    """
+    new_events = [
+        event for event in scraped_events
+        if (event['event_name'], event['start_date']) not in stored_keys
+    ]
+
+    logger.info(f"Found {len(new_events)} new events out of {len(scraped_events)} scraped")
+    return new_events
+
+
 def find_new_events(scraped_events: list, stored_events: list) -> list:
     """
     Compare scraped events against stored events.
@@ -74,17 +194,52 @@ def find_new_events(scraped_events: list, stored_events: list) -> list:
     Comparison logic: Events are considered the same if they have
     matching event_name AND start_date (unique identifier).
     """
-    # Create set of (event_name, start_date) tuples from stored events
-    stored_identifiers = {
-        (event['event_name'], event['start_date'])
-        for event in stored_events
-    }
+    return find_new_events_keyed(scraped_events, event_keys(stored_events))
 
-    # Find events that aren't in stored_identifiers
-    new_events = [
-        event for event in scraped_events
-        if (event['event_name'], event['start_date']) not in stored_identifiers
-    ]
 
-    logger.info(f"Found {len(new_events)} new events out of {len(scraped_events)} scraped")
-    return new_events
+def _iso_date(start_date) -> str:
+    """
+    Return start_date as "YYYY-MM-DD" text, or None if it isn't a valid date.
+
+    Almost every stored date is already in that form, so it is returned
+    as-is; anything else (rare, e.g. "2025-1-5") is parsed properly.
+    """
+    if isinstance(start_date, str) and len(start_date) == 10 and start_date[4] == '-' and start_date[7] == '-':
+        return start_date
+    try:
+        return datetime.strptime(start_date, '%Y-%m-%d').date().isoformat()
+    except (ValueError, TypeError):
+        return None
+
+
+def build_date_index(events: dict) -> dict:
+    """
+    Group stored events by the day they start.
+
+    Args:
+        events: Dictionary of events organized by venue (as from load_events())
+
+    Returns:
+        Dict of "YYYY-MM-DD" -> list of (venue_key, event) tuples, in the
+        same venue/event order as the stored data. Events without a valid
+        start_date are left out.
+
+    Example:
+        {'2025-12-12': [('mccormick_place', {...}), ('united_center', {...})]}
+    """
+    by_date = {}
+
+    for venue_key, venue_events in events.items():
+        for event in venue_events:
+            start_date = event.get('start_date', '')
+            if not start_date:
+                continue
+
+            day = _iso_date(start_date)
+            if day is None:
+                logger.warning(f"Skipping event with invalid date: {event.get('event_name', 'Unknown')} - {start_date!r}")
+                continue
+
+            by_date.setdefault(day, []).append((venue_key, event))
+
+    return by_date
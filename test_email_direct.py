@@ -6,9 +6,10 @@ for Gmail to filter as spam/promotional.
 """
 
 import os
+import sys
 from dotenv import load_dotenv
 from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail, Content
+from sendgrid.helpers.mail import Mail, Content, Personalization, To
 from datetime import datetime
 
 load_dotenv()
@@ -17,15 +18,35 @@ SENDGRID_API_KEY = os.getenv('SENDGRID_API_KEY')
 SENDER_EMAIL = os.getenv('SENDER_EMAIL')
 RECIPIENT_EMAIL = os.getenv('RECIPIENT_EMAIL')
 
+# Optional: several recipients, comma-separated (falls back to RECIPIENT_EMAIL)
+RECIPIENTS = [
+    address.strip()
+    for address in (os.getenv('RECIPIENT_EMAILS') or RECIPIENT_EMAIL or '').split(',')
+    if address.strip()
+]
+
+if not RECIPIENTS:
+    print("❌ No recipient configured - set RECIPIENT_EMAIL (or RECIPIENT_EMAILS) in .env")
+    sys.exit(1)
+
+# One client for the whole script (keeps its HTTP connection for reuse)
+sg = SendGridAPIClient(SENDGRID_API_KEY)
+
 timestamp = datetime.now().strftime("%I:%M:%S %p")
 
 # Create PLAIN TEXT email (no HTML - less likely to be filtered)
 message = Mail(
     from_email=SENDER_EMAIL,
-    to_emails=RECIPIENT_EMAIL,
     subject=f'Chicago Events - Test {timestamp}',
 )
 
+# One "personalization" per recipient: SendGrid delivers a separate copy
+# to each, but the whole batch goes out in ONE API call (up to 1000)
+for address in RECIPIENTS:
+    personalization = Personalization()
+    personalization.add_to(To(address))
+    message.add_personalization(personalization)
+
 # Plain text content only (no fancy HTML)
 plain_text = f"""
 Hi Ryad,
@@ -42,35 +63,18 @@ Next step: Set up the daily automated runs.
 Chicago Event Monitor
 """
 
+# Only the text/plain part - a single small MIME part, no HTML twin
 message.add_content(Content("text/plain", plain_text))
 
-# Also add simple HTML version
-simple_html = f"""
-<html>
-<body>
-<p>Hi Ryad,</p>
-<p>This is a test email from your Chicago Event Monitor.</p>
-<p><strong>Timestamp: {timestamp}</strong></p>
-<p>If you see this email, your system is working!</p>
-<p>Next step: Set up the daily automated runs.</p>
-<hr>
-<p><small>Chicago Event Monitor</small></p>
-</body>
-</html>
-"""
-
-message.add_content(Content("text/html", simple_html))
-
 print(f"\n{'='*60}")
 print(f"Sending Plain Test Email at {timestamp}")
 print(f"{'='*60}\n")
 print(f"From: {SENDER_EMAIL}")
-print(f"To: {RECIPIENT_EMAIL}")
+print(f"To: {', '.join(RECIPIENTS)}")
 print(f"Subject: Chicago Events - Test {timestamp}")
 print(f"\nSending...")
 
 try:
-    sg = SendGridAPIClient(SENDGRID_API_KEY)
     response = sg.send(message)
 
     print(f"\n✅ Email sent successfully!")
@@ -9,14 +9,23 @@ Requirements:
 2. App Password generated from Google Account settings
 """
 
+import time
+import random
+import socket
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # Gmail SMTP Configuration
 GMAIL_SMTP_SERVER = "smtp.gmail.com"
 GMAIL_SMTP_PORT = 587
+SMTP_TIMEOUT_SECONDS = 10.0  # Give up on a dead/stuck server instead of hanging
+SMTP_CONNECT_ATTEMPTS = 3  # Tries to connect when the network is flaky
+SMTP_RETRY_BASE_SECONDS = 1.0  # First pause; doubles each retry (1s, 2s)
+SMTP_MAX_SESSIONS = 3  # Parallel logged-in connections for long recipient lists
+SMTP_POOL_THRESHOLD = 4  # Fewer recipients than this -> one connection is enough
 
 # Your Gmail credentials
 GMAIL_ADDRESS = "rdjerrouf@gmail.com"
@@ -28,45 +37,17 @@ TEST_RECIPIENTS = [
     "rdjerrouf@yahoo.com"
 ]
 
-def send_via_gmail_smtp():
-    """Send test email using Gmail's SMTP server."""
-
-    timestamp = datetime.now().strftime("%I:%M:%S %p")
-
-    print(f"\n{'='*60}")
-    print(f"Testing Gmail SMTP (Direct Gmail Send)")
-    print(f"{'='*60}\n")
-
-    # Check if app password is configured
-    if GMAIL_APP_PASSWORD == "YOUR_APP_PASSWORD_HERE":
-        print("❌ Gmail App Password not configured!")
-        print("\nTo use Gmail SMTP, you need to:")
-        print("1. Enable 2-Factor Authentication on your Gmail account")
-        print("2. Generate an App Password:")
-        print("   https://myaccount.google.com/apppasswords")
-        print("3. Update GMAIL_APP_PASSWORD in this script")
-        print("\nAlternatively, we can stick with SendGrid but need:")
-        print("   → Your own domain ($12/year)")
-        print("   → Domain Authentication setup in SendGrid")
-        return False
-
-    for recipient in TEST_RECIPIENTS:
-        try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = f'Chicago Events - Gmail SMTP Test {timestamp}'
-            msg['From'] = GMAIL_ADDRESS
-            msg['To'] = recipient
-
-            # Plain text version
-            text = f"""
+# Email bodies, filled in with str.format()
+# {timestamp} and {sender} are the same for every recipient, so they are
+# filled in once per run; {recipient} is filled in per recipient.
+TEXT_TMPL = """
 Hi Ryad,
 
 This email was sent directly through Gmail's SMTP server (not SendGrid).
 
 Timestamp: {timestamp}
 Method: Gmail SMTP Direct
-From: {GMAIL_ADDRESS}
+From: {sender}
 To: {recipient}
 
 If you receive this, Gmail SMTP works and we can skip SendGrid!
@@ -75,8 +56,7 @@ If you receive this, Gmail SMTP works and we can skip SendGrid!
 Chicago Event Monitor
 """
 
-            # HTML version
-            html = f"""
+HTML_TMPL = """
 <html>
 <body style="font-family: Arial, sans-serif;">
 <h2>Chicago Event Monitor - Gmail SMTP Test</h2>
@@ -84,7 +64,7 @@ Chicago Event Monitor
 <p>This email was sent <strong>directly through Gmail's SMTP server</strong> (not SendGrid).</p>
 <p><strong>Timestamp:</strong> {timestamp}</p>
 <p><strong>Method:</strong> Gmail SMTP Direct</p>
-<p><strong>From:</strong> {GMAIL_ADDRESS}</p>
+<p><strong>From:</strong> {sender}</p>
 <p><strong>To:</strong> {recipient}</p>
 <hr>
 <p>If you receive this, we can use Gmail SMTP instead of SendGrid!</p>
@@ -93,24 +73,145 @@ Chicago Event Monitor
 </html>
 """
 
-            # Attach both versions
-            part1 = MIMEText(text, 'plain')
-            part2 = MIMEText(html, 'html')
-            msg.attach(part1)
-            msg.attach(part2)
+# Left in place by the once-per-run fill-in, replaced per recipient
+RECIPIENT_MARKER = "{recipient}"
 
-            # Connect to Gmail SMTP server
-            print(f"Sending to {recipient}...")
-            server = smtplib.SMTP(GMAIL_SMTP_SERVER, GMAIL_SMTP_PORT)
+
+def _build_message(recipient: str, subject: str, text_base: str, html_base: str) -> MIMEMultipart:
+    """
+    Build the test email (plain text + HTML versions) for one recipient.
+
+    text_base / html_base are the templates with everything except the
+    recipient already filled in (see send_via_gmail_smtp).
+    """
+    # Create message
+    msg = MIMEMultipart('alternative')
+    msg['Subject'] = subject
+    msg['From'] = GMAIL_ADDRESS
+    msg['To'] = recipient
+
+    # Attach both versions (plain text + HTML)
+    msg.attach(MIMEText(text_base.replace(RECIPIENT_MARKER, recipient), 'plain'))
+    msg.attach(MIMEText(html_base.replace(RECIPIENT_MARKER, recipient), 'html'))
+    return msg
+
+
+def _connect() -> smtplib.SMTP:
+    """
+    Connect to Gmail's SMTP server, switch to TLS and log in.
+
+    Timeouts / dropped connections are retried with growing pauses
+    (1s, 2s + jitter); anything else (e.g. wrong password) fails at once.
+    """
+    for attempt in range(SMTP_CONNECT_ATTEMPTS):
+        try:
+            server = smtplib.SMTP(GMAIL_SMTP_SERVER, GMAIL_SMTP_PORT, timeout=SMTP_TIMEOUT_SECONDS)
+
+            # SMTP is lots of small command/reply pairs - send each one right
+            # away instead of letting the OS hold it back (Nagle)
+            server.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            server.ehlo()
             server.starttls()  # Secure connection
+            server.ehlo()  # Again after STARTTLS - the server re-lists what it supports (AUTH)
             server.login(GMAIL_ADDRESS, GMAIL_APP_PASSWORD)
-            server.send_message(msg)
+            return server
+
+        except (socket.timeout, ConnectionError, smtplib.SMTPServerDisconnected) as e:
+            if attempt == SMTP_CONNECT_ATTEMPTS - 1:
+                raise
+            delay = SMTP_RETRY_BASE_SECONDS * (2 ** attempt) + random.random()
+            print(f"⚠️  Connection problem ({e}) - retrying in {delay:.1f}s...")
+            time.sleep(delay)
+
+
+def _send_share(recipients: list, subject: str, text_base: str, html_base: str):
+    """
+    Send the test email to some recipients over ONE logged-in connection.
+
+    Connection errors are raised (the caller reports them); a failure for
+    a single recipient is printed and the rest still get their email.
+    """
+    # Connect + log in ONCE, then send every test email over that
+    # connection (instead of a new connection + TLS + login per recipient)
+    server = _connect()
+
+    try:
+        for recipient in recipients:
+            msg = _build_message(recipient, subject, text_base, html_base)
+            print(f"Sending to {recipient}...")
+
+            # One bad recipient shouldn't stop the others
+            try:
+                try:
+                    server.send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    # Gmail hung up on us - reconnect once and try again
+                    server = _connect()
+                    server.send_message(msg)
+
+                print(f"✅ Sent successfully to {recipient}")
+
+            except Exception as e:
+                print(f"❌ Failed to send to {recipient}: {e}")
+    finally:
+        try:
             server.quit()
+        except (smtplib.SMTPException, OSError):
+            pass  # Connection already closed
+
+
+def send_via_gmail_smtp():
+    """Send test email using Gmail's SMTP server."""
+
+    timestamp = datetime.now().strftime("%I:%M:%S %p")
+
+    print(f"\n{'='*60}")
+    print(f"Testing Gmail SMTP (Direct Gmail Send)")
+    print(f"{'='*60}\n")
 
-            print(f"✅ Sent successfully to {recipient}")
+    # Check if app password is configured
+    if GMAIL_APP_PASSWORD == "YOUR_APP_PASSWORD_HERE":
+        print("❌ Gmail App Password not configured!")
+        print("\nTo use Gmail SMTP, you need to:")
+        print("1. Enable 2-Factor Authentication on your Gmail account")
+        print("2. Generate an App Password:")
+        print("   https://myaccount.google.com/apppasswords")
+        print("3. Update GMAIL_APP_PASSWORD in this script")
+        print("\nAlternatively, we can stick with SendGrid but need:")
+        print("   → Your own domain ($12/year)")
+        print("   → Domain Authentication setup in SendGrid")
+        return False
 
-        except Exception as e:
-            print(f"❌ Failed to send to {recipient}: {e}")
+    # Fill in the parts that are the same for everyone, once
+    subject = f'Chicago Events - Gmail SMTP Test {timestamp}'
+    text_base = TEXT_TMPL.format(timestamp=timestamp, sender=GMAIL_ADDRESS, recipient=RECIPIENT_MARKER)
+    html_base = HTML_TMPL.format(timestamp=timestamp, sender=GMAIL_ADDRESS, recipient=RECIPIENT_MARKER)
+
+    # Gmail handles one email at a time PER connection, and most of the
+    # time per email on a fresh connection is the connect + TLS + login.
+    # For a long recipient list we open a few connections and send over
+    # them side by side, so those setups overlap instead of queueing:
+    #   recipients [a, b, c, d, e] with 3 sessions -> [a, d], [b, e], [c]
+    if len(TEST_RECIPIENTS) < SMTP_POOL_THRESHOLD:
+        sessions = 1
+    else:
+        sessions = min(SMTP_MAX_SESSIONS, len(TEST_RECIPIENTS))
+    shares = [TEST_RECIPIENTS[i::sessions] for i in range(sessions)]
+
+    print(f"Connecting to Gmail SMTP server ({sessions} connection(s))...")
+    connected = True
+    with ThreadPoolExecutor(max_workers=sessions) as executor:
+        futures = [executor.submit(_send_share, share, subject, text_base, html_base) for share in shares]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"❌ Could not connect to Gmail SMTP: {e}")
+                connected = False
+
+    if not connected:
+        return False
 
     print(f"\n{'='*60}")
     print(f"Check your inboxes now!")
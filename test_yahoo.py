@@ -7,10 +7,14 @@ This will help determine if:
 """
 
 import os
+import time
+import random
 from dotenv import load_dotenv
 from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail, Content
+from python_http_client.exceptions import HTTPError  # What sg.send() raises for 4xx/5xx
+from sendgrid.helpers.mail import Mail, Content, Personalization, To, Substitution
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 load_dotenv()
 
@@ -18,24 +22,60 @@ SENDGRID_API_KEY = os.getenv('SENDGRID_API_KEY')
 SENDER_EMAIL = os.getenv('SENDER_EMAIL')  # rdjerrouf@gmail.com
 YAHOO_EMAIL = "rdjerrouf@yahoo.com"  # Your Yahoo email
 
+# Everyone who gets the test email (add more addresses to test more inboxes)
+RECIPIENTS = [YAHOO_EMAIL]
+
+# One SendGrid API call can address up to 1000 recipients
+# ("personalizations"), each still getting their own copy of the email.
+# Bigger lists are split into batches of this size.
+SENDGRID_MAX_PERSONALIZATIONS = 1000
+
+# Batches are sent in parallel threads (each send is a slow HTTPS call that
+# is mostly waiting on the network). Kept small to stay well under
+# SendGrid's rate limits.
+MAX_PARALLEL_SENDS = 16
+
+# Retrying temporary failures (see send_with_retry)
+SEND_MAX_RETRIES = 3  # Retries after the first try
+SEND_RETRY_BASE_SECONDS = 1.0  # First pause; doubles each retry (1s, 2s, 4s)
+SEND_RETRY_CAP_SECONDS = 30.0  # Never wait longer than this between tries
+SEND_RETRY_JITTER = 0.5  # Add up to 50% random extra to each pause
+
+# One client shared by every thread (built once, not once per send)
+sg = SendGridAPIClient(SENDGRID_API_KEY)
+
 timestamp = datetime.now().strftime("%I:%M:%S %p")
 
-# Create simple plain text email
-message = Mail(
-    from_email=SENDER_EMAIL,
-    to_emails=YAHOO_EMAIL,
-    subject=f'TEST: Chicago Event Monitor - {timestamp}',
-)
 
-# Plain text content
-plain_text = f"""
+def build_message(recipients: list) -> Mail:
+    """
+    Build ONE test email (plain text + HTML) addressed to a batch of recipients.
+
+    Each recipient gets their own personalization: SendGrid delivers a
+    separate copy to each (nobody sees the others) and fills in
+    -recipient- with their address.
+    """
+    # Create simple plain text email
+    message = Mail(
+        from_email=SENDER_EMAIL,
+        subject=f'TEST: Chicago Event Monitor - {timestamp}',
+    )
+
+    for recipient in recipients:
+        personalization = Personalization()
+        personalization.add_to(To(recipient))
+        personalization.add_substitution(Substitution('-recipient-', recipient))
+        message.add_personalization(personalization)
+
+    # Plain text content
+    plain_text = f"""
 Hi Ryad,
 
 This is a TEST email from your Chicago Event Monitor sent to your Yahoo address.
 
 Timestamp: {timestamp}
 Sender: {SENDER_EMAIL}
-Recipient: {YAHOO_EMAIL}
+Recipient: -recipient-
 
 If you receive this email at Yahoo, it means Gmail is specifically filtering/blocking the emails.
 
@@ -44,10 +84,10 @@ Chicago Event Monitor
 Testing email delivery
 """
 
-message.add_content(Content("text/plain", plain_text))
+    message.add_content(Content("text/plain", plain_text))
 
-# Simple HTML version
-simple_html = f"""
+    # Simple HTML version
+    simple_html = f"""
 <html>
 <body style="font-family: Arial, sans-serif;">
 <h2>Chicago Event Monitor - Test Email</h2>
@@ -55,7 +95,7 @@ simple_html = f"""
 <p>This is a TEST email sent to your <strong>Yahoo address</strong>.</p>
 <p><strong>Timestamp:</strong> {timestamp}</p>
 <p><strong>From:</strong> {SENDER_EMAIL}</p>
-<p><strong>To:</strong> {YAHOO_EMAIL}</p>
+<p><strong>To:</strong> -recipient-</p>
 <hr>
 <p>If you receive this at Yahoo but not Gmail, it confirms Gmail is filtering the emails.</p>
 <p><small>Chicago Event Monitor - Testing</small></p>
@@ -63,23 +103,77 @@ simple_html = f"""
 </html>
 """
 
-message.add_content(Content("text/html", simple_html))
+    message.add_content(Content("text/html", simple_html))
+    return message
+
+
+def send_with_retry(message: Mail, max_retries: int = SEND_MAX_RETRIES):
+    """
+    Send a message, retrying when SendGrid says "try again later".
+
+    How it works:
+    - 429 (rate limited) or 5xx (SendGrid having problems) -> wait, try again
+      (as long as the Retry-After header asks, else 1s, 2s, 4s, ... + jitter)
+    - Any other error (401/403 bad API key, 400 bad request, ...) can't be
+      fixed by waiting -> raised right away
+    - Still failing after max_retries retries -> the last error is raised
+
+    Args:
+        message (Mail): The email to send
+        max_retries (int): Retries after the first try
+
+    Returns:
+        The SendGrid response
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return sg.send(message)
+        except HTTPError as e:
+            status_code = getattr(e, 'status_code', None)
+            retryable = status_code == 429 or (status_code or 0) >= 500
+            if not retryable or attempt == max_retries:
+                raise
+
+            # How long to wait: what the server asked for, else exponential backoff
+            retry_after = (getattr(e, 'headers', None) or {}).get('Retry-After')
+            try:
+                delay = float(retry_after)
+            except (TypeError, ValueError):
+                delay = min(SEND_RETRY_CAP_SECONDS, SEND_RETRY_BASE_SECONDS * 2 ** attempt)
+                delay *= 1 + random.random() * SEND_RETRY_JITTER
+
+            print(f"⚠️  SendGrid returned {status_code} - retrying in {delay:.1f}s "
+                  f"(attempt {attempt + 2} of {max_retries + 1})")
+            time.sleep(delay)
+
+
+def send_batch(recipients: list):
+    """Build and send the test email to one batch of recipients (runs in a worker thread)."""
+    return send_with_retry(build_message(recipients))
+
 
 print(f"\n{'='*60}")
 print(f"Testing Email Delivery to YAHOO")
 print(f"{'='*60}\n")
 print(f"From: {SENDER_EMAIL}")
-print(f"To: {YAHOO_EMAIL}")
+print(f"To: {', '.join(RECIPIENTS)}")
 print(f"Subject: TEST: Chicago Event Monitor - {timestamp}")
 print(f"\nSending...")
 
 try:
-    sg = SendGridAPIClient(SENDGRID_API_KEY)
-    response = sg.send(message)
-
-    print(f"\n✅ Email sent successfully to Yahoo!")
-    print(f"Status Code: {response.status_code}")
-    print(f"Message ID: {response.headers.get('X-Message-Id', 'N/A')}")
+    # One API call per batch of up to SENDGRID_MAX_PERSONALIZATIONS
+    # recipients, all batches at once; results come back in batch order
+    batches = [
+        RECIPIENTS[start:start + SENDGRID_MAX_PERSONALIZATIONS]
+        for start in range(0, len(RECIPIENTS), SENDGRID_MAX_PERSONALIZATIONS)
+    ]
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_SENDS, len(batches))) as executor:
+        responses = list(executor.map(send_batch, batches))
+
+    for batch, response in zip(batches, responses):
+        print(f"\n✅ Email sent successfully to {', '.join(batch)}!")
+        print(f"Status Code: {response.status_code}")
+        print(f"Message ID: {response.headers.get('X-Message-Id', 'N/A')}")
 
     print(f"\n{'='*60}")
     print(f"NOW CHECK YOUR YAHOO INBOX!")
@@ -0,0 +1,131 @@
+"""
+Tests for the Gmail SMTP circuit breaker (email_notifier_gmail).
+
+The SMTP connection, rate limiter and sleeps are replaced with fakes, and
+time.monotonic() with a clock the test moves by hand, so nothing touches
+the network and no test waits.
+
+Run with:
+    python -m pytest
+"""
+
+import smtplib
+from contextlib import contextmanager
+from email.message import EmailMessage
+
+import pytest
+
+import email_notifier_gmail as notifier
+
+
+class FakeServer:
+    """Stands in for the shared SMTP connection; fails while `failing` is set."""
+
+    def __init__(self):
+        self.failing = False
+        self.attempts = 0
+
+    def sendmail(self, sender, recipients, message_bytes):
+        self.attempts += 1
+        if self.failing:
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """Wire _send_message() to a FakeServer, a fake clock and a fresh breaker."""
+    fake = FakeServer()
+    clock = {'now': 1000.0}
+
+    @contextmanager
+    def borrow_connection():
+        yield fake
+
+    monkeypatch.setattr(notifier, '_borrow_connection', borrow_connection)
+    monkeypatch.setattr(notifier, '_wait_for_send_slot', lambda: None)
+    monkeypatch.setattr(notifier, '_close_connection', lambda: None)
+    monkeypatch.setattr(notifier.time, 'sleep', lambda seconds: None)
+    monkeypatch.setattr(notifier.time, 'monotonic', lambda: clock['now'])
+    monkeypatch.setattr(notifier, '_breaker', {'failures': 0, 'open_until': 0.0})
+
+    fake.clock = clock
+    return fake
+
+
+def _message() -> EmailMessage:
+    message = EmailMessage()
+    message['Subject'] = 'Test'
+    message.set_content('Hello')
+    return message
+
+
+def _send():
+    notifier._send_message(_message(), ['someone@example.com'])
+
+
+def test_breaker_stays_closed_below_threshold(server):
+    server.failing = True
+
+    # One _send_message() call = SMTP_SEND_ATTEMPTS failed attempts
+    with pytest.raises(smtplib.SMTPServerDisconnected):
+        _send()
+
+    assert notifier._breaker['failures'] == notifier.SMTP_SEND_ATTEMPTS < notifier.SMTP_BREAKER_THRESHOLD
+    assert notifier._breaker['open_until'] == 0.0
+
+
+def test_breaker_opens_after_threshold_and_fails_fast(server):
+    server.failing = True
+
+    for _ in range(2):
+        with pytest.raises(smtplib.SMTPException):
+            _send()
+
+    assert notifier._breaker['failures'] == notifier.SMTP_BREAKER_THRESHOLD
+    assert server.attempts == notifier.SMTP_BREAKER_THRESHOLD
+
+    # While open: no attempt reaches the server at all
+    with pytest.raises(notifier.SMTPCircuitOpen):
+        _send()
+    assert server.attempts == notifier.SMTP_BREAKER_THRESHOLD
+
+
+def test_half_open_trial_success_closes_breaker(server):
+    server.failing = True
+    for _ in range(2):
+        with pytest.raises(smtplib.SMTPException):
+            _send()
+
+    # Cooldown over and Gmail is back: the trial send goes through
+    server.clock['now'] += notifier.SMTP_BREAKER_COOLDOWN_SECONDS
+    server.failing = False
+    _send()
+
+    assert notifier._breaker['failures'] == 0
+    _send()  # ...and so do the sends after it
+    assert server.attempts == notifier.SMTP_BREAKER_THRESHOLD + 2
+
+
+def test_half_open_trial_failure_reopens_breaker(server):
+    server.failing = True
+    for _ in range(2):
+        with pytest.raises(smtplib.SMTPException):
+            _send()
+
+    # Cooldown over but Gmail still failing: one trial attempt, then open again
+    server.clock['now'] += notifier.SMTP_BREAKER_COOLDOWN_SECONDS
+    attempts_before = server.attempts
+    with pytest.raises(notifier.SMTPCircuitOpen):
+        _send()
+
+    assert server.attempts == attempts_before + 1
+    assert notifier._breaker['open_until'] == server.clock['now'] + notifier.SMTP_BREAKER_COOLDOWN_SECONDS
+
+
+def test_deliver_reports_open_breaker_as_not_sent(server):
+    notifier._breaker['open_until'] = server.clock['now'] + 10
+
+    job = {'message': _message(), 'recipients': ['someone@example.com'], 'description': 'Test email'}
+
+    assert notifier._deliver(job) is False
+    assert server.attempts == 0
@@ -0,0 +1,32 @@
+"""
+Tests for the SendGrid notifier's date formatting (email_notifier._fmt_date).
+
+Run with:
+    python -m pytest
+"""
+
+import pytest
+
+from email_notifier import _fmt_date
+
+
+def test_fmt_date_formats_iso_dates():
+    assert _fmt_date('2026-02-07') == 'Feb 07, 2026'
+    assert _fmt_date('2024-02-29') == 'Feb 29, 2024'  # Leap day
+
+
+def test_fmt_date_accepts_short_month_and_day():
+    assert _fmt_date('2026-2-7') == 'Feb 07, 2026'
+
+
+@pytest.mark.parametrize('date_str', [
+    '2025-02-30',  # No such day
+    '2025-02-29',  # Not a leap year
+    '2026-13-01',  # No such month
+    '2026/02/07',  # Wrong separator
+    'TBD',
+    '',
+])
+def test_fmt_date_rejects_invalid_dates(date_str):
+    with pytest.raises(ValueError):
+        _fmt_date(date_str)
@@ -0,0 +1,100 @@
+"""
+Rendered-body checks for the Gmail notifier's email templates.
+
+The expected bodies in tests/data/ were rendered by the original
+f-string builders, before the event cards moved into module-level
+templates. These tests render the same events with the current
+templates and check that every byte still matches, so any change to
+what recipients see (colours, spacing, wording) shows up here.
+
+The events cover all four crowd levels, in both the new-event cards
+and the "Events Starting Soon" cards.
+
+Run with:
+    python -m pytest
+"""
+
+import datetime as _dt
+import os
+
+import pytest
+
+import email_notifier_gmail as notifier
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+
+NEW_EVENTS = [
+    {'event_name': 'Chicago Auto Show', 'start_date': '2026-02-07', 'end_date': '2026-02-16',
+     'location': 'SOUTH/NORTH BUILDINGS', 'url': 'https://www.mccormickplace.com/events/auto'},
+    {'event_name': 'Tech Conference', 'start_date': '2026-03-15', 'end_date': '2026-03-18',
+     'location': 'West Building', 'url': 'https://www.mccormickplace.com/events/tech'},
+    {'event_name': 'Book Fair', 'start_date': '2026-04-01', 'end_date': '2026-04-02',
+     'location': 'Lakeside Center', 'url': 'https://www.mccormickplace.com/events/books'},
+    {'event_name': 'Boat Show', 'start_date': '2026-01-08', 'end_date': '2026-01-11',
+     'location': 'South Building', 'url': 'https://www.mccormickplace.com/events/boats'},
+]
+
+UPCOMING_EVENTS = [
+    {'event_name': 'Bulls vs Lakers', 'start_date': '2025-12-12', 'end_date': '2025-12-12',
+     'location': 'United Center', 'venue': 'United Center', 'event_type': 'Sports'},
+    {'event_name': 'Home Expo', 'start_date': '2025-12-13', 'end_date': '2025-12-15',
+     'location': 'ALL HALLS', 'venue': 'McCormick Place'},
+    {'event_name': 'Food Show', 'start_date': '2025-12-13', 'end_date': '2025-12-13',
+     'location': 'NORTH BUILDING', 'venue': 'McCormick Place'},
+    {'event_name': 'Craft Fair', 'start_date': '2025-12-14', 'end_date': '2025-12-14',
+     'location': 'ARIE CROWN THEATER', 'venue': 'McCormick Place'},
+]
+
+OHARE_DATA = {
+    'taxi_demand': 'HIGH', 'demand_emoji': '🔥', 'summary': '42 delays, 6 cancellations',
+    'delayed_flights': 42, 'cancelled_flights': 6, 'peak_hours': ['6am-7am', '5pm-6pm'],
+}
+
+
+class _FrozenDatetime(_dt.datetime):
+    """datetime whose now() is always Dec 12, 2025 8:30 AM (the expected bodies' timestamp)."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2025, 12, 12, 8, 30, 0)
+
+
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch):
+    monkeypatch.setattr(notifier, 'datetime', _FrozenDatetime)
+
+
+def _expected(name: str) -> str:
+    with open(os.path.join(DATA_DIR, name), encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def test_new_events_email_bodies_match():
+    html_body, text_body = notifier._build_bodies(NEW_EVENTS, 'McCormick Place')
+
+    assert html_body == _expected('new_events_email.html')
+    assert text_body == _expected('new_events_email.txt')
+
+
+def test_combined_email_bodies_match():
+    html_body, text_body = notifier._build_combined_bodies(
+        NEW_EVENTS, OHARE_DATA, 'McCormick Place', UPCOMING_EVENTS)
+
+    assert html_body == _expected('combined_email.html')
+    assert text_body == _expected('combined_email.txt')
+
+
+def test_date_range_formats_both_dates():
+    assert notifier._fmt_date_range('2026-02-07', '2026-02-16') == 'Feb 07, 2026 to Feb 16, 2026'
+    assert notifier._fmt_date_range('2026-2-7', '2026-2-16') == 'Feb 07, 2026 to Feb 16, 2026'
+
+
+@pytest.mark.parametrize('start_date, end_date', [
+    ('2026-02-07', 'TBD'),
+    ('TBD', '2026-02-16'),
+    ('2026-02-07', '2026-02-30'),
+    ('2026-02-07', None),
+])
+def test_date_range_falls_back_to_raw_strings_for_the_whole_range(start_date, end_date):
+    # One bad date -> both shown as-is, never half formatted
+    assert notifier._fmt_date_range(start_date, end_date) == f"{start_date} to {end_date}"
@@ -0,0 +1,107 @@
+"""
+Tests for the on-disk JSON response cache (scrapers._http.get_json_cached).
+
+A fake session stands in for the network, and the cache lives in pytest's
+temporary directory.
+
+Run with:
+    python -m pytest
+"""
+
+import os
+import time
+
+import pytest
+import requests
+
+from scrapers import _http
+
+
+class FakeResponse:
+    """Just enough of requests.Response for get_json_cached()."""
+
+    def __init__(self, content: bytes, status_code: int = 200):
+        self.content = content
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class FakeSession:
+    """Counts requests and answers each with the next queued response."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def get(self, url, params=None, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(_http, 'CACHE_DIR', str(tmp_path / 'cache'))
+    return tmp_path / 'cache'
+
+
+def test_fresh_cache_skips_the_network():
+    session = FakeSession(FakeResponse(b'{"n": 1}'))
+
+    first = _http.get_json_cached('https://api.example.com/x', {'a': 1}, 300, session=session)
+    second = _http.get_json_cached('https://api.example.com/x', {'a': 1}, 300, session=session)
+
+    assert first == second == {'n': 1}
+    assert session.calls == 1
+
+
+def test_expired_cache_is_refetched():
+    session = FakeSession(FakeResponse(b'{"n": 1}'), FakeResponse(b'{"n": 2}'))
+    url, params = 'https://api.example.com/x', {'a': 1}
+
+    _http.get_json_cached(url, params, 300, session=session)
+
+    # Age the cache file past the TTL
+    path = _http._cache_path(url, params)
+    old = time.time() - 301
+    os.utime(path, (old, old))
+
+    assert _http.get_json_cached(url, params, 300, session=session) == {'n': 2}
+    assert session.calls == 2
+
+
+def test_different_params_use_different_cache_entries():
+    session = FakeSession(FakeResponse(b'{"n": 1}'), FakeResponse(b'{"n": 2}'))
+
+    assert _http.get_json_cached('https://api.example.com/x', {'page': 1}, 300, session=session) == {'n': 1}
+    assert _http.get_json_cached('https://api.example.com/x', {'page': 2}, 300, session=session) == {'n': 2}
+    assert session.calls == 2
+
+
+def test_http_errors_are_raised_and_not_cached(cache_dir):
+    session = FakeSession(FakeResponse(b'{"error": "busy"}', status_code=503), FakeResponse(b'{"n": 1}'))
+
+    with pytest.raises(requests.HTTPError):
+        _http.get_json_cached('https://api.example.com/x', {}, 300, session=session)
+
+    assert not cache_dir.exists() or not any(cache_dir.iterdir())
+    assert _http.get_json_cached('https://api.example.com/x', {}, 300, session=session) == {'n': 1}
+
+
+def test_unreadable_cache_file_is_ignored():
+    session = FakeSession(FakeResponse(b'{"n": 1}'), FakeResponse(b'{"n": 2}'))
+    url, params = 'https://api.example.com/x', {}
+
+    _http.get_json_cached(url, params, 300, session=session)
+    with open(_http._cache_path(url, params), 'w') as f:
+        f.write('{not json')
+
+    assert _http.get_json_cached(url, params, 300, session=session) == {'n': 2}
@@ -0,0 +1,132 @@
+"""
+Tests for the "events starting soon" filter (upcoming_events.py) and the
+by-day index it is built on (storage.build_date_index).
+
+Run with:
+    python -m pytest
+"""
+
+from datetime import date, timedelta
+
+import storage
+from storage import build_date_index, load_events, load_date_index, save_events
+from upcoming_events import get_upcoming_events, format_event_timing
+
+
+def _day(offset: int) -> str:
+    """ISO date string `offset` days from today, e.g. _day(1) = tomorrow."""
+    return (date.today() + timedelta(days=offset)).isoformat()
+
+
+def test_build_date_index_groups_events_by_start_date():
+    expo = {'event_name': 'Expo', 'start_date': '2025-12-12'}
+    game = {'event_name': 'Game', 'start_date': '2025-12-12'}
+    show = {'event_name': 'Show', 'start_date': '2025-12-13'}
+    events = {'mccormick_place': [expo, show], 'united_center': [game]}
+
+    index = build_date_index(events)
+
+    assert index == {
+        '2025-12-12': [('mccormick_place', expo), ('united_center', game)],
+        '2025-12-13': [('mccormick_place', show)],
+    }
+
+
+def test_build_date_index_normalizes_short_dates_and_skips_bad_ones():
+    short = {'event_name': 'Short', 'start_date': '2025-1-5'}
+    events = {'mccormick_place': [
+        short,
+        {'event_name': 'No date', 'start_date': ''},
+        {'event_name': 'Missing date'},
+        {'event_name': 'TBD', 'start_date': 'TBD'},
+    ]}
+
+    assert build_date_index(events) == {'2025-01-05': [('mccormick_place', short)]}
+
+
+def test_get_upcoming_events_keeps_window_in_date_order():
+    events = {
+        'mccormick_place': [
+            {'event_name': 'Day after', 'start_date': _day(2)},
+            {'event_name': 'Past', 'start_date': _day(-1)},
+            {'event_name': 'Too far', 'start_date': _day(3)},
+        ],
+        'united_center': [
+            {'event_name': 'Tonight', 'start_date': _day(0)},
+        ],
+        'other_place': [
+            {'event_name': 'Tomorrow', 'start_date': _day(1)},
+        ],
+    }
+
+    upcoming = get_upcoming_events(events, days_ahead=2)
+
+    assert [event['event_name'] for event in upcoming] == ['Tonight', 'Tomorrow', 'Day after']
+    assert [event['venue'] for event in upcoming] == ['United Center', 'Other Place', 'McCormick Place']
+
+
+def test_get_upcoming_events_does_not_change_stored_events():
+    stored = {'event_name': 'Tonight', 'start_date': _day(0)}
+
+    upcoming = get_upcoming_events({'united_center': [stored]}, days_ahead=0)
+
+    assert upcoming[0]['venue'] == 'United Center'
+    assert 'venue' not in stored
+
+
+def test_get_upcoming_events_uses_given_index():
+    tonight = {'event_name': 'Tonight', 'start_date': _day(0)}
+    by_date = {_day(0): [('united_center', tonight)]}
+
+    # Only the index is read - the events dict isn't walked again
+    upcoming = get_upcoming_events({}, days_ahead=2, by_date=by_date)
+
+    assert [event['event_name'] for event in upcoming] == ['Tonight']
+    assert upcoming[0]['venue'] == 'United Center'
+
+
+def test_get_upcoming_events_today_only():
+    events = {'united_center': [
+        {'event_name': 'Tonight', 'start_date': _day(0)},
+        {'event_name': 'Tomorrow', 'start_date': _day(1)},
+    ]}
+
+    assert [event['event_name'] for event in get_upcoming_events(events, days_ahead=0)] == ['Tonight']
+
+
+def test_load_and_save_keep_the_date_index(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, 'DATA_FILE', str(tmp_path / 'events.json'))
+    monkeypatch.setattr(storage, '_cache', {'mtime': None, 'data': None, 'by_date': None})
+
+    # First run: no file, no index
+    assert load_events() == {}
+    assert load_date_index() is None
+
+    expo = {'event_name': 'Expo', 'start_date': '2025-12-12'}
+    save_events({'mccormick_place': [expo]})
+    assert load_date_index() == {'2025-12-12': [('mccormick_place', expo)]}
+
+    # Loading the unchanged file keeps the same index
+    stored = load_events()
+    assert load_date_index() == {'2025-12-12': [('mccormick_place', stored['mccormick_place'][0])]}
+
+    # A missing file drops it again
+    (tmp_path / 'events.json').unlink()
+    assert load_events() == {}
+    assert load_date_index() is None
+
+
+def test_format_event_timing():
+    today = date(2025, 12, 12)
+
+    assert format_event_timing({'start_date': '2025-12-12'}, today) == "TODAY (Dec 12)"
+    assert format_event_timing({'start_date': '2025-12-13'}, today) == "Tomorrow (Dec 13)"
+    assert format_event_timing({'start_date': '2025-12-14'}, today) == "Dec 14 (2 days)"
+
+
+def test_format_event_timing_returns_bad_dates_unchanged():
+    today = date(2025, 12, 12)
+
+    assert format_event_timing({'start_date': '2025/12/14'}, today) == '2025/12/14'
+    assert format_event_timing({'start_date': '2025-02-30'}, today) == '2025-02-30'
+    assert format_event_timing({}, today) == 'Date TBD'
@@ -14,23 +14,50 @@ Author: Ryad (with Claude Code)
 Created: December 10, 2025
 """
 
-from datetime import datetime, timedelta
-from typing import List, Dict
+from datetime import date, datetime, timedelta
+from collections import ChainMap
+from functools import lru_cache
+from typing import List, Dict, Optional
+import sys
 import logging
 
+from storage import build_date_index
+
 logger = logging.getLogger(__name__)
 
 
-def get_upcoming_events(all_events: Dict[str, List[Dict]], days_ahead: int = 2) -> List[Dict]:
+class _VenueNames(dict):
+    """
+    Venue key -> display name, e.g. 'united_center' -> 'United Center'.
+
+    Unknown keys get a name made from the key ('other_place' ->
+    'Other Place'), which is saved, so it is only built once.
+    """
+    def __missing__(self, venue_key):
+        name = venue_key.replace('_', ' ').title()
+        self[venue_key] = name
+        return name
+
+
+# Venue name mapping for display (module level, so it is kept between calls)
+_VENUE_NAMES = _VenueNames({
+    'mccormick_place': 'McCormick Place',
+    'united_center': 'United Center'
+})
+
+
+def get_upcoming_events(all_events: Dict[str, List[Dict]], days_ahead: int = 2,
+                        by_date: Optional[Dict] = None) -> List[Dict]:
     """
     Filter events starting within the next X days.
 
     This function:
     1. Gets today's date
     2. Calculates the cutoff date (today + days_ahead)
-    3. Filters events where start_date is between today and cutoff
-    4. Sorts by start date (earliest first)
-    5. Adds venue name to each event for display
+    3. Looks up each day from today to cutoff in the by-day index
+       (only those 1-3 days are visited, not every stored event)
+    4. Adds venue name to each event for display
+    5. Returns them earliest first (days are visited in order - no sort needed)
 
     Args:
         all_events (dict): Dictionary of events by venue, e.g.:
@@ -42,10 +69,18 @@ def get_upcoming_events(all_events: Dict[str, List[Dict]], days_ahead: int = 2)
             - 0 = today only
             - 1 = today and tomorrow
             - 2 = today, tomorrow, and day after
+        by_date (dict): Day index of all_events, e.g. from
+            storage.load_date_index() right after load_events(). It is
+            built when the file is read, so passing it in skips a pass
+            over every stored event. If not given, it is built here from
+            all_events (storage.build_date_index).
 
     Returns:
-        list: List of upcoming event dictionaries sorted by start date.
+        list: List of upcoming events sorted by start date.
               Each event has an added 'venue' field for display.
+              (Each is a read-mostly ChainMap view over the stored event:
+              event['venue'], event.get(...) work as usual; use dict(event)
+              if you need a plain dict, e.g. for json.dump.)
 
     Example:
         all_events = {
@@ -80,84 +115,129 @@ def get_upcoming_events(all_events: Dict[str, List[Dict]], days_ahead: int = 2)
     today = datetime.now().date()
     cutoff_date = today + timedelta(days=days_ahead)
 
-    logger.info(f"Finding events starting between {today} and {cutoff_date}")
+    logger.info("Finding events starting between %s and %s", today, cutoff_date)
 
     # ============================================================
-    # STEP 2: Filter events from all venues
+    # STEP 2: Collect events for each day in the window
     # ============================================================
+    # Look up just the 1-3 days we care about in the by-day index, e.g.
+    #   '2025-12-12' -> [('mccormick_place', {event}), ('united_center', {event})]
+    # Normally the index comes from storage (built once when the file was
+    # loaded); building it here means one pass over every event instead.
+    if by_date is None:
+        by_date = build_date_index(all_events)
     upcoming = []
 
-    # Venue name mapping for display
-    venue_names = {
-        'mccormick_place': 'McCormick Place',
-        'united_center': 'United Center'
-    }
-
-    # Loop through each venue
-    for venue_key, events in all_events.items():
-        venue_display_name = venue_names.get(venue_key, venue_key.replace('_', ' ').title())
-
-        # Loop through events at this venue
-        for event in events:
-            try:
-                # Parse the start date
-                start_date_str = event.get('start_date', '')
-                if not start_date_str:
-                    continue
-
-                start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
-
-                # Check if event starts within our window
-                if today <= start_date <= cutoff_date:
-                    # Add venue name for email display
-                    event_with_venue = event.copy()
-                    event_with_venue['venue'] = venue_display_name
-                    upcoming.append(event_with_venue)
-
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Skipping event with invalid date: {event.get('event_name', 'Unknown')} - {e}")
-                continue
+    for offset in range(days_ahead + 1):
+        day_str = (today + timedelta(days=offset)).isoformat()
+
+        for venue_key, event in by_date.get(day_str, ()):
+            # Add venue name for email display
+            # ChainMap looks up 'venue' in the small first dict and
+            # everything else in the stored event - no copy of the event
+            # is made, and the stored event itself isn't changed
+            upcoming.append(ChainMap({'venue': _VENUE_NAMES[venue_key]}, event))
 
     # ============================================================
     # STEP 3: Sort by start date (earliest first)
     # ============================================================
-    upcoming.sort(key=lambda x: x.get('start_date', '9999-12-31'))
+    # Nothing to do: days are visited earliest first, so the list is
+    # already in start date order (same-day events in stored order)
 
-    logger.info(f"Found {len(upcoming)} events starting in next {days_ahead} days")
+    logger.info("Found %d events starting in next %d days", len(upcoming), days_ahead)
 
     return upcoming
 
 
-def format_event_timing(event: Dict) -> str:
+# Month abbreviations for format_event_timing ("Dec 12"), indexed by month - 1
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+           'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+
+@lru_cache(maxsize=4096)
+def _format_timing(start_date_str: str, today_ordinal: int) -> str:
+    """
+    Build the timing text for one start date (see format_event_timing).
+
+    Cached: multi-day expos and several games on the same night share a
+    start date, so repeats skip the date parsing and formatting entirely.
+    Bad dates raise ValueError/TypeError (errors are never cached).
+    """
+    # Read "2025-12-14" with date.fromisoformat() (C, no format parsing -
+    # and like strptime it rejects "2025/12/14" or "2025-02-30");
+    # anything else (rare, e.g. "2025-1-5") goes through strptime
+    if len(start_date_str) == 10 and start_date_str[4] == '-' and start_date_str[7] == '-':
+        start_date = date.fromisoformat(start_date_str)
+    else:
+        start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
+
+    # Calculate days until event
+    days_until = start_date.toordinal() - today_ordinal
+
+    # Format the date nicely, e.g. "Dec 14"
+    formatted_date = f"{_MONTHS[start_date.month - 1]} {start_date.day:02d}"
+
+    if days_until == 0:
+        return f"TODAY ({formatted_date})"
+    elif days_until == 1:
+        return f"Tomorrow ({formatted_date})"
+    else:
+        return f"{formatted_date} ({days_until} days)"
+
+
+def format_event_timing(event: Dict, today: date = None) -> str:
     """
     Format event timing information for display.
 
     Args:
         event (dict): Event dictionary with start_date and end_date
+        today (date): Today's date. Pass it in when formatting many events
+                      so it's looked up once (default: looked up here)
 
     Returns:
         str: Formatted timing string, e.g.:
              "TODAY (Dec 12)" or "Tomorrow (Dec 13)" or "Dec 14 (2 days)"
     """
     try:
-        today = datetime.now().date()
-        start_date = datetime.strptime(event['start_date'], '%Y-%m-%d').date()
+        if today is None:
+            today = datetime.now().date()
 
-        # Calculate days until event
-        days_until = (start_date - today).days
+        # today as a plain day number keeps the cache key small and hashable
+        return _format_timing(event['start_date'], today.toordinal())
 
-        # Format the date nicely
-        formatted_date = start_date.strftime('%b %d')
+    except (KeyError, ValueError, TypeError):
+        return event.get('start_date', 'Date TBD')
 
-        if days_until == 0:
-            return f"TODAY ({formatted_date})"
-        elif days_until == 1:
-            return f"Tomorrow ({formatted_date})"
-        else:
-            return f"{formatted_date} ({days_until} days)"
 
-    except:
-        return event.get('start_date', 'Date TBD')
+# Peak pickup rules, checked top to bottom - the first match wins.
+# Each rule: (text in venue, which field to search, words to look for, result)
+# A field of None means "any event at this venue".
+_PICKUP_RULES = (
+    # United Center sports events (Bulls/Blackhawks)
+    ('united center', 'name', ('bulls', 'blackhawks'), "9:30-10:30 PM (after game)"),
+    ('united center', 'type', ('concert', 'music'), "10-11:30 PM (after show)"),
+    ('united center', None, (), "Event end + 30 min"),
+    # McCormick Place conventions/trade shows
+    ('mccormick', None, (), "5-7 PM (daily close)"),
+)
+_DEFAULT_PICKUP_TIME = "Event end time"
+
+
+@lru_cache(maxsize=1024)
+def _classify_pickup_time(venue: str, event_name: str, event_type: str) -> str:
+    """
+    Find the first matching rule in _PICKUP_RULES (inputs already lowercase).
+
+    Cached: the same event shows up in several emails/runs, so repeat
+    lookups skip the rule scan entirely.
+    """
+    fields = {'name': event_name, 'type': event_type}
+
+    for venue_text, field, words, result in _PICKUP_RULES:
+        if venue_text in venue and (field is None or any(word in fields[field] for word in words)):
+            return result
+
+    return _DEFAULT_PICKUP_TIME
 
 
 def estimate_peak_pickup_time(event: Dict) -> str:
@@ -170,24 +250,11 @@ def estimate_peak_pickup_time(event: Dict) -> str:
     Returns:
         str: Peak pickup time estimate, e.g., "5-7 PM (after event)" or "9:30-10:30 PM (game end)"
     """
-    event_name = event.get('event_name', '').lower()
-    event_type = event.get('event_type', '').lower()
-    venue = event.get('venue', '').lower()
-
-    # United Center sports events (Bulls/Blackhawks)
-    if 'united center' in venue:
-        if 'bulls' in event_name or 'blackhawks' in event_name:
-            return "9:30-10:30 PM (after game)"
-        elif 'concert' in event_type or 'music' in event_type:
-            return "10-11:30 PM (after show)"
-        else:
-            return "Event end + 30 min"
-
-    # McCormick Place conventions/trade shows
-    if 'mccormick' in venue:
-        return "5-7 PM (daily close)"
-
-    return "Event end time"
+    return _classify_pickup_time(
+        event.get('venue', '').lower(),
+        event.get('event_name', '').lower(),
+        event.get('event_type', '').lower(),
+    )
 
 
 def main():
@@ -198,7 +265,7 @@ def main():
     logging.basicConfig(level=logging.INFO)
 
     # Test with sample data
-    from storage import load_events
+    from storage import load_events, load_date_index
 
     print(f"\n{'='*60}")
     print(f"Upcoming Events Filter - Test Run")
@@ -208,19 +275,22 @@ def main():
     all_events = load_events()
 
     # Get events in next 2 days
-    upcoming = get_upcoming_events(all_events, days_ahead=2)
+    upcoming = get_upcoming_events(all_events, days_ahead=2, by_date=load_date_index())
 
     if upcoming:
         print(f"Found {len(upcoming)} events starting in next 2 days:\n")
 
-        for i, event in enumerate(upcoming, 1):
-            timing = format_event_timing(event)
-            pickup_time = estimate_peak_pickup_time(event)
-
-            print(f"{i}. {event['event_name']}")
-            print(f"   📅 {timing}")
-            print(f"   📍 {event.get('venue', 'Unknown venue')}")
-            print(f"   🚕 Peak pickup: {pickup_time}\n")
+        # Build the whole report first, then write it in one go
+        # (one write instead of four print() calls per event)
+        today = datetime.now().date()
+        report = [
+            f"{i}. {event['event_name']}\n"
+            f"   📅 {format_event_timing(event, today)}\n"
+            f"   📍 {event.get('venue', 'Unknown venue')}\n"
+            f"   🚕 Peak pickup: {estimate_peak_pickup_time(event)}\n\n"
+            for i, event in enumerate(upcoming, 1)
+        ]
+        sys.stdout.write(''.join(report))
     else:
         print("No events starting in next 2 days")
 
@@ -4,4 +4,4 @@ Utilities module for Chicago Event Monitor.
 This module contains helper functions and shared utilities.
 """
 
-__all__ = ['helpers']
+__all__ = ['helpers', 'json_io']
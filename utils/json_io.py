@@ -0,0 +1,57 @@
+"""
+Fast JSON helpers shared by the scrapers, storage and email code.
+
+orjson is an OPTIONAL speed-up (C extension, several times faster than the
+standard json module, and it works straight on bytes). If it's installed,
+loads()/dumps() use it; if not, they fall back to the json module - the
+results are the same either way.
+
+Usage:
+    from utils.json_io import loads, dumps
+    data = loads(response.content)   # bytes or str in
+    payload = dumps(events)          # compact UTF-8 bytes out
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data):
+    """
+    Parse JSON text or bytes.
+
+    Args:
+        data (bytes | str): JSON document, e.g. response.content
+
+    Returns:
+        Parsed JSON (usually a dict or list)
+
+    Raises:
+        json.JSONDecodeError: If data isn't valid JSON
+                              (orjson's error is a subclass of it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj) -> bytes:
+    """
+    Serialize obj to compact JSON as UTF-8 bytes.
+
+    No indentation or spaces after separators, and non-ASCII text is kept
+    as-is instead of \\uXXXX escapes - the same output orjson gives.
+
+    Args:
+        obj: Anything JSON can represent (dicts, lists, strings, numbers, ...)
+
+    Returns:
+        bytes: JSON document, ready to write to a file or send over HTTP
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')